@@ -0,0 +1,118 @@
+# benchmarks for the html parsers in helper.py and scraper.py, run from the
+# repository root with either
+#
+#   python3 bench/bench_parsers.py [runs]
+#   micropython -X heapsize=4M bench/bench_parsers.py [runs]
+#
+# on CPython the peak of the tracemalloc traced memory is reported for each
+# case, on the MicroPython unix port it is the number of bytes allocated
+# while the case runs (gc.mem_alloc delta with the collector disabled)
+#
+# the fixtures in bench/fixtures are anonymised captures of the portal pages
+
+import sys
+import gc
+import io
+import time
+
+BENCH_DIR = sys.argv[0].rsplit("/", 1)[0] if "/" in sys.argv[0] else "."
+FIXTURES_DIR = BENCH_DIR + "/fixtures/"
+sys.path.insert(0, BENCH_DIR + "/..")
+
+import helper
+from scraper import Scraper
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+if hasattr(time, "ticks_us"):
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+else:
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+def load(name):
+    with open(FIXTURES_DIR + name, "rb") as f:
+        return f.read()
+
+
+def measure_alloc(fn):
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    gc.disable()
+    before = gc.mem_alloc()
+    fn()
+    after = gc.mem_alloc()
+    gc.enable()
+    return after - before
+
+
+def measure_time(fn, runs):
+    # warm up once, then return the best and mean time in microseconds
+    fn()
+    best = None
+    total = 0
+    for _ in range(runs):
+        start = ticks_us()
+        fn()
+        elapsed = ticks_diff(ticks_us(), start)
+        total += elapsed
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, total // runs
+
+
+def cases():
+    login_page = load("PageDangNhap.aspx.html")
+    schedule_page = load("PageLichTH.aspx.html")
+    daily_page = load("LHTNLOAD.html")
+    general_notices = load("CTRTBSV.html")
+    class_notices = load("CTRTBGV.html")
+
+    schedule_table = helper.extract_table_html(schedule_page, "TTKB_GridInfo")
+    daily_table = helper.extract_table_html(daily_page, "LHTN_Grid")
+    dates, captions, contents = Scraper.parse_notices(class_notices)
+
+    return (
+        ("get_hidden_field", lambda: helper.get_hidden_field(login_page, "__VIEWSTATE")),
+        ("extract_table_html", lambda: helper.extract_table_html(schedule_page, "TTKB_GridInfo")),
+        ("read_table_html", lambda: helper.read_table_html(io.BytesIO(schedule_page), "TTKB_GridInfo")),
+        ("parse_table_rows", lambda: helper.parse_table_rows(schedule_table)),
+        ("parse_schedule", lambda: Scraper.parse_schedule(schedule_table)),
+        ("parse_schedule_of_date", lambda: Scraper.parse_schedule_of_date(daily_table)),
+        ("parse_notices CTRTBSV", lambda: Scraper.parse_notices(general_notices)),
+        ("parse_notices CTRTBGV", lambda: Scraper.parse_notices(class_notices)),
+        ("parse_class_notices", lambda: Scraper.parse_class_notices(captions, contents, dates)),
+    )
+
+
+def main():
+    runs = 20
+    if len(sys.argv) > 1:
+        runs = int(sys.argv[1])
+
+    impl = sys.implementation.name
+    alloc_label = "peak KiB" if tracemalloc is not None else "alloc KiB"
+    print("{} {}, {} runs per case".format(impl, ".".join(str(v) for v in sys.implementation.version[:3]), runs))
+    print("{:<24}{:>12}{:>12}{:>12}".format("case", "best ms", "mean ms", alloc_label))
+
+    for name, fn in cases():
+        best, mean = measure_time(fn, runs)
+        alloc = measure_alloc(fn)
+        print("{:<24}{:>12.3f}{:>12.3f}{:>12.1f}".format(name, best / 1000, mean / 1000, alloc / 1024))
+
+
+main()
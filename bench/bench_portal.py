@@ -0,0 +1,163 @@
+# end to end benchmark of requests.py and the scraper against the fake portal,
+# run from the repository root with
+#
+#   python3 bench/fake_portal.py --quiet &
+#   python3 bench/bench_portal.py [base_url] [runs] [cache_dir]
+#   micropython -X heapsize=4M bench/bench_portal.py [base_url] [runs] [cache_dir]
+#
+# the coroutine versions of the calls are measured everywhere, the blocking
+# ones need the socket.write/readline of MicroPython so they are only
+# measured on the unix port. start the fake portal with --latency, --rate,
+# --error-rate ... to see how the client copes
+#
+# with a cache_dir the response cache of requests is on (and emptied first),
+# the "feed" cases then skip parsing the pages that have not changed, start
+# the fake portal with --validators to have those answered with a 304
+
+import sys
+import gc
+import time
+import socket
+import asyncio
+
+BENCH_DIR = sys.argv[0].rsplit("/", 1)[0] if "/" in sys.argv[0] else "."
+sys.path.insert(0, BENCH_DIR + "/..")
+
+import scraper
+import requests
+import retry
+
+if hasattr(time, "ticks_us"):
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+else:
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+BASE_URL = "http://127.0.0.1:8080"
+DATE = "08/09/2025"
+
+
+async def measure(fn, runs):
+    # return the best and mean time in microseconds of the runs of fn that
+    # succeeded, and how many failed. fn may return a coroutine, all of them
+    # run on the same loop so the pooled connections stay usable
+    best = None
+    total = 0
+    failed = 0
+    for _ in range(runs):
+        gc.collect()
+        start = ticks_us()
+        try:
+            r = fn()
+            if hasattr(r, "send"):
+                await r
+        except Exception as e:
+            print("failed:", e)
+            failed += 1
+            continue
+        elapsed = ticks_diff(ticks_us(), start)
+        total += elapsed
+        if best is None or elapsed < best:
+            best = elapsed
+    if best is None:
+        return 0, 0, failed
+    return best, total // (runs - failed), failed
+
+
+def cases(s):
+    feed = scraper.NoticeFeed()
+
+    async def batch():
+        await asyncio.gather(
+            s.aget_notices("", scraper.Tab.DAO_TAO),
+            s.aget_notices("", scraper.Tab.LOP_HOC_PHAN),
+            s.aget_schedule(),
+        )
+
+    async def serial():
+        await s.aget_notices("", scraper.Tab.DAO_TAO)
+        await s.aget_notices("", scraper.Tab.LOP_HOC_PHAN)
+        await s.aget_schedule()
+
+    def cold(fn, *args):
+        # without the keep-alive connections of the previous runs
+        def run():
+            requests.close_pool()
+            return fn(*args)
+        return run
+
+    result = [
+        ("alogin", lambda: s.alogin(True)),
+        ("aget_schedule", s.aget_schedule),
+        ("aget_schedule_of_date", lambda: s.aget_schedule_of_date(DATE)),
+        ("aget_notices DAO_TAO", lambda: s.aget_notices("", scraper.Tab.DAO_TAO)),
+        ("aget_notices DAO_TAO cold", cold(s.aget_notices, "", scraper.Tab.DAO_TAO)),
+        ("aget_notices LOP_HOC_PHAN", lambda: s.aget_notices("", scraper.Tab.LOP_HOC_PHAN)),
+        ("aget_notices DAO_TAO feed", lambda: s.aget_notices("", scraper.Tab.DAO_TAO, feed)),
+        ("aget_schedule_of_date known", lambda: s.aget_schedule_of_date(DATE, True)),
+        ("3 fetches serial", serial),
+        ("3 fetches concurrent", batch),
+    ]
+    if hasattr(socket.socket, "readline"):
+        result += [
+            ("login", lambda: s.login(True)),
+            ("get_schedule", s.get_schedule),
+            ("get_schedule_of_date", lambda: s.get_schedule_of_date(DATE)),
+            ("get_notices DAO_TAO", lambda: s.get_notices("", scraper.Tab.DAO_TAO)),
+            ("get_notices DAO_TAO cold", cold(s.get_notices, "", scraper.Tab.DAO_TAO)),
+            ("get_notices LOP_HOC_PHAN", lambda: s.get_notices("", scraper.Tab.LOP_HOC_PHAN)),
+        ]
+    return result
+
+
+async def run_cases(s, runs):
+    await s.alogin()
+    results = []
+    for name, fn in cases(s):
+        results.append((name, await measure(fn, runs)))
+    requests.close_pool()
+    return results
+
+
+def main():
+    base_url = BASE_URL
+    runs = 10
+    if len(sys.argv) > 1:
+        base_url = sys.argv[1]
+    if len(sys.argv) > 2:
+        runs = int(sys.argv[2])
+    if len(sys.argv) > 3:
+        requests.set_response_cache_dir(sys.argv[3])
+        requests.clear_response_cache()
+
+    policy = retry.RetryPolicy()
+    s = scraper.Scraper("102210000", "password", policy=policy, base_url=base_url)
+    results = asyncio.run(run_cases(s, runs))
+
+    print("{} against {}, {} runs per case".format(sys.implementation.name, base_url, runs))
+    print("{:<28}{:>12}{:>12}{:>8}".format("case", "best ms", "mean ms", "failed"))
+    for name, (best, mean, failed) in results:
+        print("{:<28}{:>12.3f}{:>12.3f}{:>8}".format(name, best / 1000, mean / 1000, failed))
+    for k in policy.stats:
+        print(k, policy.stats[k])
+    for k in s.stats:
+        print(k, s.stats[k])
+    # the phases of every request made, in ms, see requests.TIMING_PHASES
+    histograms = requests.timing_histograms()
+    for host in histograms:
+        for phase in requests.TIMING_PHASES:
+            counts = histograms[host].get(phase)
+            if counts is not None:
+                print("{:<8} p50<={}ms p90<={}ms".format(
+                    phase,
+                    requests.timing_percentile(counts, 50),
+                    requests.timing_percentile(counts, 90),
+                ))
+
+
+main()
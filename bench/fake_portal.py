@@ -0,0 +1,359 @@
+# a stand-in for sv.dut.udn.vn that serves the pages in bench/fixtures, so
+# the http client and the scraper can be exercised fully offline. CPython
+# only, run from the repository root with
+#
+#   python3 bench/fake_portal.py [options]
+#
+# and point the scraper at it with Scraper(..., base_url="http://127.0.0.1:8080")
+# (or "portal_url" in config.json for the device)
+#
+# it mimics what the scraper relies on:
+#   - GET /PageDangNhap.aspx hands out a new ASP.NET_SessionId cookie
+#   - POST /PageDangNhap.aspx with the right account redirects to
+#     /PageCaNhan.aspx, a wrong one gets the login page again
+#   - the pages redirect to /PageDangNhap.aspx once the session is gone, the
+#     WebAjax endpoints answer with the login page instead
+#   - with --validators every page has an ETag and a Last-Modified, and a
+#     conditional request for an unchanged page gets a 304
+#
+# and can misbehave on purpose, see --help
+
+import sys
+import time
+import random
+import argparse
+import binascii
+import os
+import threading
+import zlib
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+
+LOGIN_PATH = "/PageDangNhap.aspx"
+HOME_PATH = "/PageCaNhan.aspx"
+SCHEDULE_PATH = "/PageLichTH.aspx"
+AJAX_PATH = "/WebAjax/evLopHP_Load.aspx"
+
+ACCOUNT_FIELD = "_ctl0:MainContent:DN_txtAcc"
+PASSWORD_FIELD = "_ctl0:MainContent:DN_txtPass"
+
+SESSION_COOKIE = "ASP.NET_SessionId"
+
+HOME_PAGE = b"<html><body><h1>Trang c\xc3\xa1 nh\xc3\xa2n</h1></body></html>"
+
+# the fixture served for each E= of the WebAjax endpoint
+AJAX_FIXTURES = {
+    "LHTNLOAD": "LHTNLOAD.html",
+    "CTRTBSV": "CTRTBSV.html",
+    "CTRTBGV": "CTRTBGV.html",
+}
+
+
+def load(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+class Portal:
+    # the state shared by every connection: the options, the sessions and
+    # a few counters printed on exit
+    def __init__(self, options):
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.pages = {
+            LOGIN_PATH: load("PageDangNhap.aspx.html"),
+            SCHEDULE_PATH: load("PageLichTH.aspx.html"),
+        }
+        for e, name in AJAX_FIXTURES.items():
+            self.pages[e] = load(name)
+        # the Last-Modified of every page with --validators
+        self.modified = formatdate(usegmt=True)
+        self.stats = {
+            "requests": 0,
+            "logins": 0,
+            "failed_logins": 0,
+            "expired": 0,
+            "errors_injected": 0,
+            "truncated": 0,
+            "not_modified": 0,
+            "bytes_sent": 0,
+            "bytes_saved": 0,
+        }
+
+    def count(self, k, n=1):
+        with self.lock:
+            self.stats[k] += n
+
+    def chance(self, rate):
+        with self.lock:
+            return rate > 0 and self.random.random() < rate
+
+    def new_session(self):
+        sid = str(binascii.hexlify(os.urandom(12)), "ascii")
+        with self.lock:
+            self.sessions[sid] = None
+        return sid
+
+    def log_in(self, sid):
+        with self.lock:
+            self.sessions[sid] = time.monotonic()
+
+    def logged_in(self, sid):
+        # True if sid is a live logged in session, a session past --session-ttl
+        # is forgotten
+        with self.lock:
+            since = self.sessions.get(sid)
+            if since is None:
+                return False
+            ttl = self.options.session_ttl
+            if ttl and time.monotonic() - since > ttl:
+                del self.sessions[sid]
+                expired = True
+            else:
+                return True
+        if expired:
+            self.count("expired")
+        return False
+
+    def expire_all(self):
+        with self.lock:
+            self.sessions.clear()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # the head and the body go out in separate writes, with Nagle on a reused
+    # connection waits for the delayed ACK of the client every time
+    disable_nagle_algorithm = True
+    server_version = "Microsoft-IIS/10.0"
+    sys_version = ""
+
+    @property
+    def portal(self):
+        return self.server.portal
+
+    def log_message(self, format, *args):
+        if not self.portal.options.quiet:
+            sys.stderr.write("%s %s\n" % (self.address_string(), format % args))
+
+    def session_id(self):
+        # the scraper sends back the whole Set-Cookie value, only the session
+        # id matters
+        cookie = self.headers.get("Cookie", "")
+        for part in cookie.split(";"):
+            k, _, v = part.strip().partition("=")
+            if k == SESSION_COOKIE:
+                return v
+        return None
+
+    def do_GET(self):
+        self.handle_request(b"")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.handle_request(self.rfile.read(length))
+
+    def handle_request(self, body):
+        portal = self.portal
+        options = portal.options
+        portal.count("requests")
+
+        if options.latency:
+            time.sleep(options.latency / 1000)
+
+        if portal.chance(options.error_rate):
+            portal.count("errors_injected")
+            self.respond(503, b"<html><body>Service Unavailable</body></html>")
+            return
+
+        url = urlsplit(self.path)
+        sid = self.session_id()
+
+        if url.path == LOGIN_PATH:
+            if self.command == "POST":
+                self.post_login(sid, body)
+                return
+            sid = portal.new_session()
+            self.respond(200, portal.pages[LOGIN_PATH], [
+                ("Set-Cookie", "%s=%s; path=/; HttpOnly; SameSite=Lax" % (SESSION_COOKIE, sid)),
+            ])
+            return
+
+        logged_in = sid is not None and portal.logged_in(sid)
+
+        if url.path in (HOME_PATH, SCHEDULE_PATH):
+            if not logged_in:
+                self.redirect(LOGIN_PATH)
+            elif url.path == HOME_PATH:
+                self.respond(200, HOME_PAGE)
+            else:
+                self.respond(200, portal.pages[SCHEDULE_PATH])
+            return
+
+        if url.path == AJAX_PATH:
+            e = parse_qs(url.query).get("E", [""])[0]
+            if e not in AJAX_FIXTURES:
+                self.respond(404, b"")
+            elif not logged_in:
+                self.respond(200, portal.pages[LOGIN_PATH])
+            else:
+                self.respond(200, portal.pages[e])
+            return
+
+        if url.path == "/expire":
+            # drop every session, to test the relogin path on demand
+            portal.expire_all()
+            self.respond(200, b"expired\n")
+            return
+
+        self.respond(404, b"")
+
+    def post_login(self, sid, body):
+        portal = self.portal
+        options = portal.options
+        form = parse_qs(str(body, "utf-8"))
+        user = form.get(ACCOUNT_FIELD, [""])[0]
+        password = form.get(PASSWORD_FIELD, [""])[0]
+
+        ok = sid is not None and sid in portal.sessions and "__VIEWSTATE" in form
+        if options.user is not None and user != options.user:
+            ok = False
+        if options.password is not None and password != options.password:
+            ok = False
+
+        if not ok:
+            portal.count("failed_logins")
+            self.respond(200, portal.pages[LOGIN_PATH])
+            return
+
+        portal.count("logins")
+        portal.log_in(sid)
+        self.redirect(HOME_PATH)
+
+    def redirect(self, path):
+        self.respond(302, b"<html><body>Object moved</body></html>", [("Location", path)])
+
+    def not_modified(self, etag):
+        # whether the request already has the page, If-Modified-Since only
+        # counts without If-None-Match
+        if "If-None-Match" in self.headers:
+            return etag == self.headers["If-None-Match"]
+        return self.portal.modified == self.headers.get("If-Modified-Since")
+
+    def respond(self, status, body, headers=()):
+        options = self.portal.options
+
+        if options.validators and status == 200 and body:
+            # weak, the same page is sent compressed or not
+            etag = 'W/"%08x"' % zlib.crc32(body)
+            headers = list(headers) + [("ETag", etag), ("Last-Modified", self.portal.modified)]
+            if self.not_modified(etag):
+                self.portal.count("not_modified")
+                self.send_response(304)
+                for k, v in headers:
+                    self.send_header(k, v)
+                self.end_headers()
+                return
+
+        truncate = status == 200 and len(body) > 0 and self.portal.chance(options.truncate_rate)
+        chunked = options.chunked and self.request_version == "HTTP/1.1"
+
+        encoding = options.compress
+        if encoding and body and encoding in self.headers.get("Accept-Encoding", ""):
+            # gzip is wbits 31, deflate is the zlib format (wbits 15)
+            c = zlib.compressobj(6, zlib.DEFLATED, 31 if encoding == "gzip" else 15)
+            compressed = c.compress(body) + c.flush()
+            self.portal.count("bytes_saved", len(body) - len(compressed))
+            body = compressed
+            headers = list(headers) + [("Content-Encoding", encoding)]
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        for k, v in headers:
+            self.send_header(k, v)
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+        if truncate:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+
+        if truncate:
+            # promise the whole body (or chunks up to the last one) but hang
+            # up half way through
+            self.portal.count("truncated")
+            body = body[:len(body) // 2]
+
+        try:
+            self.write_body(body, chunked, not truncate)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def write_body(self, body, chunked, complete=True):
+        options = self.portal.options
+        size = options.chunk_size
+        for i in range(0, len(body), size):
+            piece = body[i:i + size]
+            if chunked:
+                piece = b"%x\r\n%s\r\n" % (len(piece), piece)
+            self.wfile.write(piece)
+            self.portal.count("bytes_sent", len(piece))
+            if options.rate:
+                # cap the throughput at --rate bytes per second
+                time.sleep(len(piece) / options.rate)
+        if chunked and complete:
+            self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="fake sv.dut.udn.vn serving bench/fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--user", help="only accept this account (default any)")
+    parser.add_argument("--password", help="only accept this password (default any)")
+    parser.add_argument("--latency", type=float, default=0, help="delay before every response, in ms")
+    parser.add_argument("--rate", type=float, default=0, help="throughput cap of every response body, in bytes/s")
+    parser.add_argument("--chunk-size", type=int, default=1460, help="size of the body writes (and chunks)")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests answered with 503")
+    parser.add_argument("--truncate-rate", type=float, default=0, help="fraction of bodies cut off half way")
+    parser.add_argument("--chunked", action="store_true", help="send bodies with chunked encoding to HTTP/1.1 clients")
+    parser.add_argument("--compress", choices=("gzip", "deflate"), help="compress the bodies for clients that accept it")
+    parser.add_argument("--validators", action="store_true", help="send ETag and Last-Modified and answer 304 when they match")
+    parser.add_argument("--session-ttl", type=float, default=0, help="seconds a login stays valid (default forever)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the failure injection")
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    return parser.parse_args(argv)
+
+
+def serve(options):
+    server = ThreadingHTTPServer((options.host, options.port), Handler)
+    server.daemon_threads = True
+    server.portal = Portal(options)
+    return server
+
+
+def main():
+    options = parse_args(sys.argv[1:])
+    server = serve(options)
+    print("fake portal on http://%s:%d" % server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for k, v in server.portal.stats.items():
+            print(k, v)
+
+
+if __name__ == "__main__":
+    main()
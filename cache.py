@@ -0,0 +1,123 @@
+import json
+import hashlib
+import binascii
+import os
+
+# schedule cache file layout:
+#   b"DSC<version> <digest>\n" followed by the json payload
+# the digest is the first 16 hex digits of the sha256 of the payload, a file
+# with another version or a digest that does not match is ignored
+SCHEDULE_CACHE_VERSION = 2
+
+
+def digest(payload):
+    return str(binascii.hexlify(hashlib.sha256(payload).digest()[:8]), "ascii")
+
+
+def write_file(path, data):
+    # write to a temporary file first so a reset in the middle of the write
+    # never leaves a half written cache behind
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    os.rename(tmp, path)
+
+
+def pack_schedule(schedule):
+    # store every record as a plain list of its fields, return the payload
+    # and its digest
+    rows = [list(sub) for sub in schedule]
+    payload = json.dumps(rows).encode()
+    return payload, digest(payload)
+
+
+def save_checked(path, tag, payload, payload_digest=None):
+    # payload_digest saves hashing the payload again when the caller has it
+    if payload_digest is None:
+        payload_digest = digest(payload)
+    header = "{} {}\n".format(tag, payload_digest).encode()
+    write_file(path, header + payload)
+
+
+def load_checked(path, tag):
+    # return the json in a file written by save_checked, or None if it is
+    # missing, has another tag or does not match its digest
+    try:
+        with open(path, "rb") as f:
+            header = f.readline()
+            payload = f.read()
+    except OSError:
+        return None, None
+
+    header = header.split()
+    if len(header) != 2 or header[0] != tag.encode():
+        return None, None
+    payload_digest = str(header[1], "ascii")
+    if digest(payload) != payload_digest:
+        return None, None
+
+    try:
+        return json.loads(payload), payload_digest
+    except ValueError:
+        return None, None
+
+
+def save_schedule(path, payload, payload_digest):
+    save_checked(path, "DSC{}".format(SCHEDULE_CACHE_VERSION), payload, payload_digest)
+
+
+def load_schedule(path, record):
+    # return the cached schedule as a list of record (scraper.Subject) and its
+    # digest, or (None, None) if there is no usable cache
+    rows, payload_digest = load_checked(path, "DSC{}".format(SCHEDULE_CACHE_VERSION))
+    if rows is None:
+        return None, None
+
+    schedule = [record(*row) for row in rows]
+    return schedule, payload_digest
+
+
+# the daily schedules are kept in the same layout, tagged DDC<version>, the
+# payload maps the yyyymmdd date to the rows of that day
+DAILY_SCHEDULE_CACHE_VERSION = 1
+
+
+def save_daily_schedules(path, days):
+    payload = json.dumps({str(k): [list(c) for c in v] for k, v in days.items()}).encode()
+    save_checked(path, "DDC{}".format(DAILY_SCHEDULE_CACHE_VERSION), payload)
+
+
+def load_daily_schedules(path, record):
+    # return a dict of date int to list of record (scraper.DailyClass), empty
+    # if there is no usable cache
+    days, _ = load_checked(path, "DDC{}".format(DAILY_SCHEDULE_CACHE_VERSION))
+    if days is None:
+        return {}
+    return {int(k): [record(*row) for row in v] for k, v in days.items()}
+
+
+# the portal session is kept as plain json, it is tiny and written once per
+# login
+SESSION_FIELDS = ("cookie", "viewstate", "viewstate_generator", "time")
+
+
+def save_session(path, session):
+    write_file(path, json.dumps(session).encode())
+
+
+def load_session(path):
+    # return the saved session dict, or None if there is no usable one
+    try:
+        with open(path, "rb") as f:
+            session = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    for k in SESSION_FIELDS:
+        if k not in session:
+            return None
+    return session
@@ -11,6 +11,9 @@ import _thread
 import neopixel
 
 import scraper
+import requests
+import cache
+import retry
 from ST7735 import TFT
 from sysfont import sysfont
 import iconfont
@@ -40,15 +43,35 @@ PERIOD = [
     ((19, 55), (20, 40))
 ]
 
-WEEKDAY = [
-    "Thứ 2",
-    "Thứ 3",
-    "Thứ 4",
-    "Thứ 5",
-    "Thứ 6",
-    "Thứ 7",
-    "Chủ Nhật"
-]
+# the schedule is kept on flash so it can be shown before the network is up
+SCHEDULE_CACHE_FILE = "schedule.cache"
+DAILY_SCHEDULE_CACHE_FILE = "daily.cache"
+# the portal session is kept too so a reboot does not always need a new login
+SESSION_FILE = "session.json"
+DNS_CACHE_FILE = "dns.json"
+# the notices and daily schedule pages, so an unchanged one is not parsed
+# again
+RESPONSE_CACHE_DIR = "http"
+
+# a RTC reading before this year means the clock was never set
+MIN_VALID_YEAR = 2025
+
+# how many portal requests may be in flight at once when refreshing, can be
+# overridden with "fetch_concurrency" in config.json
+DEFAULT_FETCH_CONCURRENCY = 2
+
+# give up on the AP after this many seconds, and on NTP after this many tries
+WIFI_CONNECT_TIMEOUT = 20
+NTP_ATTEMPTS = 5
+# each NTP query blocks until the answer or this many seconds, the event loop
+# too when it is made from aconnect()
+NTP_TIMEOUT = 1
+
+# how many days, today included, of the daily (lab and practice) schedule are
+# kept, can be overridden with "daily_schedule_days" in config.json
+DEFAULT_DAILY_SCHEDULE_DAYS = 3
+
+WEEKDAY = scraper.WEEKDAY
 
 
 class Tab:
@@ -117,39 +140,61 @@ class App:
         self.touch_threshold = touch_threshold
         print("touch sensor initialized")
 
-        # connect to an AP
         self.wlan = network.WLAN()
-        self.wifi_active()
-        time.sleep(1)
-
-        # sync time
-        while True:
+        # keep the portal address across reboots for when DNS is flaky
+        requests.set_dns_cache_file(DNS_CACHE_FILE)
+        requests.set_response_cache_dir(RESPONSE_CACHE_DIR)
+        self.time_synced = False
+        self.scraper = None
+        # kept here rather than on the scraper, so the circuit and its stats
+        # survive a failed login
+        self.retry_policy = retry.RetryPolicy()
+
+        # warm start from the cached schedule, the network is only brought up
+        # here if there is nothing to show without it
+        self.schedule, self.schedule_digest = cache.load_schedule(SCHEDULE_CACHE_FILE, scraper.Subject)
+        self.schedule_index = None
+        # set whenever the schedule is replaced, cleared by the main loop
+        self.schedule_changed = False
+        if self.schedule is not None:
+            print("schedule loaded from cache", self.schedule_digest)
+            self.build_schedule_index()
+
+        # the daily schedules by yyyymmdd date int, only ever filled by the
+        # network task so drawing never waits for the portal
+        self.daily_schedules = cache.load_daily_schedules(DAILY_SCHEDULE_CACHE_FILE, scraper.DailyClass)
+        self.daily_schedules_changed = False
+
+        # a portal that is down must not keep the clock from booting, the
+        # network task tries again later
+        # with a cached schedule only the clock is needed before drawing,
+        # logging in to the portal is left to the network task
+        if self.schedule is None or time.localtime()[0] < MIN_VALID_YEAR:
+            self.retry_policy.start_cycle()
             try:
-                self.sync_rtc(7)
-                break
+                if self.schedule is None:
+                    self.refresh_schedule()
+                else:
+                    self.wifi_active()
+                    self.ensure_time_synced()
             except Exception as e:
-                print(f"failed to sync time due to error {e}, retrying", log_type="ERROR")
-                time.sleep_ms(100)
-        print("time synced")
+                print("failed to refresh on boot:", e, log_type="ERROR")
+            self.retry_policy.end_cycle()
+        if self.schedule is None:
+            self.schedule = []
+            self.build_schedule_index()
 
         self.calculate_current_week()
         print("current week", self.current_week)
 
-        print("trying to scraping ...")
-        self.scraper = scraper.Scraper(
-            self.privates["user"],
-            self.privates["password"]
-        )
-        self.scraper.login()
-        self.schedule = self.scraper.get_schedule()
-        print("schedule retrieved")
-
         self.schedule_tab_schedule = None
         self.schedule_tab_decorate_text = None
 
         self.general_notices_tab_notices = None
+        self.general_notices_feed = scraper.NoticeFeed()
 
         self.class_notices_tab_notices = []
+        self.class_notices_feed = scraper.NoticeFeed()
 
         # turn off wifi to save power
         self.wifi_deactive()
@@ -203,14 +248,240 @@ class App:
             self.privates["ssid"],
             self.privates["ssid_password"]
         )
+        start = time.ticks_ms()
         while not self.wlan.isconnected():
+            if time.ticks_diff(time.ticks_ms(), start) > WIFI_CONNECT_TIMEOUT * 1000:
+                raise Exception("cannot connect to AP " + self.privates["ssid"])
             time.sleep_ms(100)
         print("connected to AP", self.privates["ssid"])
 
+    async def awifi_active(self):
+        # same as wifi_active, but lets the other tasks run while waiting
+        if self.wlan.isconnected():
+            return
+
+        self.wlan.active(True)
+        self.wlan.connect(
+            self.privates["ssid"],
+            self.privates["ssid_password"]
+        )
+        start = time.ticks_ms()
+        while not self.wlan.isconnected():
+            if time.ticks_diff(time.ticks_ms(), start) > WIFI_CONNECT_TIMEOUT * 1000:
+                raise Exception("cannot connect to AP " + self.privates["ssid"])
+            await asyncio.sleep_ms(100)
+        print("connected to AP", self.privates["ssid"])
+
     def wifi_deactive(self):
+        # the pooled connections are dead once the radio is off
+        requests.close_pool()
         self.wlan.active(False)
 
+    def ensure_time_synced(self):
+        if self.time_synced:
+            return
+
+        time.sleep(1)
+        for attempt in range(NTP_ATTEMPTS):
+            try:
+                self.sync_rtc(7)
+                break
+            except Exception as e:
+                print(f"failed to sync time due to error {e}, retrying", log_type="ERROR")
+                time.sleep_ms(100)
+        else:
+            raise Exception("cannot sync time")
+        self.time_synced = True
+        print("time synced")
+
+    async def aensure_time_synced(self):
+        # same as ensure_time_synced, but only a single NTP query at a time
+        # (at most NTP_TIMEOUT) holds up the other tasks
+        if self.time_synced:
+            return
+
+        await asyncio.sleep(1)
+        for attempt in range(NTP_ATTEMPTS):
+            try:
+                self.sync_rtc(7)
+                break
+            except Exception as e:
+                print(f"failed to sync time due to error {e}, retrying", log_type="ERROR")
+                await asyncio.sleep_ms(100)
+        else:
+            raise Exception("cannot sync time")
+        self.time_synced = True
+        print("time synced")
+
+    def new_scraper(self):
+        print("trying to scraping ...")
+        return scraper.Scraper(
+            self.privates["user"],
+            self.privates["password"],
+            SESSION_FILE,
+            self.retry_policy,
+            self.privates.get("portal_url", scraper.BASE_URL),
+        )
+
+    def connect(self):
+        # connect to an AP, sync time and log in to the portal
+        # the last two are only done once
+        self.wifi_active()
+        self.ensure_time_synced()
+
+        if self.scraper is None:
+            s = self.new_scraper()
+            s.login()
+            self.scraper = s
+
+    async def aconnect(self):
+        await self.awifi_active()
+        await self.aensure_time_synced()
+
+        if self.scraper is None:
+            s = self.new_scraper()
+            await s.alogin()
+            self.scraper = s
+
+    def set_schedule(self, schedule):
+        # replace the cached schedule if it has changed, return True if it did
+        payload, digest = cache.pack_schedule(schedule)
+        print("schedule retrieved", digest)
+        if digest == self.schedule_digest:
+            return False
+
+        cache.save_schedule(SCHEDULE_CACHE_FILE, payload, digest)
+        self.schedule = schedule
+        self.schedule_digest = digest
+        self.build_schedule_index()
+        self.schedule_changed = True
+        print("schedule cache updated")
+        return True
+
+    def refresh_schedule(self):
+        # fetch the schedule and replace the cached one if it has changed
+        # return True if it did
+        self.connect()
+        return self.set_schedule(self.scraper.get_schedule())
+
+    async def arefresh_schedule(self):
+        await self.aconnect()
+        return self.set_schedule(await self.scraper.aget_schedule())
+
+    def upcoming_dates(self):
+        # the dd/mm/yyyy dates of the daily schedules to keep, from today
+        days = self.privates.get("daily_schedule_days", DEFAULT_DAILY_SCHEDULE_DAYS)
+        now = time.time()
+        dates = []
+        for i in range(days):
+            t = time.localtime(now + i * 86400)
+            dates.append(f"{t[2]:02d}/{t[1]:02d}/{t[0]}")
+        return dates
+
+    def set_daily_schedule(self, date, classes):
+        # classes is None if the page has not changed since the last fetch
+        if classes is None:
+            return
+
+        def sort_func(v):
+            return v.start_period
+        classes.sort(key=sort_func)
+
+        key = helper.date_to_int(date)
+        if self.daily_schedules.get(key) != classes:
+            self.daily_schedules[key] = classes
+            self.daily_schedules_changed = True
+
+    def daily_schedule_job(self, date):
+        async def job():
+            known = helper.date_to_int(date) in self.daily_schedules
+            self.set_daily_schedule(date, await self.scraper.aget_schedule_of_date(date, known))
+        return job
+
+    def save_daily_schedules(self):
+        # drop the days that are over and write the cache if anything changed
+        t = time.localtime()
+        today = t[0] * 10000 + t[1] * 100 + t[2]
+        for key in [k for k in self.daily_schedules if k < today]:
+            del self.daily_schedules[key]
+            self.daily_schedules_changed = True
+
+        if not self.daily_schedules_changed:
+            return
+        self.daily_schedules_changed = False
+        cache.save_daily_schedules(DAILY_SCHEDULE_CACHE_FILE, self.daily_schedules)
+        self.schedule_changed = True
+        print("daily schedule cache updated")
+
+    async def run_batch(self, jobs):
+        # run the coroutine functions in jobs, a dict by name, with at most
+        # config["fetch_concurrency"] of them in flight. return a dict telling
+        # by name which of them succeeded. a failed job is logged and does not
+        # stop the others
+        limit = max(1, self.privates.get("fetch_concurrency", DEFAULT_FETCH_CONCURRENCY))
+        done = {}
+        pending = list(jobs)
+
+        async def worker():
+            while pending:
+                name = pending.pop(0)
+                done[name] = False
+                try:
+                    await jobs[name]()
+                    done[name] = True
+                except Exception as e:
+                    print(f"fetch of {name} failed:", e, log_type="ERROR")
+
+        await asyncio.gather(*[worker() for _ in range(min(limit, len(jobs)))])
+        return done
+
+    async def network_refresh_task(self):
+        # refresh the notices every hour and the schedule once a day, on the
+        # event loop of the control thread so the clock is never held up by
+        # the network. the fetches that are due run concurrently in one
+        # wifi window, the radio is turned off as soon as the last one is done
+        prev_hour = -1
+        prev_day = -1
+        while True:
+            datetime = time.localtime()
+            if datetime[3] != prev_hour and not self.retry_policy.allow():
+                # the portal failed too often lately, leave the radio off
+                # until the circuit closes
+                prev_hour = datetime[3]
+            if datetime[3] != prev_hour:
+                self.retry_policy.start_cycle()
+                try:
+                    await self.aconnect()
+                    jobs = {
+                        "general notices": self.aupdate_general_notices_tab,
+                        "class notices": self.aupdate_class_notices_tab,
+                    }
+                    # the jobs that have to succeed for the day to be done
+                    daily = []
+                    if datetime[2] != prev_day:
+                        print("refreshing schedule ...")
+                        jobs["schedule"] = self.arefresh_schedule
+                        daily.append("schedule")
+                        for date in self.upcoming_dates():
+                            name = "schedule of " + date
+                            jobs[name] = self.daily_schedule_job(date)
+                            daily.append(name)
+                    print("updating notices ...")
+                    done = await self.run_batch(jobs)
+                    self.save_daily_schedules()
+                    if daily and all(done[name] for name in daily):
+                        prev_day = datetime[2]
+                except Exception as e:
+                    print("failed to refresh:", e, log_type="ERROR")
+                finally:
+                    self.wifi_deactive()
+                    self.retry_policy.end_cycle()
+                # a failed refresh is tried again next hour
+                prev_hour = datetime[3]
+            await asyncio.sleep(30)
+
     def sync_rtc(self, tz_offset_hours):
+        ntptime.timeout = NTP_TIMEOUT
         t = ntptime.time()
         t += tz_offset_hours * 3600
         print("time", t)
@@ -244,6 +515,38 @@ class App:
             else:
                 print("unknown option", log_type="ERROR")
             self.draw_bluetooth_icon()
+        elif data[0] == "stats":
+            for k in self.retry_policy.stats:
+                print(k, self.retry_policy.stats[k], not_log=True)
+            if self.scraper is None:
+                print("not logged in yet", not_log=True)
+            else:
+                for k in self.scraper.stats:
+                    print(k, self.scraper.stats[k], not_log=True)
+        elif data[0] == "timings":
+            # the request phases of every host the portal requests went to,
+            # how many (recent) requests and the bucket the median and the
+            # 90th percentile fall in, "timings clear" starts over
+            if len(data) > 1 and data[1] == "clear":
+                requests.clear_timing_histograms()
+                return
+            histograms = requests.timing_histograms()
+            if not histograms:
+                print("no requests yet", not_log=True)
+            for host in histograms:
+                print(host, not_log=True)
+                phases = histograms[host]
+                for phase in requests.TIMING_PHASES:
+                    counts = phases.get(phase)
+                    if counts is None:
+                        continue
+                    print("{:<8} n={} p50<={}ms p90<={}ms {}".format(
+                        phase,
+                        sum(counts),
+                        requests.timing_percentile(counts, 50),
+                        requests.timing_percentile(counts, 90),
+                        counts,
+                    ), not_log=True)
         elif data[0] == "watch":
             duration = 5
             if len(data) > 2:
@@ -372,12 +675,13 @@ class App:
                 await self.command_handler(data.split(" "))
 
     def second_thread(self):
-        # this thread is used to poll inputs
-        # and control bluetooth services
+        # this thread is used to poll inputs, control bluetooth services
+        # and refresh the data from the portal
 
         async def main():
             asyncio.create_task(self.input_handler_task())
             asyncio.create_task(self.serial_wait_for_command())
+            asyncio.create_task(self.network_refresh_task())
             ble_tasks = []
 
             while True:
@@ -399,33 +703,45 @@ class App:
 
         asyncio.run(main())
 
-    def get_schedule(self, week=None, weekday=None):
-        available = []
+    def build_schedule_index(self):
+        # group the subjects by weekday number and sort them in period order,
+        # so a lookup is just a bit test on week_mask per subject of that day
+        index = [[] for _ in WEEKDAY]
+        for sub in self.schedule:
+            index[sub.weekday].append(sub)
+
+        def sort_func(v):
+            return v.start_period
+        for day in index:
+            day.sort(key=sort_func)
 
+        self.schedule_index = index
+
+    def get_schedule(self, week=None, weekday=None):
         if week is None:
             week = self.current_week
         if weekday is None:
             weekday = time.localtime()[6]
-
-        for sub in self.schedule:
-            # compare week
-            week_flag = False
-            for w in sub["weeks"]:
-                week_flag = week >= w[0] and week <= w[1]
-                if week_flag:
-                    break
-            if not week_flag:
-                continue
-
-            # compare week day
-            if WEEKDAY[weekday] == sub["weekday"]:
-                available.append(sub)
-
-        # sort in period order
-        def sort_func(v):
-            return v["start_period"]
-        available.sort(key=sort_func)
-        return available
+        if week < 0:
+            return []
+
+        schedule = [sub for sub in self.schedule_index[weekday] if sub.week_mask >> week & 1]
+
+        # merge in the daily schedule of that date if it was fetched, a dict
+        # lookup away
+        daily = self.daily_schedules.get(self.date_int_of(week, weekday))
+        if daily:
+            def sort_func(v):
+                return v.start_period
+            schedule.extend(daily)
+            schedule.sort(key=sort_func)
+        return schedule
+
+    def date_int_of(self, week, weekday):
+        # the yyyymmdd date int of weekday in week, counted from today
+        days = (week - self.current_week) * 7 + weekday - time.localtime()[6]
+        t = time.localtime(time.time() + days * 86400)
+        return t[0] * 10000 + t[1] * 100 + t[2]
 
     def draw_bluetooth_icon(self):
         if self.bluetooth_on:
@@ -498,7 +814,7 @@ class App:
             return
 
         for sub in self.schedule_tab_schedule:
-            class_name = vietnamese.to_ascii(sub["class_name"])
+            class_name = vietnamese.to_ascii(sub.class_name)
             if len(class_name) > 26:
                 class_name = class_name[:23] + "..."
 
@@ -506,22 +822,30 @@ class App:
             v += sysfont["Height"] + 1
             self.tft.text(
                 (2, v),
-                vietnamese.to_ascii(sub["room"]),
+                vietnamese.to_ascii(sub.room),
                 TFT.BLACK,
                 sysfont,
                 1
             )
             self.tft.text(
                 (sysfont["Width"] * 5 + 13, v),
-                f"{PERIOD[sub["start_period"]][0][0]:02d}:{PERIOD[sub["start_period"]][0][1]:02d} - {PERIOD[sub["end_period"]][1][0]:02d}:{PERIOD[sub["end_period"]][1][1]:02d}",
+                f"{PERIOD[sub.start_period][0][0]:02d}:{PERIOD[sub.start_period][0][1]:02d} - {PERIOD[sub.end_period][1][0]:02d}:{PERIOD[sub.end_period][1][1]:02d}",
                 TFT.BLACK,
                 sysfont,
                 1
             )
             v += sysfont["Height"] + 2
 
-    def update_general_notices_tab(self):
-        self.general_notices_tab_notices = self.scraper.get_notices("", scraper.Tab.DAO_TAO)
+    async def aupdate_general_notices_tab(self):
+        self.apply_general_notices(await self.scraper.aget_notices("", scraper.Tab.DAO_TAO, self.general_notices_feed))
+
+    def apply_general_notices(self, new):
+        # the tab is left alone if no new notice came in
+        if new is None:
+            return
+
+        feed = self.general_notices_feed
+        self.general_notices_tab_notices = (feed.dates, feed.captions, feed.contents)
         if self.current_tab == Tab.GENENAL_NOTICES:
             self.prev_tab = -1
 
@@ -530,7 +854,7 @@ class App:
         self.tft.fillrect((2, v), (156, 93), TFT.WHITE)
         self.tft.text((2, v), "Dao tao", TFT.GRAY, sysfont, 1)
         v += sysfont["Height"] + 1
-        if len(self.general_notices_tab_notices) == 0:
+        if not self.general_notices_tab_notices or len(self.general_notices_tab_notices[0]) == 0:
             self.tft.text((2, v), "there is nothing to show", TFT.GRAY, sysfont, 1)
             return
 
@@ -547,24 +871,36 @@ class App:
             if v > 128:
                 return
 
-    def update_class_notices_tab(self):
-        notices = self.scraper.get_notices(self.privates["class_code"], scraper.Tab.LOP_HOC_PHAN)
-        notices = scraper.Scraper.parse_class_notices(notices[1], notices[2], notices[0])
+    async def aupdate_class_notices_tab(self):
+        self.apply_class_notices(await self.scraper.aget_notices(self.privates["class_code"], scraper.Tab.LOP_HOC_PHAN, self.class_notices_feed))
+
+    def apply_class_notices(self, new):
+        notices = self.class_notices_tab_notices
+        changed = False
+
+        # only notices the feed has not seen before are parsed, new is None
+        # if there are none
+        if new is not None:
+            cancelled, make_up = scraper.Scraper.parse_class_notices(new[1], new[2], new[0])
+            notices = notices + cancelled + make_up
+            changed = True
 
         # remove outdated notices
-        self.class_notices_tab_notices.clear()
-        self.class_notices_tab_notices = []
+        def notice_date(x):
+            return x.cancelled_date if isinstance(x, scraper.CancelledClass) else x.make_up_date
+
         today = time.localtime()
-        today = f"{today[0]:04d}:{today[1]:02d}:{today[2]:02d}"
+        today = today[0] * 10000 + today[1] * 100 + today[2]
+        upcoming = [x for x in notices if notice_date(x) >= today]
+        if len(upcoming) != len(notices):
+            changed = True
 
-        for cancelled in notices[0]:
-            if cancelled["cancelled_date"] >= today:
-                self.class_notices_tab_notices.append(cancelled)
-        for make_up in notices[1]:
-            if make_up["make_up_date"] >= today:
-                self.class_notices_tab_notices.append(make_up)
+        # nothing new and nothing expired, the tab does not need a redraw
+        if not changed:
+            return
 
-        self.class_notices_tab_notices.sort(key=lambda x: x["cancelled_date"] if "cancelled_date" in x.keys() else x["make_up_date"], reverse=True)
+        upcoming.sort(key=notice_date, reverse=True)
+        self.class_notices_tab_notices = upcoming
 
         if self.current_tab == Tab.CLASS_NOTICES:
             self.prev_tab = -1
@@ -579,11 +915,11 @@ class App:
             return
 
         for note in self.class_notices_tab_notices:
-            if "cancelled_date" in note.keys():
+            if isinstance(note, scraper.CancelledClass):
                 self.tft.text((2, v), "Nghi hoc", TFT.GREEN, sysfont, 1)
                 self.tft.text(
                     (47, v),
-                    " " + helper.reverse_date(note["cancelled_date"])[:-5],
+                    " " + helper.format_date_int(note.cancelled_date),
                     TFT.BLACK,
                     sysfont,
                     1,
@@ -591,7 +927,7 @@ class App:
                 v += sysfont["Height"] + 1
                 self.tft.text(
                     (2, v),
-                    vietnamese.to_ascii(note["class_name"]),
+                    vietnamese.to_ascii(note.class_name),
                     TFT.BLACK,
                     sysfont,
                     1,
@@ -608,7 +944,7 @@ class App:
                 )
                 self.tft.text(
                     (41, v),
-                    " " + helper.reverse_date(note["make_up_date"])[:-5] + ", tiet " + note["start_period"] + '-' + note["end_period"],
+                    " " + helper.format_date_int(note.make_up_date) + ", tiet " + str(note.start_period) + '-' + str(note.end_period),
                     TFT.BLACK,
                     sysfont,
                     1,
@@ -616,7 +952,7 @@ class App:
                 v += sysfont["Height"] + 1
                 self.tft.text(
                     (2, v),
-                    "Mon " + vietnamese.to_ascii(note["class_name"]),
+                    "Mon " + vietnamese.to_ascii(note.class_name),
                     TFT.BLACK,
                     sysfont,
                     1,
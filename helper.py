@@ -5,6 +5,17 @@ def reverse_date(date):
     return "/".join(date.split("/")[::-1])
 
 
+def date_to_int(date):
+    # "dd/mm/yyyy" to yyyymmdd, so dates compare and sort as small ints
+    d, m, y = date.split("/")
+    return int(y) * 10000 + int(m) * 100 + int(d)
+
+
+def format_date_int(date):
+    # yyyymmdd to "dd/mm"
+    return "{:02d}/{:02d}".format(date % 100, date // 100 % 100)
+
+
 def get_time():
     return time.time() + 946684800
 
@@ -17,174 +28,406 @@ def decode_data(data):
     return data.decode('utf-8')
 
 
-def quote_plus(s):
-    safe_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~"
-    result = []
-    for ch in s:
-        if ch in safe_chars:
-            result.append(ch)
-        elif ch == ' ':
-            result.append('+')
+def _build_quote_table():
+    safe_chars = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~"
+    table = []
+    for i in range(256):
+        if i in safe_chars:
+            table.append(bytes((i,)))
+        elif i == 0x20:
+            table.append(b"+")
         else:
-            result.append('%{:02X}'.format(ord(ch)))
-    return ''.join(result)
+            table.append("%{:02X}".format(i).encode())
+    return tuple(table)
+
+
+# escaped form of every byte, and its length
+QUOTE_TABLE = _build_quote_table()
+QUOTE_LEN = bytes(len(q) for q in QUOTE_TABLE)
+
+
+def _to_bytes(s):
+    if isinstance(s, str):
+        return s.encode("utf-8")
+    return s
+
+
+def quote_plus(s):
+    return str(b"".join([QUOTE_TABLE[b] for b in _to_bytes(s)]), "ascii")
+
+
+def quoted_len(s):
+    # length of quote_plus(s) without building it, nor a list as long as s
+    n = 0
+    for b in _to_bytes(s):
+        n += QUOTE_LEN[b]
+    return n
+
+
+def _iter_quoted(s, step):
+    data = memoryview(_to_bytes(s))
+    for i in range(0, len(data), step):
+        yield b"".join([QUOTE_TABLE[b] for b in data[i:i + step]])
+
+
+def urlencoded_len(fields):
+    # Content-Length of the body iter_urlencoded(fields) will produce
+    length = 0
+    for key, value in fields:
+        if length:
+            length += 1  # &
+        length += quoted_len(key) + 1 + quoted_len(value)
+    return length
+
+
+def _iter_form_pieces(fields, step):
+    sep = b""
+    for key, value in fields:
+        yield sep
+        yield from _iter_quoted(key, step)
+        yield b"="
+        yield from _iter_quoted(value, step)
+        sep = b"&"
+
+
+def iter_urlencoded(fields, chunk_size=512):
+    # url encode the (key, value) pairs of fields as a form body, yielded in
+    # chunks of chunk_size bytes so the whole body is never held in memory
+    buf = b""
+    for piece in _iter_form_pieces(fields, chunk_size):
+        buf += piece
+        while len(buf) >= chunk_size:
+            yield buf[:chunk_size]
+            buf = buf[chunk_size:]
+    if buf:
+        yield buf
+
+
+def _as_buffer(html):
+    # the parsers work on str, bytes or bytearray directly, a memoryview has
+    # no find() so it is turned into bytes once
+    if isinstance(html, memoryview):
+        return bytes(html)
+    return html
+
+
+def _to_str(s):
+    if isinstance(s, str):
+        return s
+    return str(s, "utf-8")
+
+
+def _text_parts(html, start, end):
+    # collect the text between tags of html[start:end] as slices, a stray
+    # ">" outside of a tag is dropped like the old char-by-char loop did
+    if isinstance(html, str):
+        lt_token, gt_token = "<", ">"
+    else:
+        lt_token, gt_token = b"<", b">"
+
+    parts = []
+    pos = start
+    while pos < end:
+        lt = html.find(lt_token, pos, end)
+        gt = html.find(gt_token, pos, end)
+        if lt == -1 and gt == -1:
+            parts.append(html[pos:end])
+            break
+        if lt == -1 or (gt != -1 and gt < lt):
+            parts.append(html[pos:gt])
+            pos = gt + 1
+            continue
+        parts.append(html[pos:lt])
+        gt = html.find(gt_token, lt + 1, end)
+        if gt == -1:
+            break
+        pos = gt + 1
+
+    return parts
+
+
+def _clean_text(html, start, end):
+    parts = _text_parts(html, start, end)
+    if isinstance(html, str):
+        text = "".join(parts)
+    else:
+        # only the text that is left gets decoded
+        text = str(b"".join(parts), "utf-8")
+    return " ".join(text.split())
 
 
 def strip_tags(s):
-    result = ""
-    inside = False
-    for c in s:
-        if c == "<":
-            inside = True
-        elif c == ">":
-            inside = False
-        elif not inside:
-            result += c
-    return " ".join(result.split())
+    s = _as_buffer(s)
+    return _clean_text(s, 0, len(s))
+
+
+# entities that show up all the time are looked up here first, nbsp is kept
+# as a plain space since the display font has no glyph for U+00A0
+COMMON_ENTITIES = {
+    "amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'", "nbsp": " ",
+}
+
+# the full entity index, only imported the first time it is needed
+_entities = None
+
+
+def lookup_entity(name):
+    # binary search the sorted records of htmlentities.ENTITIES for name
+    global _entities
+    if name in COMMON_ENTITIES:
+        return COMMON_ENTITIES[name]
+    if not name or len(name) > 32:
+        return None
+    if _entities is None:
+        import htmlentities
+        _entities = htmlentities.ENTITIES
+
+    key = name.encode()
+    lo = 0
+    hi = len(_entities)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        # lo and hi always sit on record boundaries, so does start
+        start = _entities.rfind(b"\n", 0, mid) + 1
+        end = _entities.find(b"\n", mid)
+        sep = _entities.find(b" ", start, end)
+        rec_name = _entities[start:sep]
+        if rec_name == key:
+            return "".join([chr(int(cp, 16)) for cp in _entities[sep + 1:end].split()])
+        if rec_name < key:
+            lo = end + 1
+        else:
+            hi = start
+    return None
+
+
+def _entity_value(entity):
+    if entity[:1] == "#":
+        # numeric references, the portal sends vietnamese text this way
+        try:
+            if entity[1:2] in ("x", "X"):
+                return chr(int(entity[2:], 16))
+            return chr(int(entity[1:]))
+        except (ValueError, OverflowError):
+            return None
+    return lookup_entity(entity)
 
 
 def html_unescape(s):
-    entities = {
-        "lt": "<", "gt": ">", "amp": "&", "quot": '"', "apos": "'",
-        "nbsp": " ", "iexcl": "¡", "cent": "¢", "pound": "£", "curren": "¤",
-        "yen": "¥", "brvbar": "¦", "sect": "§", "uml": "¨", "copy": "©",
-        "ordf": "ª", "laquo": "«", "not": "¬", "shy": "­", "reg": "®",
-        "macr": "¯", "deg": "°", "plusmn": "±", "sup2": "²", "sup3": "³",
-        "acute": "´", "micro": "µ", "para": "¶", "middot": "·", "cedil": "¸",
-        "sup1": "¹", "ordm": "º", "raquo": "»", "frac14": "¼", "frac12": "½",
-        "frac34": "¾", "iquest": "¿", "Agrave": "À", "Aacute": "Á", "Acirc": "Â",
-        "Atilde": "Ã", "Auml": "Ä", "Aring": "Å", "AElig": "Æ", "Ccedil": "Ç",
-        "Egrave": "È", "Eacute": "É", "Ecirc": "Ê", "Euml": "Ë", "Igrave": "Ì",
-        "Iacute": "Í", "Icirc": "Î", "Iuml": "Ï", "ETH": "Ð", "Ntilde": "Ñ",
-        "Ograve": "Ò", "Oacute": "Ó", "Ocirc": "Ô", "Otilde": "Õ", "Ouml": "Ö",
-        "times": "×", "Oslash": "Ø", "Ugrave": "Ù", "Uacute": "Ú", "Ucirc": "Û",
-        "Uuml": "Ü", "Yacute": "Ý", "THORN": "Þ", "szlig": "ß", "agrave": "à",
-        "aacute": "á", "acirc": "â", "atilde": "ã", "auml": "ä", "aring": "å",
-        "aelig": "æ", "ccedil": "ç", "egrave": "è", "eacute": "é", "ecirc": "ê",
-        "euml": "ë", "igrave": "ì", "iacute": "í", "icirc": "î", "iuml": "ï",
-        "eth": "ð", "ntilde": "ñ", "ograve": "ò", "oacute": "ó", "ocirc": "ô",
-        "otilde": "õ", "ouml": "ö", "divide": "÷", "oslash": "ø", "ugrave": "ù",
-        "uacute": "ú", "ucirc": "û", "uuml": "ü", "yacute": "ý", "thorn": "þ",
-        "yuml": "ÿ"
-    }
-
-    result = ""
-    i = 0
-    while i < len(s):
-        if s[i] == "&":
-            j = s.find(";", i)
-            if j == -1:
-                result += s[i]
-                i += 1
-                continue
-            entity = s[i + 1:j]
-
-            if entity.startswith("#x") or entity.startswith("#X"):
-                try:
-                    result += chr(int(entity[2:], 16))
-                except:
-                    result += "&" + entity + ";"
-            elif entity.startswith("#"):
-                try:
-                    result += chr(int(entity[1:]))
-                except:
-                    result += "&" + entity + ";"
-            elif entity in entities:
-                result += entities[entity]
-            else:
-                result += "&" + entity + ";"
-            i = j + 1
+    i = s.find("&")
+    if i == -1:
+        return s
+
+    # the output is built from slices of s with the entities in between
+    parts = []
+    pos = 0
+    while i != -1:
+        j = s.find(";", i)
+        if j == -1:
+            break
+        value = _entity_value(s[i + 1:j])
+        if value is not None:
+            parts.append(s[pos:i])
+            parts.append(value)
         else:
-            result += s[i]
-            i += 1
+            # unknown entities are kept as they are
+            parts.append(s[pos:j + 1])
+        pos = j + 1
+        i = s.find("&", pos)
 
-    return result
+    parts.append(s[pos:])
+    return "".join(parts)
 
 
 def get_hidden_field(html, field_name):
+    html = _as_buffer(html)
     name_str = 'name="' + field_name + '"'
+    value_str = 'value="'
+    quote = '"'
+    if not isinstance(html, str):
+        name_str = name_str.encode()
+        value_str = b'value="'
+        quote = b'"'
+
     i = html.find(name_str)
     if i == -1:
         return None
-    val_start = html.find('value="', i)
+    val_start = html.find(value_str, i)
     if val_start == -1:
         return None
-    val_start += len('value="')
-    val_end = html.find('"', val_start)
-    return html[val_start:val_end]
+    val_start += len(value_str)
+    val_end = html.find(quote, val_start)
+    if val_end == -1:
+        return None
+    return _to_str(html[val_start:val_end])
 
 
 def extract_table_html(html, table_id):
+    html = _as_buffer(html)
     search = 'id="{}"'.format(table_id)
-    start = html.find('<table')
+    search_single = "id='{}'".format(table_id)
+    table_token, gt_token, end_token = '<table', '>', '</table>'
+    if not isinstance(html, str):
+        search = search.encode()
+        search_single = search_single.encode()
+        table_token, gt_token, end_token = b'<table', b'>', b'</table>'
+
+    start = html.find(table_token)
     while start != -1:
         # find the next table tag that has the correct id
-        tag_end = html.find('>', start)
+        tag_end = html.find(gt_token, start)
         if tag_end == -1:
             return None
-        table_tag = html[start:tag_end+1]
-        if search in table_tag or "id='{}'".format(table_id) in table_tag:
+        # look for the id inside the tag without slicing it out
+        if html.find(search, start, tag_end) != -1 or html.find(search_single, start, tag_end) != -1:
             # found correct table
-            end = html.find('</table>', tag_end)
+            end = html.find(end_token, tag_end)
             if end == -1:
                 return None
             return html[start:end+8]  # include </table>
         # continue searching for next <table>
-        start = html.find('<table', tag_end)
+        start = html.find(table_token, tag_end)
     return None
 
 
-def parse_table_rows(table_html):
-    rows = []
+class TableScanner:
+    # incremental version of extract_table_html, fed the page chunk by chunk
+    # everything before the wanted <table> is thrown away as it arrives,
+    # only a small carry-over is kept so a tag split between two chunks is
+    # still found
+    MAX_TAG_LEN = 512
+
+    def __init__(self, table_id):
+        self.search = 'id="{}"'.format(table_id).encode()
+        self.search_single = "id='{}'".format(table_id).encode()
+        self.carry = b""
+        self.parts = None
+        self.table = None
+
+    def feed(self, chunk):
+        # return True once the whole table has been collected
+        if self.table is not None:
+            return True
+        if self.parts is None:
+            chunk = self._find_table(chunk)
+            if chunk is None:
+                return False
+            # </table> is only looked for after the opening tag
+            tag_end = chunk.find(b">") + 1
+            self.parts = [chunk[:tag_end]]
+            chunk = chunk[tag_end:]
+            # the carry is the tail of the table collected so far, searched
+            # together with the next chunk for a split </table>
+            self.carry = b""
+
+        buf = self.carry + chunk
+        end = buf.find(b"</table>")
+        if end == -1:
+            keep = len(buf) - 7
+            if keep > 0:
+                self.parts.append(buf[:keep])
+                self.carry = buf[keep:]
+            else:
+                self.carry = buf
+            return False
+
+        self.parts.append(buf[:end + 8])
+        self.table = b"".join(self.parts)
+        self.parts = None
+        self.carry = b""
+        return True
+
+    def _find_table(self, chunk):
+        # return the data from the start of the wanted table, or None if it
+        # has not been seen yet
+        buf = self.carry + chunk
+        while True:
+            start = buf.find(b"<table")
+            if start == -1:
+                # "<table" may be split, keep its possible beginning
+                self.carry = buf[-5:]
+                return None
+
+            tag_end = buf.find(b">", start)
+            if tag_end == -1:
+                if len(buf) - start > self.MAX_TAG_LEN:
+                    # not a sane tag, skip it
+                    buf = buf[start + 6:]
+                    continue
+                self.carry = buf[start:]
+                return None
+
+            if buf.find(self.search, start, tag_end) != -1 or buf.find(self.search_single, start, tag_end) != -1:
+                return buf[start:]
+            buf = buf[tag_end + 1:]
+
+
+def read_table_html(f, table_id, chunk_size=1024):
+    # read f until the table with id table_id has been read and return it as
+    # bytes, the rest of the stream is left unread
+    scanner = TableScanner(table_id)
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        if scanner.feed(chunk):
+            break
+    return scanner.table
+
+
+def _cell_text(html, start, end):
+    return html_unescape(_clean_text(html, start, end))
+
+
+def iter_table_rows(table_html, columns=None):
+    # yield the cells of each row of table_html, one row at a time
+    # if columns is given, only the cells at those indexes are cleaned up,
+    # the others are left as None so row[i] still points to the i-th column
+    # table_html can also be bytes, then only the cell values are decoded
+    table_html = _as_buffer(table_html)
+    if isinstance(table_html, str):
+        tr_token, gt_token, tr_end_token, td_token, td_end_token = "<tr", ">", "</tr>", "<t", "</t"
+    else:
+        tr_token, gt_token, tr_end_token, td_token, td_end_token = b"<tr", b">", b"</tr>", b"<t", b"</t"
+
     pos = 0
 
     while True:
         # find next <tr>
-        tr_start = table_html.find("<tr", pos)
+        tr_start = table_html.find(tr_token, pos)
         if tr_start == -1:
-            break
-        tr_start = table_html.find(">", tr_start)
+            return
+        tr_start = table_html.find(gt_token, tr_start)
         if tr_start == -1:
-            break
-        tr_end = table_html.find("</tr>", tr_start)
+            return
+        tr_end = table_html.find(tr_end_token, tr_start)
         if tr_end == -1:
-            break
-
-        tr_inner = table_html[tr_start + 1:tr_end]
+            return
         pos = tr_end + 5
 
-        # extract <td> or <th> cells manually
+        # walk the <td> or <th> cells inside [tr_start, tr_end)
         cells = []
-        cell_pos = 0
+        cell_pos = tr_start + 1
         while True:
-            td_start = tr_inner.find("<t", cell_pos)
+            td_start = table_html.find(td_token, cell_pos, tr_end)
             if td_start == -1:
                 break
-            td_close = tr_inner.find(">", td_start)
+            td_close = table_html.find(gt_token, td_start, tr_end)
             if td_close == -1:
                 break
-            td_end = tr_inner.find("</t", td_close)
+            td_end = table_html.find(td_end_token, td_close, tr_end)
             if td_end == -1:
                 break
 
-            cell_html = tr_inner[td_close + 1:td_end].strip()
-            # remove any inner tags (simple and safe)
-            clean = ""
-            in_tag = False
-            for ch in cell_html:
-                if ch == "<":
-                    in_tag = True
-                elif ch == ">":
-                    in_tag = False
-                elif not in_tag:
-                    clean += ch
-            clean = " ".join(clean.split())
-            clean = html_unescape(clean)
-
-            cells.append(clean)
+            if columns is None or len(cells) in columns:
+                cells.append(_cell_text(table_html, td_close + 1, td_end))
+            else:
+                cells.append(None)
             cell_pos = td_end + 4
 
         if cells:
-            rows.append(cells)
+            yield cells
+
 
-    return rows
+def parse_table_rows(table_html, columns=None):
+    return list(iter_table_rows(table_html, columns))
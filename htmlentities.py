@@ -0,0 +1,2134 @@
+# HTML5 named character references, generated from the WHATWG entity list
+# (https://html.spec.whatwg.org/entities.json)
+#
+# each record is "<name> <code point>[ <code point>]\n" with the code points
+# in hex, records are sorted by name so helper.html_unescape can binary search
+# the blob instead of keeping a dict of ~2000 entries around
+
+ENTITIES = (
+    b"AElig c6\n"
+    b"AMP 26\n"
+    b"Aacute c1\n"
+    b"Abreve 102\n"
+    b"Acirc c2\n"
+    b"Acy 410\n"
+    b"Afr 1d504\n"
+    b"Agrave c0\n"
+    b"Alpha 391\n"
+    b"Amacr 100\n"
+    b"And 2a53\n"
+    b"Aogon 104\n"
+    b"Aopf 1d538\n"
+    b"ApplyFunction 2061\n"
+    b"Aring c5\n"
+    b"Ascr 1d49c\n"
+    b"Assign 2254\n"
+    b"Atilde c3\n"
+    b"Auml c4\n"
+    b"Backslash 2216\n"
+    b"Barv 2ae7\n"
+    b"Barwed 2306\n"
+    b"Bcy 411\n"
+    b"Because 2235\n"
+    b"Bernoullis 212c\n"
+    b"Beta 392\n"
+    b"Bfr 1d505\n"
+    b"Bopf 1d539\n"
+    b"Breve 2d8\n"
+    b"Bscr 212c\n"
+    b"Bumpeq 224e\n"
+    b"CHcy 427\n"
+    b"COPY a9\n"
+    b"Cacute 106\n"
+    b"Cap 22d2\n"
+    b"CapitalDifferentialD 2145\n"
+    b"Cayleys 212d\n"
+    b"Ccaron 10c\n"
+    b"Ccedil c7\n"
+    b"Ccirc 108\n"
+    b"Cconint 2230\n"
+    b"Cdot 10a\n"
+    b"Cedilla b8\n"
+    b"CenterDot b7\n"
+    b"Cfr 212d\n"
+    b"Chi 3a7\n"
+    b"CircleDot 2299\n"
+    b"CircleMinus 2296\n"
+    b"CirclePlus 2295\n"
+    b"CircleTimes 2297\n"
+    b"ClockwiseContourIntegral 2232\n"
+    b"CloseCurlyDoubleQuote 201d\n"
+    b"CloseCurlyQuote 2019\n"
+    b"Colon 2237\n"
+    b"Colone 2a74\n"
+    b"Congruent 2261\n"
+    b"Conint 222f\n"
+    b"ContourIntegral 222e\n"
+    b"Copf 2102\n"
+    b"Coproduct 2210\n"
+    b"CounterClockwiseContourIntegral 2233\n"
+    b"Cross 2a2f\n"
+    b"Cscr 1d49e\n"
+    b"Cup 22d3\n"
+    b"CupCap 224d\n"
+    b"DD 2145\n"
+    b"DDotrahd 2911\n"
+    b"DJcy 402\n"
+    b"DScy 405\n"
+    b"DZcy 40f\n"
+    b"Dagger 2021\n"
+    b"Darr 21a1\n"
+    b"Dashv 2ae4\n"
+    b"Dcaron 10e\n"
+    b"Dcy 414\n"
+    b"Del 2207\n"
+    b"Delta 394\n"
+    b"Dfr 1d507\n"
+    b"DiacriticalAcute b4\n"
+    b"DiacriticalDot 2d9\n"
+    b"DiacriticalDoubleAcute 2dd\n"
+    b"DiacriticalGrave 60\n"
+    b"DiacriticalTilde 2dc\n"
+    b"Diamond 22c4\n"
+    b"DifferentialD 2146\n"
+    b"Dopf 1d53b\n"
+    b"Dot a8\n"
+    b"DotDot 20dc\n"
+    b"DotEqual 2250\n"
+    b"DoubleContourIntegral 222f\n"
+    b"DoubleDot a8\n"
+    b"DoubleDownArrow 21d3\n"
+    b"DoubleLeftArrow 21d0\n"
+    b"DoubleLeftRightArrow 21d4\n"
+    b"DoubleLeftTee 2ae4\n"
+    b"DoubleLongLeftArrow 27f8\n"
+    b"DoubleLongLeftRightArrow 27fa\n"
+    b"DoubleLongRightArrow 27f9\n"
+    b"DoubleRightArrow 21d2\n"
+    b"DoubleRightTee 22a8\n"
+    b"DoubleUpArrow 21d1\n"
+    b"DoubleUpDownArrow 21d5\n"
+    b"DoubleVerticalBar 2225\n"
+    b"DownArrow 2193\n"
+    b"DownArrowBar 2913\n"
+    b"DownArrowUpArrow 21f5\n"
+    b"DownBreve 311\n"
+    b"DownLeftRightVector 2950\n"
+    b"DownLeftTeeVector 295e\n"
+    b"DownLeftVector 21bd\n"
+    b"DownLeftVectorBar 2956\n"
+    b"DownRightTeeVector 295f\n"
+    b"DownRightVector 21c1\n"
+    b"DownRightVectorBar 2957\n"
+    b"DownTee 22a4\n"
+    b"DownTeeArrow 21a7\n"
+    b"Downarrow 21d3\n"
+    b"Dscr 1d49f\n"
+    b"Dstrok 110\n"
+    b"ENG 14a\n"
+    b"ETH d0\n"
+    b"Eacute c9\n"
+    b"Ecaron 11a\n"
+    b"Ecirc ca\n"
+    b"Ecy 42d\n"
+    b"Edot 116\n"
+    b"Efr 1d508\n"
+    b"Egrave c8\n"
+    b"Element 2208\n"
+    b"Emacr 112\n"
+    b"EmptySmallSquare 25fb\n"
+    b"EmptyVerySmallSquare 25ab\n"
+    b"Eogon 118\n"
+    b"Eopf 1d53c\n"
+    b"Epsilon 395\n"
+    b"Equal 2a75\n"
+    b"EqualTilde 2242\n"
+    b"Equilibrium 21cc\n"
+    b"Escr 2130\n"
+    b"Esim 2a73\n"
+    b"Eta 397\n"
+    b"Euml cb\n"
+    b"Exists 2203\n"
+    b"ExponentialE 2147\n"
+    b"Fcy 424\n"
+    b"Ffr 1d509\n"
+    b"FilledSmallSquare 25fc\n"
+    b"FilledVerySmallSquare 25aa\n"
+    b"Fopf 1d53d\n"
+    b"ForAll 2200\n"
+    b"Fouriertrf 2131\n"
+    b"Fscr 2131\n"
+    b"GJcy 403\n"
+    b"GT 3e\n"
+    b"Gamma 393\n"
+    b"Gammad 3dc\n"
+    b"Gbreve 11e\n"
+    b"Gcedil 122\n"
+    b"Gcirc 11c\n"
+    b"Gcy 413\n"
+    b"Gdot 120\n"
+    b"Gfr 1d50a\n"
+    b"Gg 22d9\n"
+    b"Gopf 1d53e\n"
+    b"GreaterEqual 2265\n"
+    b"GreaterEqualLess 22db\n"
+    b"GreaterFullEqual 2267\n"
+    b"GreaterGreater 2aa2\n"
+    b"GreaterLess 2277\n"
+    b"GreaterSlantEqual 2a7e\n"
+    b"GreaterTilde 2273\n"
+    b"Gscr 1d4a2\n"
+    b"Gt 226b\n"
+    b"HARDcy 42a\n"
+    b"Hacek 2c7\n"
+    b"Hat 5e\n"
+    b"Hcirc 124\n"
+    b"Hfr 210c\n"
+    b"HilbertSpace 210b\n"
+    b"Hopf 210d\n"
+    b"HorizontalLine 2500\n"
+    b"Hscr 210b\n"
+    b"Hstrok 126\n"
+    b"HumpDownHump 224e\n"
+    b"HumpEqual 224f\n"
+    b"IEcy 415\n"
+    b"IJlig 132\n"
+    b"IOcy 401\n"
+    b"Iacute cd\n"
+    b"Icirc ce\n"
+    b"Icy 418\n"
+    b"Idot 130\n"
+    b"Ifr 2111\n"
+    b"Igrave cc\n"
+    b"Im 2111\n"
+    b"Imacr 12a\n"
+    b"ImaginaryI 2148\n"
+    b"Implies 21d2\n"
+    b"Int 222c\n"
+    b"Integral 222b\n"
+    b"Intersection 22c2\n"
+    b"InvisibleComma 2063\n"
+    b"InvisibleTimes 2062\n"
+    b"Iogon 12e\n"
+    b"Iopf 1d540\n"
+    b"Iota 399\n"
+    b"Iscr 2110\n"
+    b"Itilde 128\n"
+    b"Iukcy 406\n"
+    b"Iuml cf\n"
+    b"Jcirc 134\n"
+    b"Jcy 419\n"
+    b"Jfr 1d50d\n"
+    b"Jopf 1d541\n"
+    b"Jscr 1d4a5\n"
+    b"Jsercy 408\n"
+    b"Jukcy 404\n"
+    b"KHcy 425\n"
+    b"KJcy 40c\n"
+    b"Kappa 39a\n"
+    b"Kcedil 136\n"
+    b"Kcy 41a\n"
+    b"Kfr 1d50e\n"
+    b"Kopf 1d542\n"
+    b"Kscr 1d4a6\n"
+    b"LJcy 409\n"
+    b"LT 3c\n"
+    b"Lacute 139\n"
+    b"Lambda 39b\n"
+    b"Lang 27ea\n"
+    b"Laplacetrf 2112\n"
+    b"Larr 219e\n"
+    b"Lcaron 13d\n"
+    b"Lcedil 13b\n"
+    b"Lcy 41b\n"
+    b"LeftAngleBracket 27e8\n"
+    b"LeftArrow 2190\n"
+    b"LeftArrowBar 21e4\n"
+    b"LeftArrowRightArrow 21c6\n"
+    b"LeftCeiling 2308\n"
+    b"LeftDoubleBracket 27e6\n"
+    b"LeftDownTeeVector 2961\n"
+    b"LeftDownVector 21c3\n"
+    b"LeftDownVectorBar 2959\n"
+    b"LeftFloor 230a\n"
+    b"LeftRightArrow 2194\n"
+    b"LeftRightVector 294e\n"
+    b"LeftTee 22a3\n"
+    b"LeftTeeArrow 21a4\n"
+    b"LeftTeeVector 295a\n"
+    b"LeftTriangle 22b2\n"
+    b"LeftTriangleBar 29cf\n"
+    b"LeftTriangleEqual 22b4\n"
+    b"LeftUpDownVector 2951\n"
+    b"LeftUpTeeVector 2960\n"
+    b"LeftUpVector 21bf\n"
+    b"LeftUpVectorBar 2958\n"
+    b"LeftVector 21bc\n"
+    b"LeftVectorBar 2952\n"
+    b"Leftarrow 21d0\n"
+    b"Leftrightarrow 21d4\n"
+    b"LessEqualGreater 22da\n"
+    b"LessFullEqual 2266\n"
+    b"LessGreater 2276\n"
+    b"LessLess 2aa1\n"
+    b"LessSlantEqual 2a7d\n"
+    b"LessTilde 2272\n"
+    b"Lfr 1d50f\n"
+    b"Ll 22d8\n"
+    b"Lleftarrow 21da\n"
+    b"Lmidot 13f\n"
+    b"LongLeftArrow 27f5\n"
+    b"LongLeftRightArrow 27f7\n"
+    b"LongRightArrow 27f6\n"
+    b"Longleftarrow 27f8\n"
+    b"Longleftrightarrow 27fa\n"
+    b"Longrightarrow 27f9\n"
+    b"Lopf 1d543\n"
+    b"LowerLeftArrow 2199\n"
+    b"LowerRightArrow 2198\n"
+    b"Lscr 2112\n"
+    b"Lsh 21b0\n"
+    b"Lstrok 141\n"
+    b"Lt 226a\n"
+    b"Map 2905\n"
+    b"Mcy 41c\n"
+    b"MediumSpace 205f\n"
+    b"Mellintrf 2133\n"
+    b"Mfr 1d510\n"
+    b"MinusPlus 2213\n"
+    b"Mopf 1d544\n"
+    b"Mscr 2133\n"
+    b"Mu 39c\n"
+    b"NJcy 40a\n"
+    b"Nacute 143\n"
+    b"Ncaron 147\n"
+    b"Ncedil 145\n"
+    b"Ncy 41d\n"
+    b"NegativeMediumSpace 200b\n"
+    b"NegativeThickSpace 200b\n"
+    b"NegativeThinSpace 200b\n"
+    b"NegativeVeryThinSpace 200b\n"
+    b"NestedGreaterGreater 226b\n"
+    b"NestedLessLess 226a\n"
+    b"NewLine a\n"
+    b"Nfr 1d511\n"
+    b"NoBreak 2060\n"
+    b"NonBreakingSpace a0\n"
+    b"Nopf 2115\n"
+    b"Not 2aec\n"
+    b"NotCongruent 2262\n"
+    b"NotCupCap 226d\n"
+    b"NotDoubleVerticalBar 2226\n"
+    b"NotElement 2209\n"
+    b"NotEqual 2260\n"
+    b"NotEqualTilde 2242 338\n"
+    b"NotExists 2204\n"
+    b"NotGreater 226f\n"
+    b"NotGreaterEqual 2271\n"
+    b"NotGreaterFullEqual 2267 338\n"
+    b"NotGreaterGreater 226b 338\n"
+    b"NotGreaterLess 2279\n"
+    b"NotGreaterSlantEqual 2a7e 338\n"
+    b"NotGreaterTilde 2275\n"
+    b"NotHumpDownHump 224e 338\n"
+    b"NotHumpEqual 224f 338\n"
+    b"NotLeftTriangle 22ea\n"
+    b"NotLeftTriangleBar 29cf 338\n"
+    b"NotLeftTriangleEqual 22ec\n"
+    b"NotLess 226e\n"
+    b"NotLessEqual 2270\n"
+    b"NotLessGreater 2278\n"
+    b"NotLessLess 226a 338\n"
+    b"NotLessSlantEqual 2a7d 338\n"
+    b"NotLessTilde 2274\n"
+    b"NotNestedGreaterGreater 2aa2 338\n"
+    b"NotNestedLessLess 2aa1 338\n"
+    b"NotPrecedes 2280\n"
+    b"NotPrecedesEqual 2aaf 338\n"
+    b"NotPrecedesSlantEqual 22e0\n"
+    b"NotReverseElement 220c\n"
+    b"NotRightTriangle 22eb\n"
+    b"NotRightTriangleBar 29d0 338\n"
+    b"NotRightTriangleEqual 22ed\n"
+    b"NotSquareSubset 228f 338\n"
+    b"NotSquareSubsetEqual 22e2\n"
+    b"NotSquareSuperset 2290 338\n"
+    b"NotSquareSupersetEqual 22e3\n"
+    b"NotSubset 2282 20d2\n"
+    b"NotSubsetEqual 2288\n"
+    b"NotSucceeds 2281\n"
+    b"NotSucceedsEqual 2ab0 338\n"
+    b"NotSucceedsSlantEqual 22e1\n"
+    b"NotSucceedsTilde 227f 338\n"
+    b"NotSuperset 2283 20d2\n"
+    b"NotSupersetEqual 2289\n"
+    b"NotTilde 2241\n"
+    b"NotTildeEqual 2244\n"
+    b"NotTildeFullEqual 2247\n"
+    b"NotTildeTilde 2249\n"
+    b"NotVerticalBar 2224\n"
+    b"Nscr 1d4a9\n"
+    b"Ntilde d1\n"
+    b"Nu 39d\n"
+    b"OElig 152\n"
+    b"Oacute d3\n"
+    b"Ocirc d4\n"
+    b"Ocy 41e\n"
+    b"Odblac 150\n"
+    b"Ofr 1d512\n"
+    b"Ograve d2\n"
+    b"Omacr 14c\n"
+    b"Omega 3a9\n"
+    b"Omicron 39f\n"
+    b"Oopf 1d546\n"
+    b"OpenCurlyDoubleQuote 201c\n"
+    b"OpenCurlyQuote 2018\n"
+    b"Or 2a54\n"
+    b"Oscr 1d4aa\n"
+    b"Oslash d8\n"
+    b"Otilde d5\n"
+    b"Otimes 2a37\n"
+    b"Ouml d6\n"
+    b"OverBar 203e\n"
+    b"OverBrace 23de\n"
+    b"OverBracket 23b4\n"
+    b"OverParenthesis 23dc\n"
+    b"PartialD 2202\n"
+    b"Pcy 41f\n"
+    b"Pfr 1d513\n"
+    b"Phi 3a6\n"
+    b"Pi 3a0\n"
+    b"PlusMinus b1\n"
+    b"Poincareplane 210c\n"
+    b"Popf 2119\n"
+    b"Pr 2abb\n"
+    b"Precedes 227a\n"
+    b"PrecedesEqual 2aaf\n"
+    b"PrecedesSlantEqual 227c\n"
+    b"PrecedesTilde 227e\n"
+    b"Prime 2033\n"
+    b"Product 220f\n"
+    b"Proportion 2237\n"
+    b"Proportional 221d\n"
+    b"Pscr 1d4ab\n"
+    b"Psi 3a8\n"
+    b"QUOT 22\n"
+    b"Qfr 1d514\n"
+    b"Qopf 211a\n"
+    b"Qscr 1d4ac\n"
+    b"RBarr 2910\n"
+    b"REG ae\n"
+    b"Racute 154\n"
+    b"Rang 27eb\n"
+    b"Rarr 21a0\n"
+    b"Rarrtl 2916\n"
+    b"Rcaron 158\n"
+    b"Rcedil 156\n"
+    b"Rcy 420\n"
+    b"Re 211c\n"
+    b"ReverseElement 220b\n"
+    b"ReverseEquilibrium 21cb\n"
+    b"ReverseUpEquilibrium 296f\n"
+    b"Rfr 211c\n"
+    b"Rho 3a1\n"
+    b"RightAngleBracket 27e9\n"
+    b"RightArrow 2192\n"
+    b"RightArrowBar 21e5\n"
+    b"RightArrowLeftArrow 21c4\n"
+    b"RightCeiling 2309\n"
+    b"RightDoubleBracket 27e7\n"
+    b"RightDownTeeVector 295d\n"
+    b"RightDownVector 21c2\n"
+    b"RightDownVectorBar 2955\n"
+    b"RightFloor 230b\n"
+    b"RightTee 22a2\n"
+    b"RightTeeArrow 21a6\n"
+    b"RightTeeVector 295b\n"
+    b"RightTriangle 22b3\n"
+    b"RightTriangleBar 29d0\n"
+    b"RightTriangleEqual 22b5\n"
+    b"RightUpDownVector 294f\n"
+    b"RightUpTeeVector 295c\n"
+    b"RightUpVector 21be\n"
+    b"RightUpVectorBar 2954\n"
+    b"RightVector 21c0\n"
+    b"RightVectorBar 2953\n"
+    b"Rightarrow 21d2\n"
+    b"Ropf 211d\n"
+    b"RoundImplies 2970\n"
+    b"Rrightarrow 21db\n"
+    b"Rscr 211b\n"
+    b"Rsh 21b1\n"
+    b"RuleDelayed 29f4\n"
+    b"SHCHcy 429\n"
+    b"SHcy 428\n"
+    b"SOFTcy 42c\n"
+    b"Sacute 15a\n"
+    b"Sc 2abc\n"
+    b"Scaron 160\n"
+    b"Scedil 15e\n"
+    b"Scirc 15c\n"
+    b"Scy 421\n"
+    b"Sfr 1d516\n"
+    b"ShortDownArrow 2193\n"
+    b"ShortLeftArrow 2190\n"
+    b"ShortRightArrow 2192\n"
+    b"ShortUpArrow 2191\n"
+    b"Sigma 3a3\n"
+    b"SmallCircle 2218\n"
+    b"Sopf 1d54a\n"
+    b"Sqrt 221a\n"
+    b"Square 25a1\n"
+    b"SquareIntersection 2293\n"
+    b"SquareSubset 228f\n"
+    b"SquareSubsetEqual 2291\n"
+    b"SquareSuperset 2290\n"
+    b"SquareSupersetEqual 2292\n"
+    b"SquareUnion 2294\n"
+    b"Sscr 1d4ae\n"
+    b"Star 22c6\n"
+    b"Sub 22d0\n"
+    b"Subset 22d0\n"
+    b"SubsetEqual 2286\n"
+    b"Succeeds 227b\n"
+    b"SucceedsEqual 2ab0\n"
+    b"SucceedsSlantEqual 227d\n"
+    b"SucceedsTilde 227f\n"
+    b"SuchThat 220b\n"
+    b"Sum 2211\n"
+    b"Sup 22d1\n"
+    b"Superset 2283\n"
+    b"SupersetEqual 2287\n"
+    b"Supset 22d1\n"
+    b"THORN de\n"
+    b"TRADE 2122\n"
+    b"TSHcy 40b\n"
+    b"TScy 426\n"
+    b"Tab 9\n"
+    b"Tau 3a4\n"
+    b"Tcaron 164\n"
+    b"Tcedil 162\n"
+    b"Tcy 422\n"
+    b"Tfr 1d517\n"
+    b"Therefore 2234\n"
+    b"Theta 398\n"
+    b"ThickSpace 205f 200a\n"
+    b"ThinSpace 2009\n"
+    b"Tilde 223c\n"
+    b"TildeEqual 2243\n"
+    b"TildeFullEqual 2245\n"
+    b"TildeTilde 2248\n"
+    b"Topf 1d54b\n"
+    b"TripleDot 20db\n"
+    b"Tscr 1d4af\n"
+    b"Tstrok 166\n"
+    b"Uacute da\n"
+    b"Uarr 219f\n"
+    b"Uarrocir 2949\n"
+    b"Ubrcy 40e\n"
+    b"Ubreve 16c\n"
+    b"Ucirc db\n"
+    b"Ucy 423\n"
+    b"Udblac 170\n"
+    b"Ufr 1d518\n"
+    b"Ugrave d9\n"
+    b"Umacr 16a\n"
+    b"UnderBar 5f\n"
+    b"UnderBrace 23df\n"
+    b"UnderBracket 23b5\n"
+    b"UnderParenthesis 23dd\n"
+    b"Union 22c3\n"
+    b"UnionPlus 228e\n"
+    b"Uogon 172\n"
+    b"Uopf 1d54c\n"
+    b"UpArrow 2191\n"
+    b"UpArrowBar 2912\n"
+    b"UpArrowDownArrow 21c5\n"
+    b"UpDownArrow 2195\n"
+    b"UpEquilibrium 296e\n"
+    b"UpTee 22a5\n"
+    b"UpTeeArrow 21a5\n"
+    b"Uparrow 21d1\n"
+    b"Updownarrow 21d5\n"
+    b"UpperLeftArrow 2196\n"
+    b"UpperRightArrow 2197\n"
+    b"Upsi 3d2\n"
+    b"Upsilon 3a5\n"
+    b"Uring 16e\n"
+    b"Uscr 1d4b0\n"
+    b"Utilde 168\n"
+    b"Uuml dc\n"
+    b"VDash 22ab\n"
+    b"Vbar 2aeb\n"
+    b"Vcy 412\n"
+    b"Vdash 22a9\n"
+    b"Vdashl 2ae6\n"
+    b"Vee 22c1\n"
+    b"Verbar 2016\n"
+    b"Vert 2016\n"
+    b"VerticalBar 2223\n"
+    b"VerticalLine 7c\n"
+    b"VerticalSeparator 2758\n"
+    b"VerticalTilde 2240\n"
+    b"VeryThinSpace 200a\n"
+    b"Vfr 1d519\n"
+    b"Vopf 1d54d\n"
+    b"Vscr 1d4b1\n"
+    b"Vvdash 22aa\n"
+    b"Wcirc 174\n"
+    b"Wedge 22c0\n"
+    b"Wfr 1d51a\n"
+    b"Wopf 1d54e\n"
+    b"Wscr 1d4b2\n"
+    b"Xfr 1d51b\n"
+    b"Xi 39e\n"
+    b"Xopf 1d54f\n"
+    b"Xscr 1d4b3\n"
+    b"YAcy 42f\n"
+    b"YIcy 407\n"
+    b"YUcy 42e\n"
+    b"Yacute dd\n"
+    b"Ycirc 176\n"
+    b"Ycy 42b\n"
+    b"Yfr 1d51c\n"
+    b"Yopf 1d550\n"
+    b"Yscr 1d4b4\n"
+    b"Yuml 178\n"
+    b"ZHcy 416\n"
+    b"Zacute 179\n"
+    b"Zcaron 17d\n"
+    b"Zcy 417\n"
+    b"Zdot 17b\n"
+    b"ZeroWidthSpace 200b\n"
+    b"Zeta 396\n"
+    b"Zfr 2128\n"
+    b"Zopf 2124\n"
+    b"Zscr 1d4b5\n"
+    b"aacute e1\n"
+    b"abreve 103\n"
+    b"ac 223e\n"
+    b"acE 223e 333\n"
+    b"acd 223f\n"
+    b"acirc e2\n"
+    b"acute b4\n"
+    b"acy 430\n"
+    b"aelig e6\n"
+    b"af 2061\n"
+    b"afr 1d51e\n"
+    b"agrave e0\n"
+    b"alefsym 2135\n"
+    b"aleph 2135\n"
+    b"alpha 3b1\n"
+    b"amacr 101\n"
+    b"amalg 2a3f\n"
+    b"amp 26\n"
+    b"and 2227\n"
+    b"andand 2a55\n"
+    b"andd 2a5c\n"
+    b"andslope 2a58\n"
+    b"andv 2a5a\n"
+    b"ang 2220\n"
+    b"ange 29a4\n"
+    b"angle 2220\n"
+    b"angmsd 2221\n"
+    b"angmsdaa 29a8\n"
+    b"angmsdab 29a9\n"
+    b"angmsdac 29aa\n"
+    b"angmsdad 29ab\n"
+    b"angmsdae 29ac\n"
+    b"angmsdaf 29ad\n"
+    b"angmsdag 29ae\n"
+    b"angmsdah 29af\n"
+    b"angrt 221f\n"
+    b"angrtvb 22be\n"
+    b"angrtvbd 299d\n"
+    b"angsph 2222\n"
+    b"angst c5\n"
+    b"angzarr 237c\n"
+    b"aogon 105\n"
+    b"aopf 1d552\n"
+    b"ap 2248\n"
+    b"apE 2a70\n"
+    b"apacir 2a6f\n"
+    b"ape 224a\n"
+    b"apid 224b\n"
+    b"apos 27\n"
+    b"approx 2248\n"
+    b"approxeq 224a\n"
+    b"aring e5\n"
+    b"ascr 1d4b6\n"
+    b"ast 2a\n"
+    b"asymp 2248\n"
+    b"asympeq 224d\n"
+    b"atilde e3\n"
+    b"auml e4\n"
+    b"awconint 2233\n"
+    b"awint 2a11\n"
+    b"bNot 2aed\n"
+    b"backcong 224c\n"
+    b"backepsilon 3f6\n"
+    b"backprime 2035\n"
+    b"backsim 223d\n"
+    b"backsimeq 22cd\n"
+    b"barvee 22bd\n"
+    b"barwed 2305\n"
+    b"barwedge 2305\n"
+    b"bbrk 23b5\n"
+    b"bbrktbrk 23b6\n"
+    b"bcong 224c\n"
+    b"bcy 431\n"
+    b"bdquo 201e\n"
+    b"becaus 2235\n"
+    b"because 2235\n"
+    b"bemptyv 29b0\n"
+    b"bepsi 3f6\n"
+    b"bernou 212c\n"
+    b"beta 3b2\n"
+    b"beth 2136\n"
+    b"between 226c\n"
+    b"bfr 1d51f\n"
+    b"bigcap 22c2\n"
+    b"bigcirc 25ef\n"
+    b"bigcup 22c3\n"
+    b"bigodot 2a00\n"
+    b"bigoplus 2a01\n"
+    b"bigotimes 2a02\n"
+    b"bigsqcup 2a06\n"
+    b"bigstar 2605\n"
+    b"bigtriangledown 25bd\n"
+    b"bigtriangleup 25b3\n"
+    b"biguplus 2a04\n"
+    b"bigvee 22c1\n"
+    b"bigwedge 22c0\n"
+    b"bkarow 290d\n"
+    b"blacklozenge 29eb\n"
+    b"blacksquare 25aa\n"
+    b"blacktriangle 25b4\n"
+    b"blacktriangledown 25be\n"
+    b"blacktriangleleft 25c2\n"
+    b"blacktriangleright 25b8\n"
+    b"blank 2423\n"
+    b"blk12 2592\n"
+    b"blk14 2591\n"
+    b"blk34 2593\n"
+    b"block 2588\n"
+    b"bne 3d 20e5\n"
+    b"bnequiv 2261 20e5\n"
+    b"bnot 2310\n"
+    b"bopf 1d553\n"
+    b"bot 22a5\n"
+    b"bottom 22a5\n"
+    b"bowtie 22c8\n"
+    b"boxDL 2557\n"
+    b"boxDR 2554\n"
+    b"boxDl 2556\n"
+    b"boxDr 2553\n"
+    b"boxH 2550\n"
+    b"boxHD 2566\n"
+    b"boxHU 2569\n"
+    b"boxHd 2564\n"
+    b"boxHu 2567\n"
+    b"boxUL 255d\n"
+    b"boxUR 255a\n"
+    b"boxUl 255c\n"
+    b"boxUr 2559\n"
+    b"boxV 2551\n"
+    b"boxVH 256c\n"
+    b"boxVL 2563\n"
+    b"boxVR 2560\n"
+    b"boxVh 256b\n"
+    b"boxVl 2562\n"
+    b"boxVr 255f\n"
+    b"boxbox 29c9\n"
+    b"boxdL 2555\n"
+    b"boxdR 2552\n"
+    b"boxdl 2510\n"
+    b"boxdr 250c\n"
+    b"boxh 2500\n"
+    b"boxhD 2565\n"
+    b"boxhU 2568\n"
+    b"boxhd 252c\n"
+    b"boxhu 2534\n"
+    b"boxminus 229f\n"
+    b"boxplus 229e\n"
+    b"boxtimes 22a0\n"
+    b"boxuL 255b\n"
+    b"boxuR 2558\n"
+    b"boxul 2518\n"
+    b"boxur 2514\n"
+    b"boxv 2502\n"
+    b"boxvH 256a\n"
+    b"boxvL 2561\n"
+    b"boxvR 255e\n"
+    b"boxvh 253c\n"
+    b"boxvl 2524\n"
+    b"boxvr 251c\n"
+    b"bprime 2035\n"
+    b"breve 2d8\n"
+    b"brvbar a6\n"
+    b"bscr 1d4b7\n"
+    b"bsemi 204f\n"
+    b"bsim 223d\n"
+    b"bsime 22cd\n"
+    b"bsol 5c\n"
+    b"bsolb 29c5\n"
+    b"bsolhsub 27c8\n"
+    b"bull 2022\n"
+    b"bullet 2022\n"
+    b"bump 224e\n"
+    b"bumpE 2aae\n"
+    b"bumpe 224f\n"
+    b"bumpeq 224f\n"
+    b"cacute 107\n"
+    b"cap 2229\n"
+    b"capand 2a44\n"
+    b"capbrcup 2a49\n"
+    b"capcap 2a4b\n"
+    b"capcup 2a47\n"
+    b"capdot 2a40\n"
+    b"caps 2229 fe00\n"
+    b"caret 2041\n"
+    b"caron 2c7\n"
+    b"ccaps 2a4d\n"
+    b"ccaron 10d\n"
+    b"ccedil e7\n"
+    b"ccirc 109\n"
+    b"ccups 2a4c\n"
+    b"ccupssm 2a50\n"
+    b"cdot 10b\n"
+    b"cedil b8\n"
+    b"cemptyv 29b2\n"
+    b"cent a2\n"
+    b"centerdot b7\n"
+    b"cfr 1d520\n"
+    b"chcy 447\n"
+    b"check 2713\n"
+    b"checkmark 2713\n"
+    b"chi 3c7\n"
+    b"cir 25cb\n"
+    b"cirE 29c3\n"
+    b"circ 2c6\n"
+    b"circeq 2257\n"
+    b"circlearrowleft 21ba\n"
+    b"circlearrowright 21bb\n"
+    b"circledR ae\n"
+    b"circledS 24c8\n"
+    b"circledast 229b\n"
+    b"circledcirc 229a\n"
+    b"circleddash 229d\n"
+    b"cire 2257\n"
+    b"cirfnint 2a10\n"
+    b"cirmid 2aef\n"
+    b"cirscir 29c2\n"
+    b"clubs 2663\n"
+    b"clubsuit 2663\n"
+    b"colon 3a\n"
+    b"colone 2254\n"
+    b"coloneq 2254\n"
+    b"comma 2c\n"
+    b"commat 40\n"
+    b"comp 2201\n"
+    b"compfn 2218\n"
+    b"complement 2201\n"
+    b"complexes 2102\n"
+    b"cong 2245\n"
+    b"congdot 2a6d\n"
+    b"conint 222e\n"
+    b"copf 1d554\n"
+    b"coprod 2210\n"
+    b"copy a9\n"
+    b"copysr 2117\n"
+    b"crarr 21b5\n"
+    b"cross 2717\n"
+    b"cscr 1d4b8\n"
+    b"csub 2acf\n"
+    b"csube 2ad1\n"
+    b"csup 2ad0\n"
+    b"csupe 2ad2\n"
+    b"ctdot 22ef\n"
+    b"cudarrl 2938\n"
+    b"cudarrr 2935\n"
+    b"cuepr 22de\n"
+    b"cuesc 22df\n"
+    b"cularr 21b6\n"
+    b"cularrp 293d\n"
+    b"cup 222a\n"
+    b"cupbrcap 2a48\n"
+    b"cupcap 2a46\n"
+    b"cupcup 2a4a\n"
+    b"cupdot 228d\n"
+    b"cupor 2a45\n"
+    b"cups 222a fe00\n"
+    b"curarr 21b7\n"
+    b"curarrm 293c\n"
+    b"curlyeqprec 22de\n"
+    b"curlyeqsucc 22df\n"
+    b"curlyvee 22ce\n"
+    b"curlywedge 22cf\n"
+    b"curren a4\n"
+    b"curvearrowleft 21b6\n"
+    b"curvearrowright 21b7\n"
+    b"cuvee 22ce\n"
+    b"cuwed 22cf\n"
+    b"cwconint 2232\n"
+    b"cwint 2231\n"
+    b"cylcty 232d\n"
+    b"dArr 21d3\n"
+    b"dHar 2965\n"
+    b"dagger 2020\n"
+    b"daleth 2138\n"
+    b"darr 2193\n"
+    b"dash 2010\n"
+    b"dashv 22a3\n"
+    b"dbkarow 290f\n"
+    b"dblac 2dd\n"
+    b"dcaron 10f\n"
+    b"dcy 434\n"
+    b"dd 2146\n"
+    b"ddagger 2021\n"
+    b"ddarr 21ca\n"
+    b"ddotseq 2a77\n"
+    b"deg b0\n"
+    b"delta 3b4\n"
+    b"demptyv 29b1\n"
+    b"dfisht 297f\n"
+    b"dfr 1d521\n"
+    b"dharl 21c3\n"
+    b"dharr 21c2\n"
+    b"diam 22c4\n"
+    b"diamond 22c4\n"
+    b"diamondsuit 2666\n"
+    b"diams 2666\n"
+    b"die a8\n"
+    b"digamma 3dd\n"
+    b"disin 22f2\n"
+    b"div f7\n"
+    b"divide f7\n"
+    b"divideontimes 22c7\n"
+    b"divonx 22c7\n"
+    b"djcy 452\n"
+    b"dlcorn 231e\n"
+    b"dlcrop 230d\n"
+    b"dollar 24\n"
+    b"dopf 1d555\n"
+    b"dot 2d9\n"
+    b"doteq 2250\n"
+    b"doteqdot 2251\n"
+    b"dotminus 2238\n"
+    b"dotplus 2214\n"
+    b"dotsquare 22a1\n"
+    b"doublebarwedge 2306\n"
+    b"downarrow 2193\n"
+    b"downdownarrows 21ca\n"
+    b"downharpoonleft 21c3\n"
+    b"downharpoonright 21c2\n"
+    b"drbkarow 2910\n"
+    b"drcorn 231f\n"
+    b"drcrop 230c\n"
+    b"dscr 1d4b9\n"
+    b"dscy 455\n"
+    b"dsol 29f6\n"
+    b"dstrok 111\n"
+    b"dtdot 22f1\n"
+    b"dtri 25bf\n"
+    b"dtrif 25be\n"
+    b"duarr 21f5\n"
+    b"duhar 296f\n"
+    b"dwangle 29a6\n"
+    b"dzcy 45f\n"
+    b"dzigrarr 27ff\n"
+    b"eDDot 2a77\n"
+    b"eDot 2251\n"
+    b"eacute e9\n"
+    b"easter 2a6e\n"
+    b"ecaron 11b\n"
+    b"ecir 2256\n"
+    b"ecirc ea\n"
+    b"ecolon 2255\n"
+    b"ecy 44d\n"
+    b"edot 117\n"
+    b"ee 2147\n"
+    b"efDot 2252\n"
+    b"efr 1d522\n"
+    b"eg 2a9a\n"
+    b"egrave e8\n"
+    b"egs 2a96\n"
+    b"egsdot 2a98\n"
+    b"el 2a99\n"
+    b"elinters 23e7\n"
+    b"ell 2113\n"
+    b"els 2a95\n"
+    b"elsdot 2a97\n"
+    b"emacr 113\n"
+    b"empty 2205\n"
+    b"emptyset 2205\n"
+    b"emptyv 2205\n"
+    b"emsp 2003\n"
+    b"emsp13 2004\n"
+    b"emsp14 2005\n"
+    b"eng 14b\n"
+    b"ensp 2002\n"
+    b"eogon 119\n"
+    b"eopf 1d556\n"
+    b"epar 22d5\n"
+    b"eparsl 29e3\n"
+    b"eplus 2a71\n"
+    b"epsi 3b5\n"
+    b"epsilon 3b5\n"
+    b"epsiv 3f5\n"
+    b"eqcirc 2256\n"
+    b"eqcolon 2255\n"
+    b"eqsim 2242\n"
+    b"eqslantgtr 2a96\n"
+    b"eqslantless 2a95\n"
+    b"equals 3d\n"
+    b"equest 225f\n"
+    b"equiv 2261\n"
+    b"equivDD 2a78\n"
+    b"eqvparsl 29e5\n"
+    b"erDot 2253\n"
+    b"erarr 2971\n"
+    b"escr 212f\n"
+    b"esdot 2250\n"
+    b"esim 2242\n"
+    b"eta 3b7\n"
+    b"eth f0\n"
+    b"euml eb\n"
+    b"euro 20ac\n"
+    b"excl 21\n"
+    b"exist 2203\n"
+    b"expectation 2130\n"
+    b"exponentiale 2147\n"
+    b"fallingdotseq 2252\n"
+    b"fcy 444\n"
+    b"female 2640\n"
+    b"ffilig fb03\n"
+    b"fflig fb00\n"
+    b"ffllig fb04\n"
+    b"ffr 1d523\n"
+    b"filig fb01\n"
+    b"fjlig 66 6a\n"
+    b"flat 266d\n"
+    b"fllig fb02\n"
+    b"fltns 25b1\n"
+    b"fnof 192\n"
+    b"fopf 1d557\n"
+    b"forall 2200\n"
+    b"fork 22d4\n"
+    b"forkv 2ad9\n"
+    b"fpartint 2a0d\n"
+    b"frac12 bd\n"
+    b"frac13 2153\n"
+    b"frac14 bc\n"
+    b"frac15 2155\n"
+    b"frac16 2159\n"
+    b"frac18 215b\n"
+    b"frac23 2154\n"
+    b"frac25 2156\n"
+    b"frac34 be\n"
+    b"frac35 2157\n"
+    b"frac38 215c\n"
+    b"frac45 2158\n"
+    b"frac56 215a\n"
+    b"frac58 215d\n"
+    b"frac78 215e\n"
+    b"frasl 2044\n"
+    b"frown 2322\n"
+    b"fscr 1d4bb\n"
+    b"gE 2267\n"
+    b"gEl 2a8c\n"
+    b"gacute 1f5\n"
+    b"gamma 3b3\n"
+    b"gammad 3dd\n"
+    b"gap 2a86\n"
+    b"gbreve 11f\n"
+    b"gcirc 11d\n"
+    b"gcy 433\n"
+    b"gdot 121\n"
+    b"ge 2265\n"
+    b"gel 22db\n"
+    b"geq 2265\n"
+    b"geqq 2267\n"
+    b"geqslant 2a7e\n"
+    b"ges 2a7e\n"
+    b"gescc 2aa9\n"
+    b"gesdot 2a80\n"
+    b"gesdoto 2a82\n"
+    b"gesdotol 2a84\n"
+    b"gesl 22db fe00\n"
+    b"gesles 2a94\n"
+    b"gfr 1d524\n"
+    b"gg 226b\n"
+    b"ggg 22d9\n"
+    b"gimel 2137\n"
+    b"gjcy 453\n"
+    b"gl 2277\n"
+    b"glE 2a92\n"
+    b"gla 2aa5\n"
+    b"glj 2aa4\n"
+    b"gnE 2269\n"
+    b"gnap 2a8a\n"
+    b"gnapprox 2a8a\n"
+    b"gne 2a88\n"
+    b"gneq 2a88\n"
+    b"gneqq 2269\n"
+    b"gnsim 22e7\n"
+    b"gopf 1d558\n"
+    b"grave 60\n"
+    b"gscr 210a\n"
+    b"gsim 2273\n"
+    b"gsime 2a8e\n"
+    b"gsiml 2a90\n"
+    b"gt 3e\n"
+    b"gtcc 2aa7\n"
+    b"gtcir 2a7a\n"
+    b"gtdot 22d7\n"
+    b"gtlPar 2995\n"
+    b"gtquest 2a7c\n"
+    b"gtrapprox 2a86\n"
+    b"gtrarr 2978\n"
+    b"gtrdot 22d7\n"
+    b"gtreqless 22db\n"
+    b"gtreqqless 2a8c\n"
+    b"gtrless 2277\n"
+    b"gtrsim 2273\n"
+    b"gvertneqq 2269 fe00\n"
+    b"gvnE 2269 fe00\n"
+    b"hArr 21d4\n"
+    b"hairsp 200a\n"
+    b"half bd\n"
+    b"hamilt 210b\n"
+    b"hardcy 44a\n"
+    b"harr 2194\n"
+    b"harrcir 2948\n"
+    b"harrw 21ad\n"
+    b"hbar 210f\n"
+    b"hcirc 125\n"
+    b"hearts 2665\n"
+    b"heartsuit 2665\n"
+    b"hellip 2026\n"
+    b"hercon 22b9\n"
+    b"hfr 1d525\n"
+    b"hksearow 2925\n"
+    b"hkswarow 2926\n"
+    b"hoarr 21ff\n"
+    b"homtht 223b\n"
+    b"hookleftarrow 21a9\n"
+    b"hookrightarrow 21aa\n"
+    b"hopf 1d559\n"
+    b"horbar 2015\n"
+    b"hscr 1d4bd\n"
+    b"hslash 210f\n"
+    b"hstrok 127\n"
+    b"hybull 2043\n"
+    b"hyphen 2010\n"
+    b"iacute ed\n"
+    b"ic 2063\n"
+    b"icirc ee\n"
+    b"icy 438\n"
+    b"iecy 435\n"
+    b"iexcl a1\n"
+    b"iff 21d4\n"
+    b"ifr 1d526\n"
+    b"igrave ec\n"
+    b"ii 2148\n"
+    b"iiiint 2a0c\n"
+    b"iiint 222d\n"
+    b"iinfin 29dc\n"
+    b"iiota 2129\n"
+    b"ijlig 133\n"
+    b"imacr 12b\n"
+    b"image 2111\n"
+    b"imagline 2110\n"
+    b"imagpart 2111\n"
+    b"imath 131\n"
+    b"imof 22b7\n"
+    b"imped 1b5\n"
+    b"in 2208\n"
+    b"incare 2105\n"
+    b"infin 221e\n"
+    b"infintie 29dd\n"
+    b"inodot 131\n"
+    b"int 222b\n"
+    b"intcal 22ba\n"
+    b"integers 2124\n"
+    b"intercal 22ba\n"
+    b"intlarhk 2a17\n"
+    b"intprod 2a3c\n"
+    b"iocy 451\n"
+    b"iogon 12f\n"
+    b"iopf 1d55a\n"
+    b"iota 3b9\n"
+    b"iprod 2a3c\n"
+    b"iquest bf\n"
+    b"iscr 1d4be\n"
+    b"isin 2208\n"
+    b"isinE 22f9\n"
+    b"isindot 22f5\n"
+    b"isins 22f4\n"
+    b"isinsv 22f3\n"
+    b"isinv 2208\n"
+    b"it 2062\n"
+    b"itilde 129\n"
+    b"iukcy 456\n"
+    b"iuml ef\n"
+    b"jcirc 135\n"
+    b"jcy 439\n"
+    b"jfr 1d527\n"
+    b"jmath 237\n"
+    b"jopf 1d55b\n"
+    b"jscr 1d4bf\n"
+    b"jsercy 458\n"
+    b"jukcy 454\n"
+    b"kappa 3ba\n"
+    b"kappav 3f0\n"
+    b"kcedil 137\n"
+    b"kcy 43a\n"
+    b"kfr 1d528\n"
+    b"kgreen 138\n"
+    b"khcy 445\n"
+    b"kjcy 45c\n"
+    b"kopf 1d55c\n"
+    b"kscr 1d4c0\n"
+    b"lAarr 21da\n"
+    b"lArr 21d0\n"
+    b"lAtail 291b\n"
+    b"lBarr 290e\n"
+    b"lE 2266\n"
+    b"lEg 2a8b\n"
+    b"lHar 2962\n"
+    b"lacute 13a\n"
+    b"laemptyv 29b4\n"
+    b"lagran 2112\n"
+    b"lambda 3bb\n"
+    b"lang 27e8\n"
+    b"langd 2991\n"
+    b"langle 27e8\n"
+    b"lap 2a85\n"
+    b"laquo ab\n"
+    b"larr 2190\n"
+    b"larrb 21e4\n"
+    b"larrbfs 291f\n"
+    b"larrfs 291d\n"
+    b"larrhk 21a9\n"
+    b"larrlp 21ab\n"
+    b"larrpl 2939\n"
+    b"larrsim 2973\n"
+    b"larrtl 21a2\n"
+    b"lat 2aab\n"
+    b"latail 2919\n"
+    b"late 2aad\n"
+    b"lates 2aad fe00\n"
+    b"lbarr 290c\n"
+    b"lbbrk 2772\n"
+    b"lbrace 7b\n"
+    b"lbrack 5b\n"
+    b"lbrke 298b\n"
+    b"lbrksld 298f\n"
+    b"lbrkslu 298d\n"
+    b"lcaron 13e\n"
+    b"lcedil 13c\n"
+    b"lceil 2308\n"
+    b"lcub 7b\n"
+    b"lcy 43b\n"
+    b"ldca 2936\n"
+    b"ldquo 201c\n"
+    b"ldquor 201e\n"
+    b"ldrdhar 2967\n"
+    b"ldrushar 294b\n"
+    b"ldsh 21b2\n"
+    b"le 2264\n"
+    b"leftarrow 2190\n"
+    b"leftarrowtail 21a2\n"
+    b"leftharpoondown 21bd\n"
+    b"leftharpoonup 21bc\n"
+    b"leftleftarrows 21c7\n"
+    b"leftrightarrow 2194\n"
+    b"leftrightarrows 21c6\n"
+    b"leftrightharpoons 21cb\n"
+    b"leftrightsquigarrow 21ad\n"
+    b"leftthreetimes 22cb\n"
+    b"leg 22da\n"
+    b"leq 2264\n"
+    b"leqq 2266\n"
+    b"leqslant 2a7d\n"
+    b"les 2a7d\n"
+    b"lescc 2aa8\n"
+    b"lesdot 2a7f\n"
+    b"lesdoto 2a81\n"
+    b"lesdotor 2a83\n"
+    b"lesg 22da fe00\n"
+    b"lesges 2a93\n"
+    b"lessapprox 2a85\n"
+    b"lessdot 22d6\n"
+    b"lesseqgtr 22da\n"
+    b"lesseqqgtr 2a8b\n"
+    b"lessgtr 2276\n"
+    b"lesssim 2272\n"
+    b"lfisht 297c\n"
+    b"lfloor 230a\n"
+    b"lfr 1d529\n"
+    b"lg 2276\n"
+    b"lgE 2a91\n"
+    b"lhard 21bd\n"
+    b"lharu 21bc\n"
+    b"lharul 296a\n"
+    b"lhblk 2584\n"
+    b"ljcy 459\n"
+    b"ll 226a\n"
+    b"llarr 21c7\n"
+    b"llcorner 231e\n"
+    b"llhard 296b\n"
+    b"lltri 25fa\n"
+    b"lmidot 140\n"
+    b"lmoust 23b0\n"
+    b"lmoustache 23b0\n"
+    b"lnE 2268\n"
+    b"lnap 2a89\n"
+    b"lnapprox 2a89\n"
+    b"lne 2a87\n"
+    b"lneq 2a87\n"
+    b"lneqq 2268\n"
+    b"lnsim 22e6\n"
+    b"loang 27ec\n"
+    b"loarr 21fd\n"
+    b"lobrk 27e6\n"
+    b"longleftarrow 27f5\n"
+    b"longleftrightarrow 27f7\n"
+    b"longmapsto 27fc\n"
+    b"longrightarrow 27f6\n"
+    b"looparrowleft 21ab\n"
+    b"looparrowright 21ac\n"
+    b"lopar 2985\n"
+    b"lopf 1d55d\n"
+    b"loplus 2a2d\n"
+    b"lotimes 2a34\n"
+    b"lowast 2217\n"
+    b"lowbar 5f\n"
+    b"loz 25ca\n"
+    b"lozenge 25ca\n"
+    b"lozf 29eb\n"
+    b"lpar 28\n"
+    b"lparlt 2993\n"
+    b"lrarr 21c6\n"
+    b"lrcorner 231f\n"
+    b"lrhar 21cb\n"
+    b"lrhard 296d\n"
+    b"lrm 200e\n"
+    b"lrtri 22bf\n"
+    b"lsaquo 2039\n"
+    b"lscr 1d4c1\n"
+    b"lsh 21b0\n"
+    b"lsim 2272\n"
+    b"lsime 2a8d\n"
+    b"lsimg 2a8f\n"
+    b"lsqb 5b\n"
+    b"lsquo 2018\n"
+    b"lsquor 201a\n"
+    b"lstrok 142\n"
+    b"lt 3c\n"
+    b"ltcc 2aa6\n"
+    b"ltcir 2a79\n"
+    b"ltdot 22d6\n"
+    b"lthree 22cb\n"
+    b"ltimes 22c9\n"
+    b"ltlarr 2976\n"
+    b"ltquest 2a7b\n"
+    b"ltrPar 2996\n"
+    b"ltri 25c3\n"
+    b"ltrie 22b4\n"
+    b"ltrif 25c2\n"
+    b"lurdshar 294a\n"
+    b"luruhar 2966\n"
+    b"lvertneqq 2268 fe00\n"
+    b"lvnE 2268 fe00\n"
+    b"mDDot 223a\n"
+    b"macr af\n"
+    b"male 2642\n"
+    b"malt 2720\n"
+    b"maltese 2720\n"
+    b"map 21a6\n"
+    b"mapsto 21a6\n"
+    b"mapstodown 21a7\n"
+    b"mapstoleft 21a4\n"
+    b"mapstoup 21a5\n"
+    b"marker 25ae\n"
+    b"mcomma 2a29\n"
+    b"mcy 43c\n"
+    b"mdash 2014\n"
+    b"measuredangle 2221\n"
+    b"mfr 1d52a\n"
+    b"mho 2127\n"
+    b"micro b5\n"
+    b"mid 2223\n"
+    b"midast 2a\n"
+    b"midcir 2af0\n"
+    b"middot b7\n"
+    b"minus 2212\n"
+    b"minusb 229f\n"
+    b"minusd 2238\n"
+    b"minusdu 2a2a\n"
+    b"mlcp 2adb\n"
+    b"mldr 2026\n"
+    b"mnplus 2213\n"
+    b"models 22a7\n"
+    b"mopf 1d55e\n"
+    b"mp 2213\n"
+    b"mscr 1d4c2\n"
+    b"mstpos 223e\n"
+    b"mu 3bc\n"
+    b"multimap 22b8\n"
+    b"mumap 22b8\n"
+    b"nGg 22d9 338\n"
+    b"nGt 226b 20d2\n"
+    b"nGtv 226b 338\n"
+    b"nLeftarrow 21cd\n"
+    b"nLeftrightarrow 21ce\n"
+    b"nLl 22d8 338\n"
+    b"nLt 226a 20d2\n"
+    b"nLtv 226a 338\n"
+    b"nRightarrow 21cf\n"
+    b"nVDash 22af\n"
+    b"nVdash 22ae\n"
+    b"nabla 2207\n"
+    b"nacute 144\n"
+    b"nang 2220 20d2\n"
+    b"nap 2249\n"
+    b"napE 2a70 338\n"
+    b"napid 224b 338\n"
+    b"napos 149\n"
+    b"napprox 2249\n"
+    b"natur 266e\n"
+    b"natural 266e\n"
+    b"naturals 2115\n"
+    b"nbsp a0\n"
+    b"nbump 224e 338\n"
+    b"nbumpe 224f 338\n"
+    b"ncap 2a43\n"
+    b"ncaron 148\n"
+    b"ncedil 146\n"
+    b"ncong 2247\n"
+    b"ncongdot 2a6d 338\n"
+    b"ncup 2a42\n"
+    b"ncy 43d\n"
+    b"ndash 2013\n"
+    b"ne 2260\n"
+    b"neArr 21d7\n"
+    b"nearhk 2924\n"
+    b"nearr 2197\n"
+    b"nearrow 2197\n"
+    b"nedot 2250 338\n"
+    b"nequiv 2262\n"
+    b"nesear 2928\n"
+    b"nesim 2242 338\n"
+    b"nexist 2204\n"
+    b"nexists 2204\n"
+    b"nfr 1d52b\n"
+    b"ngE 2267 338\n"
+    b"nge 2271\n"
+    b"ngeq 2271\n"
+    b"ngeqq 2267 338\n"
+    b"ngeqslant 2a7e 338\n"
+    b"nges 2a7e 338\n"
+    b"ngsim 2275\n"
+    b"ngt 226f\n"
+    b"ngtr 226f\n"
+    b"nhArr 21ce\n"
+    b"nharr 21ae\n"
+    b"nhpar 2af2\n"
+    b"ni 220b\n"
+    b"nis 22fc\n"
+    b"nisd 22fa\n"
+    b"niv 220b\n"
+    b"njcy 45a\n"
+    b"nlArr 21cd\n"
+    b"nlE 2266 338\n"
+    b"nlarr 219a\n"
+    b"nldr 2025\n"
+    b"nle 2270\n"
+    b"nleftarrow 219a\n"
+    b"nleftrightarrow 21ae\n"
+    b"nleq 2270\n"
+    b"nleqq 2266 338\n"
+    b"nleqslant 2a7d 338\n"
+    b"nles 2a7d 338\n"
+    b"nless 226e\n"
+    b"nlsim 2274\n"
+    b"nlt 226e\n"
+    b"nltri 22ea\n"
+    b"nltrie 22ec\n"
+    b"nmid 2224\n"
+    b"nopf 1d55f\n"
+    b"not ac\n"
+    b"notin 2209\n"
+    b"notinE 22f9 338\n"
+    b"notindot 22f5 338\n"
+    b"notinva 2209\n"
+    b"notinvb 22f7\n"
+    b"notinvc 22f6\n"
+    b"notni 220c\n"
+    b"notniva 220c\n"
+    b"notnivb 22fe\n"
+    b"notnivc 22fd\n"
+    b"npar 2226\n"
+    b"nparallel 2226\n"
+    b"nparsl 2afd 20e5\n"
+    b"npart 2202 338\n"
+    b"npolint 2a14\n"
+    b"npr 2280\n"
+    b"nprcue 22e0\n"
+    b"npre 2aaf 338\n"
+    b"nprec 2280\n"
+    b"npreceq 2aaf 338\n"
+    b"nrArr 21cf\n"
+    b"nrarr 219b\n"
+    b"nrarrc 2933 338\n"
+    b"nrarrw 219d 338\n"
+    b"nrightarrow 219b\n"
+    b"nrtri 22eb\n"
+    b"nrtrie 22ed\n"
+    b"nsc 2281\n"
+    b"nsccue 22e1\n"
+    b"nsce 2ab0 338\n"
+    b"nscr 1d4c3\n"
+    b"nshortmid 2224\n"
+    b"nshortparallel 2226\n"
+    b"nsim 2241\n"
+    b"nsime 2244\n"
+    b"nsimeq 2244\n"
+    b"nsmid 2224\n"
+    b"nspar 2226\n"
+    b"nsqsube 22e2\n"
+    b"nsqsupe 22e3\n"
+    b"nsub 2284\n"
+    b"nsubE 2ac5 338\n"
+    b"nsube 2288\n"
+    b"nsubset 2282 20d2\n"
+    b"nsubseteq 2288\n"
+    b"nsubseteqq 2ac5 338\n"
+    b"nsucc 2281\n"
+    b"nsucceq 2ab0 338\n"
+    b"nsup 2285\n"
+    b"nsupE 2ac6 338\n"
+    b"nsupe 2289\n"
+    b"nsupset 2283 20d2\n"
+    b"nsupseteq 2289\n"
+    b"nsupseteqq 2ac6 338\n"
+    b"ntgl 2279\n"
+    b"ntilde f1\n"
+    b"ntlg 2278\n"
+    b"ntriangleleft 22ea\n"
+    b"ntrianglelefteq 22ec\n"
+    b"ntriangleright 22eb\n"
+    b"ntrianglerighteq 22ed\n"
+    b"nu 3bd\n"
+    b"num 23\n"
+    b"numero 2116\n"
+    b"numsp 2007\n"
+    b"nvDash 22ad\n"
+    b"nvHarr 2904\n"
+    b"nvap 224d 20d2\n"
+    b"nvdash 22ac\n"
+    b"nvge 2265 20d2\n"
+    b"nvgt 3e 20d2\n"
+    b"nvinfin 29de\n"
+    b"nvlArr 2902\n"
+    b"nvle 2264 20d2\n"
+    b"nvlt 3c 20d2\n"
+    b"nvltrie 22b4 20d2\n"
+    b"nvrArr 2903\n"
+    b"nvrtrie 22b5 20d2\n"
+    b"nvsim 223c 20d2\n"
+    b"nwArr 21d6\n"
+    b"nwarhk 2923\n"
+    b"nwarr 2196\n"
+    b"nwarrow 2196\n"
+    b"nwnear 2927\n"
+    b"oS 24c8\n"
+    b"oacute f3\n"
+    b"oast 229b\n"
+    b"ocir 229a\n"
+    b"ocirc f4\n"
+    b"ocy 43e\n"
+    b"odash 229d\n"
+    b"odblac 151\n"
+    b"odiv 2a38\n"
+    b"odot 2299\n"
+    b"odsold 29bc\n"
+    b"oelig 153\n"
+    b"ofcir 29bf\n"
+    b"ofr 1d52c\n"
+    b"ogon 2db\n"
+    b"ograve f2\n"
+    b"ogt 29c1\n"
+    b"ohbar 29b5\n"
+    b"ohm 3a9\n"
+    b"oint 222e\n"
+    b"olarr 21ba\n"
+    b"olcir 29be\n"
+    b"olcross 29bb\n"
+    b"oline 203e\n"
+    b"olt 29c0\n"
+    b"omacr 14d\n"
+    b"omega 3c9\n"
+    b"omicron 3bf\n"
+    b"omid 29b6\n"
+    b"ominus 2296\n"
+    b"oopf 1d560\n"
+    b"opar 29b7\n"
+    b"operp 29b9\n"
+    b"oplus 2295\n"
+    b"or 2228\n"
+    b"orarr 21bb\n"
+    b"ord 2a5d\n"
+    b"order 2134\n"
+    b"orderof 2134\n"
+    b"ordf aa\n"
+    b"ordm ba\n"
+    b"origof 22b6\n"
+    b"oror 2a56\n"
+    b"orslope 2a57\n"
+    b"orv 2a5b\n"
+    b"oscr 2134\n"
+    b"oslash f8\n"
+    b"osol 2298\n"
+    b"otilde f5\n"
+    b"otimes 2297\n"
+    b"otimesas 2a36\n"
+    b"ouml f6\n"
+    b"ovbar 233d\n"
+    b"par 2225\n"
+    b"para b6\n"
+    b"parallel 2225\n"
+    b"parsim 2af3\n"
+    b"parsl 2afd\n"
+    b"part 2202\n"
+    b"pcy 43f\n"
+    b"percnt 25\n"
+    b"period 2e\n"
+    b"permil 2030\n"
+    b"perp 22a5\n"
+    b"pertenk 2031\n"
+    b"pfr 1d52d\n"
+    b"phi 3c6\n"
+    b"phiv 3d5\n"
+    b"phmmat 2133\n"
+    b"phone 260e\n"
+    b"pi 3c0\n"
+    b"pitchfork 22d4\n"
+    b"piv 3d6\n"
+    b"planck 210f\n"
+    b"planckh 210e\n"
+    b"plankv 210f\n"
+    b"plus 2b\n"
+    b"plusacir 2a23\n"
+    b"plusb 229e\n"
+    b"pluscir 2a22\n"
+    b"plusdo 2214\n"
+    b"plusdu 2a25\n"
+    b"pluse 2a72\n"
+    b"plusmn b1\n"
+    b"plussim 2a26\n"
+    b"plustwo 2a27\n"
+    b"pm b1\n"
+    b"pointint 2a15\n"
+    b"popf 1d561\n"
+    b"pound a3\n"
+    b"pr 227a\n"
+    b"prE 2ab3\n"
+    b"prap 2ab7\n"
+    b"prcue 227c\n"
+    b"pre 2aaf\n"
+    b"prec 227a\n"
+    b"precapprox 2ab7\n"
+    b"preccurlyeq 227c\n"
+    b"preceq 2aaf\n"
+    b"precnapprox 2ab9\n"
+    b"precneqq 2ab5\n"
+    b"precnsim 22e8\n"
+    b"precsim 227e\n"
+    b"prime 2032\n"
+    b"primes 2119\n"
+    b"prnE 2ab5\n"
+    b"prnap 2ab9\n"
+    b"prnsim 22e8\n"
+    b"prod 220f\n"
+    b"profalar 232e\n"
+    b"profline 2312\n"
+    b"profsurf 2313\n"
+    b"prop 221d\n"
+    b"propto 221d\n"
+    b"prsim 227e\n"
+    b"prurel 22b0\n"
+    b"pscr 1d4c5\n"
+    b"psi 3c8\n"
+    b"puncsp 2008\n"
+    b"qfr 1d52e\n"
+    b"qint 2a0c\n"
+    b"qopf 1d562\n"
+    b"qprime 2057\n"
+    b"qscr 1d4c6\n"
+    b"quaternions 210d\n"
+    b"quatint 2a16\n"
+    b"quest 3f\n"
+    b"questeq 225f\n"
+    b"quot 22\n"
+    b"rAarr 21db\n"
+    b"rArr 21d2\n"
+    b"rAtail 291c\n"
+    b"rBarr 290f\n"
+    b"rHar 2964\n"
+    b"race 223d 331\n"
+    b"racute 155\n"
+    b"radic 221a\n"
+    b"raemptyv 29b3\n"
+    b"rang 27e9\n"
+    b"rangd 2992\n"
+    b"range 29a5\n"
+    b"rangle 27e9\n"
+    b"raquo bb\n"
+    b"rarr 2192\n"
+    b"rarrap 2975\n"
+    b"rarrb 21e5\n"
+    b"rarrbfs 2920\n"
+    b"rarrc 2933\n"
+    b"rarrfs 291e\n"
+    b"rarrhk 21aa\n"
+    b"rarrlp 21ac\n"
+    b"rarrpl 2945\n"
+    b"rarrsim 2974\n"
+    b"rarrtl 21a3\n"
+    b"rarrw 219d\n"
+    b"ratail 291a\n"
+    b"ratio 2236\n"
+    b"rationals 211a\n"
+    b"rbarr 290d\n"
+    b"rbbrk 2773\n"
+    b"rbrace 7d\n"
+    b"rbrack 5d\n"
+    b"rbrke 298c\n"
+    b"rbrksld 298e\n"
+    b"rbrkslu 2990\n"
+    b"rcaron 159\n"
+    b"rcedil 157\n"
+    b"rceil 2309\n"
+    b"rcub 7d\n"
+    b"rcy 440\n"
+    b"rdca 2937\n"
+    b"rdldhar 2969\n"
+    b"rdquo 201d\n"
+    b"rdquor 201d\n"
+    b"rdsh 21b3\n"
+    b"real 211c\n"
+    b"realine 211b\n"
+    b"realpart 211c\n"
+    b"reals 211d\n"
+    b"rect 25ad\n"
+    b"reg ae\n"
+    b"rfisht 297d\n"
+    b"rfloor 230b\n"
+    b"rfr 1d52f\n"
+    b"rhard 21c1\n"
+    b"rharu 21c0\n"
+    b"rharul 296c\n"
+    b"rho 3c1\n"
+    b"rhov 3f1\n"
+    b"rightarrow 2192\n"
+    b"rightarrowtail 21a3\n"
+    b"rightharpoondown 21c1\n"
+    b"rightharpoonup 21c0\n"
+    b"rightleftarrows 21c4\n"
+    b"rightleftharpoons 21cc\n"
+    b"rightrightarrows 21c9\n"
+    b"rightsquigarrow 219d\n"
+    b"rightthreetimes 22cc\n"
+    b"ring 2da\n"
+    b"risingdotseq 2253\n"
+    b"rlarr 21c4\n"
+    b"rlhar 21cc\n"
+    b"rlm 200f\n"
+    b"rmoust 23b1\n"
+    b"rmoustache 23b1\n"
+    b"rnmid 2aee\n"
+    b"roang 27ed\n"
+    b"roarr 21fe\n"
+    b"robrk 27e7\n"
+    b"ropar 2986\n"
+    b"ropf 1d563\n"
+    b"roplus 2a2e\n"
+    b"rotimes 2a35\n"
+    b"rpar 29\n"
+    b"rpargt 2994\n"
+    b"rppolint 2a12\n"
+    b"rrarr 21c9\n"
+    b"rsaquo 203a\n"
+    b"rscr 1d4c7\n"
+    b"rsh 21b1\n"
+    b"rsqb 5d\n"
+    b"rsquo 2019\n"
+    b"rsquor 2019\n"
+    b"rthree 22cc\n"
+    b"rtimes 22ca\n"
+    b"rtri 25b9\n"
+    b"rtrie 22b5\n"
+    b"rtrif 25b8\n"
+    b"rtriltri 29ce\n"
+    b"ruluhar 2968\n"
+    b"rx 211e\n"
+    b"sacute 15b\n"
+    b"sbquo 201a\n"
+    b"sc 227b\n"
+    b"scE 2ab4\n"
+    b"scap 2ab8\n"
+    b"scaron 161\n"
+    b"sccue 227d\n"
+    b"sce 2ab0\n"
+    b"scedil 15f\n"
+    b"scirc 15d\n"
+    b"scnE 2ab6\n"
+    b"scnap 2aba\n"
+    b"scnsim 22e9\n"
+    b"scpolint 2a13\n"
+    b"scsim 227f\n"
+    b"scy 441\n"
+    b"sdot 22c5\n"
+    b"sdotb 22a1\n"
+    b"sdote 2a66\n"
+    b"seArr 21d8\n"
+    b"searhk 2925\n"
+    b"searr 2198\n"
+    b"searrow 2198\n"
+    b"sect a7\n"
+    b"semi 3b\n"
+    b"seswar 2929\n"
+    b"setminus 2216\n"
+    b"setmn 2216\n"
+    b"sext 2736\n"
+    b"sfr 1d530\n"
+    b"sfrown 2322\n"
+    b"sharp 266f\n"
+    b"shchcy 449\n"
+    b"shcy 448\n"
+    b"shortmid 2223\n"
+    b"shortparallel 2225\n"
+    b"shy ad\n"
+    b"sigma 3c3\n"
+    b"sigmaf 3c2\n"
+    b"sigmav 3c2\n"
+    b"sim 223c\n"
+    b"simdot 2a6a\n"
+    b"sime 2243\n"
+    b"simeq 2243\n"
+    b"simg 2a9e\n"
+    b"simgE 2aa0\n"
+    b"siml 2a9d\n"
+    b"simlE 2a9f\n"
+    b"simne 2246\n"
+    b"simplus 2a24\n"
+    b"simrarr 2972\n"
+    b"slarr 2190\n"
+    b"smallsetminus 2216\n"
+    b"smashp 2a33\n"
+    b"smeparsl 29e4\n"
+    b"smid 2223\n"
+    b"smile 2323\n"
+    b"smt 2aaa\n"
+    b"smte 2aac\n"
+    b"smtes 2aac fe00\n"
+    b"softcy 44c\n"
+    b"sol 2f\n"
+    b"solb 29c4\n"
+    b"solbar 233f\n"
+    b"sopf 1d564\n"
+    b"spades 2660\n"
+    b"spadesuit 2660\n"
+    b"spar 2225\n"
+    b"sqcap 2293\n"
+    b"sqcaps 2293 fe00\n"
+    b"sqcup 2294\n"
+    b"sqcups 2294 fe00\n"
+    b"sqsub 228f\n"
+    b"sqsube 2291\n"
+    b"sqsubset 228f\n"
+    b"sqsubseteq 2291\n"
+    b"sqsup 2290\n"
+    b"sqsupe 2292\n"
+    b"sqsupset 2290\n"
+    b"sqsupseteq 2292\n"
+    b"squ 25a1\n"
+    b"square 25a1\n"
+    b"squarf 25aa\n"
+    b"squf 25aa\n"
+    b"srarr 2192\n"
+    b"sscr 1d4c8\n"
+    b"ssetmn 2216\n"
+    b"ssmile 2323\n"
+    b"sstarf 22c6\n"
+    b"star 2606\n"
+    b"starf 2605\n"
+    b"straightepsilon 3f5\n"
+    b"straightphi 3d5\n"
+    b"strns af\n"
+    b"sub 2282\n"
+    b"subE 2ac5\n"
+    b"subdot 2abd\n"
+    b"sube 2286\n"
+    b"subedot 2ac3\n"
+    b"submult 2ac1\n"
+    b"subnE 2acb\n"
+    b"subne 228a\n"
+    b"subplus 2abf\n"
+    b"subrarr 2979\n"
+    b"subset 2282\n"
+    b"subseteq 2286\n"
+    b"subseteqq 2ac5\n"
+    b"subsetneq 228a\n"
+    b"subsetneqq 2acb\n"
+    b"subsim 2ac7\n"
+    b"subsub 2ad5\n"
+    b"subsup 2ad3\n"
+    b"succ 227b\n"
+    b"succapprox 2ab8\n"
+    b"succcurlyeq 227d\n"
+    b"succeq 2ab0\n"
+    b"succnapprox 2aba\n"
+    b"succneqq 2ab6\n"
+    b"succnsim 22e9\n"
+    b"succsim 227f\n"
+    b"sum 2211\n"
+    b"sung 266a\n"
+    b"sup 2283\n"
+    b"sup1 b9\n"
+    b"sup2 b2\n"
+    b"sup3 b3\n"
+    b"supE 2ac6\n"
+    b"supdot 2abe\n"
+    b"supdsub 2ad8\n"
+    b"supe 2287\n"
+    b"supedot 2ac4\n"
+    b"suphsol 27c9\n"
+    b"suphsub 2ad7\n"
+    b"suplarr 297b\n"
+    b"supmult 2ac2\n"
+    b"supnE 2acc\n"
+    b"supne 228b\n"
+    b"supplus 2ac0\n"
+    b"supset 2283\n"
+    b"supseteq 2287\n"
+    b"supseteqq 2ac6\n"
+    b"supsetneq 228b\n"
+    b"supsetneqq 2acc\n"
+    b"supsim 2ac8\n"
+    b"supsub 2ad4\n"
+    b"supsup 2ad6\n"
+    b"swArr 21d9\n"
+    b"swarhk 2926\n"
+    b"swarr 2199\n"
+    b"swarrow 2199\n"
+    b"swnwar 292a\n"
+    b"szlig df\n"
+    b"target 2316\n"
+    b"tau 3c4\n"
+    b"tbrk 23b4\n"
+    b"tcaron 165\n"
+    b"tcedil 163\n"
+    b"tcy 442\n"
+    b"tdot 20db\n"
+    b"telrec 2315\n"
+    b"tfr 1d531\n"
+    b"there4 2234\n"
+    b"therefore 2234\n"
+    b"theta 3b8\n"
+    b"thetasym 3d1\n"
+    b"thetav 3d1\n"
+    b"thickapprox 2248\n"
+    b"thicksim 223c\n"
+    b"thinsp 2009\n"
+    b"thkap 2248\n"
+    b"thksim 223c\n"
+    b"thorn fe\n"
+    b"tilde 2dc\n"
+    b"times d7\n"
+    b"timesb 22a0\n"
+    b"timesbar 2a31\n"
+    b"timesd 2a30\n"
+    b"tint 222d\n"
+    b"toea 2928\n"
+    b"top 22a4\n"
+    b"topbot 2336\n"
+    b"topcir 2af1\n"
+    b"topf 1d565\n"
+    b"topfork 2ada\n"
+    b"tosa 2929\n"
+    b"tprime 2034\n"
+    b"trade 2122\n"
+    b"triangle 25b5\n"
+    b"triangledown 25bf\n"
+    b"triangleleft 25c3\n"
+    b"trianglelefteq 22b4\n"
+    b"triangleq 225c\n"
+    b"triangleright 25b9\n"
+    b"trianglerighteq 22b5\n"
+    b"tridot 25ec\n"
+    b"trie 225c\n"
+    b"triminus 2a3a\n"
+    b"triplus 2a39\n"
+    b"trisb 29cd\n"
+    b"tritime 2a3b\n"
+    b"trpezium 23e2\n"
+    b"tscr 1d4c9\n"
+    b"tscy 446\n"
+    b"tshcy 45b\n"
+    b"tstrok 167\n"
+    b"twixt 226c\n"
+    b"twoheadleftarrow 219e\n"
+    b"twoheadrightarrow 21a0\n"
+    b"uArr 21d1\n"
+    b"uHar 2963\n"
+    b"uacute fa\n"
+    b"uarr 2191\n"
+    b"ubrcy 45e\n"
+    b"ubreve 16d\n"
+    b"ucirc fb\n"
+    b"ucy 443\n"
+    b"udarr 21c5\n"
+    b"udblac 171\n"
+    b"udhar 296e\n"
+    b"ufisht 297e\n"
+    b"ufr 1d532\n"
+    b"ugrave f9\n"
+    b"uharl 21bf\n"
+    b"uharr 21be\n"
+    b"uhblk 2580\n"
+    b"ulcorn 231c\n"
+    b"ulcorner 231c\n"
+    b"ulcrop 230f\n"
+    b"ultri 25f8\n"
+    b"umacr 16b\n"
+    b"uml a8\n"
+    b"uogon 173\n"
+    b"uopf 1d566\n"
+    b"uparrow 2191\n"
+    b"updownarrow 2195\n"
+    b"upharpoonleft 21bf\n"
+    b"upharpoonright 21be\n"
+    b"uplus 228e\n"
+    b"upsi 3c5\n"
+    b"upsih 3d2\n"
+    b"upsilon 3c5\n"
+    b"upuparrows 21c8\n"
+    b"urcorn 231d\n"
+    b"urcorner 231d\n"
+    b"urcrop 230e\n"
+    b"uring 16f\n"
+    b"urtri 25f9\n"
+    b"uscr 1d4ca\n"
+    b"utdot 22f0\n"
+    b"utilde 169\n"
+    b"utri 25b5\n"
+    b"utrif 25b4\n"
+    b"uuarr 21c8\n"
+    b"uuml fc\n"
+    b"uwangle 29a7\n"
+    b"vArr 21d5\n"
+    b"vBar 2ae8\n"
+    b"vBarv 2ae9\n"
+    b"vDash 22a8\n"
+    b"vangrt 299c\n"
+    b"varepsilon 3f5\n"
+    b"varkappa 3f0\n"
+    b"varnothing 2205\n"
+    b"varphi 3d5\n"
+    b"varpi 3d6\n"
+    b"varpropto 221d\n"
+    b"varr 2195\n"
+    b"varrho 3f1\n"
+    b"varsigma 3c2\n"
+    b"varsubsetneq 228a fe00\n"
+    b"varsubsetneqq 2acb fe00\n"
+    b"varsupsetneq 228b fe00\n"
+    b"varsupsetneqq 2acc fe00\n"
+    b"vartheta 3d1\n"
+    b"vartriangleleft 22b2\n"
+    b"vartriangleright 22b3\n"
+    b"vcy 432\n"
+    b"vdash 22a2\n"
+    b"vee 2228\n"
+    b"veebar 22bb\n"
+    b"veeeq 225a\n"
+    b"vellip 22ee\n"
+    b"verbar 7c\n"
+    b"vert 7c\n"
+    b"vfr 1d533\n"
+    b"vltri 22b2\n"
+    b"vnsub 2282 20d2\n"
+    b"vnsup 2283 20d2\n"
+    b"vopf 1d567\n"
+    b"vprop 221d\n"
+    b"vrtri 22b3\n"
+    b"vscr 1d4cb\n"
+    b"vsubnE 2acb fe00\n"
+    b"vsubne 228a fe00\n"
+    b"vsupnE 2acc fe00\n"
+    b"vsupne 228b fe00\n"
+    b"vzigzag 299a\n"
+    b"wcirc 175\n"
+    b"wedbar 2a5f\n"
+    b"wedge 2227\n"
+    b"wedgeq 2259\n"
+    b"weierp 2118\n"
+    b"wfr 1d534\n"
+    b"wopf 1d568\n"
+    b"wp 2118\n"
+    b"wr 2240\n"
+    b"wreath 2240\n"
+    b"wscr 1d4cc\n"
+    b"xcap 22c2\n"
+    b"xcirc 25ef\n"
+    b"xcup 22c3\n"
+    b"xdtri 25bd\n"
+    b"xfr 1d535\n"
+    b"xhArr 27fa\n"
+    b"xharr 27f7\n"
+    b"xi 3be\n"
+    b"xlArr 27f8\n"
+    b"xlarr 27f5\n"
+    b"xmap 27fc\n"
+    b"xnis 22fb\n"
+    b"xodot 2a00\n"
+    b"xopf 1d569\n"
+    b"xoplus 2a01\n"
+    b"xotime 2a02\n"
+    b"xrArr 27f9\n"
+    b"xrarr 27f6\n"
+    b"xscr 1d4cd\n"
+    b"xsqcup 2a06\n"
+    b"xuplus 2a04\n"
+    b"xutri 25b3\n"
+    b"xvee 22c1\n"
+    b"xwedge 22c0\n"
+    b"yacute fd\n"
+    b"yacy 44f\n"
+    b"ycirc 177\n"
+    b"ycy 44b\n"
+    b"yen a5\n"
+    b"yfr 1d536\n"
+    b"yicy 457\n"
+    b"yopf 1d56a\n"
+    b"yscr 1d4ce\n"
+    b"yucy 44e\n"
+    b"yuml ff\n"
+    b"zacute 17a\n"
+    b"zcaron 17e\n"
+    b"zcy 437\n"
+    b"zdot 17c\n"
+    b"zeetrf 2128\n"
+    b"zeta 3b6\n"
+    b"zfr 1d537\n"
+    b"zhcy 436\n"
+    b"zigrarr 21dd\n"
+    b"zopf 1d56b\n"
+    b"zscr 1d4cf\n"
+    b"zwj 200d\n"
+    b"zwnj 200c\n"
+)
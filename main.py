@@ -70,7 +70,6 @@ app = dut_clock.App(
 )
 app.tft.fill(TFT.WHITE)
 prev_day = -1
-prev_hour = -1
 today_schedule = app.get_schedule()
 decorate_text = "Lich hoc hom nay"
 
@@ -81,6 +80,12 @@ while True:
     schedule_week = app.current_week
     update_schedule_flag = False
 
+    # the schedule was refreshed by the network task, redo today's schedule
+    # from scratch
+    if app.schedule_changed:
+        app.schedule_changed = False
+        prev_day = -1
+
     if datetime[2] != prev_day:
         print("updating schedule ...")
         app.calculate_current_week()
@@ -89,21 +94,13 @@ while True:
         update_schedule_flag = True
         app.draw_date(datetime[0:3])
 
-    if datetime[3] != prev_hour:
-        print("updating notices ...")
-        app.wifi_active()
-        app.update_general_notices_tab()
-        app.update_class_notices_tab()
-        app.wifi_deactive()
-        prev_hour = datetime[3]
-
     if decorate_text == "Lich hoc hom nay":
         get_next_day = False
 
         # get next day's schedule if today schedule is done
         if len(today_schedule) > 0:
             last_class = today_schedule[-1]
-            last_class_end_period = dut_clock.PERIOD[last_class["end_period"]][1]
+            last_class_end_period = dut_clock.PERIOD[last_class.end_period][1]
             _, _, _, hour, min, sec, _, _ = datetime
 
             if f"{hour:02d}:{min:02d}:{sec:02d}" >= f"{last_class_end_period[0]:02d}:{last_class_end_period[1]:02d}:00":
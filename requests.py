@@ -24,28 +24,546 @@
 # https://github.com/micropython/micropython-lib/blob/master/python-ecosys/requests/requests/__init__.py
 
 import socket
+import time
+import os
+import io
+
+# keep-alive connections of the requests made with keep_alive=True, by
+# (proto, host, port), each a list of (connection, _ticks_ms when it was put
+# back), oldest first
+POOL_MAX_SIZE = 2
+# a pooled connection idle for longer than this (in seconds) is closed
+# instead of reused, servers drop them after a while anyway
+POOL_IDLE_TIMEOUT = 30
+# on close, up to this many unread body bytes are read and thrown away to
+# keep the connection, a bigger rest is not worth it
+POOL_DRAIN_MAX = 4096
+
+_pool = {}
+_apool = {}
+
+
+def _pool_get(pool, key, close):
+    # return the most recently used live connection to key, or None
+    conns = pool.get(key)
+    if not conns:
+        return None
+    conn, released = conns.pop()
+    if _ticks_diff(_ticks_ms(), released) <= POOL_IDLE_TIMEOUT * 1000:
+        return conn
+    # the others are older still
+    close(conn)
+    while conns:
+        close(conns.pop()[0])
+    return None
+
+
+def _pool_put(pool, key, conn, close):
+    conns = pool.setdefault(key, [])
+    if len(conns) >= POOL_MAX_SIZE:
+        close(conns.pop(0)[0])
+    conns.append((conn, _ticks_ms()))
+
+
+def _close_socket(s):
+    try:
+        s.close()
+    except OSError:
+        pass
+
+
+def _close_stream(conn):
+    try:
+        conn[1].close()
+    except OSError:
+        pass
+
+
+def close_pool():
+    # close every idle keep-alive connection, e.g. before the network goes
+    # down, the TLS state of each one holds a fair amount of RAM
+    for conns in _pool.values():
+        for conn, _ in conns:
+            _close_socket(conn)
+    _pool.clear()
+    for conns in _apool.values():
+        for conn, _ in conns:
+            _close_stream(conn)
+    _apool.clear()
+
+
+# the wall clock jumps when NTP sets it, ages and deadlines are measured with
+# these instead
+if hasattr(time, "ticks_us"):
+    _ticks_us = time.ticks_us
+    _ticks_ms = time.ticks_ms
+    _ticks_add = time.ticks_add
+    _ticks_diff = time.ticks_diff
+else:
+    def _ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def _ticks_ms():
+        return time.perf_counter_ns() // 1000000
+
+    def _ticks_add(a, b):
+        return a + b
+
+    def _ticks_diff(a, b):
+        return a - b
+
+
+# how long each phase of the requests took, by host. Response.timings has
+# those of one request, in microseconds:
+#   dns      resolving the host (from the cache most of the time)
+#   connect  the TCP connection, and the TLS handshake too for arequest
+#   tls      the TLS handshake
+#   ttfb     from sending the request until the response head is in
+#   body     from the end of the head until the body is read or closed
+# a pooled connection has no dns, connect or tls
+TIMING_PHASES = ("dns", "connect", "tls", "ttfb", "body")
+# every phase of a host has a histogram of TIMING_BUCKETS counts: bucket 0
+# is under 1 ms, bucket i from 2^(i-1) to 2^i ms and the last one anything
+# longer. once a histogram holds TIMING_WINDOW requests all its counts are
+# halved, so the old ones fade out
+TIMING_BUCKETS = 16
+TIMING_WINDOW = 64
+
+_histograms = {}
+
+
+def _timing_bucket(us):
+    ms = us // 1000
+    i = 0
+    while ms and i < TIMING_BUCKETS - 1:
+        ms >>= 1
+        i += 1
+    return i
+
+
+def _record_timing(timings, host, phase, start):
+    # store how long phase took since start (_ticks_us) in timings, and in
+    # the histogram of host
+    us = _ticks_diff(_ticks_us(), start)
+    timings[phase] = us
+    phases = _histograms.setdefault(host, {})
+    counts = phases.get(phase)
+    if counts is None:
+        counts = [0] * TIMING_BUCKETS
+        phases[phase] = counts
+    counts[_timing_bucket(us)] += 1
+    if sum(counts) >= TIMING_WINDOW:
+        for i in range(TIMING_BUCKETS):
+            counts[i] >>= 1
+
+
+def timing_histograms():
+    # {host: {phase: counts}}, see TIMING_BUCKETS
+    return _histograms
+
+
+def clear_timing_histograms():
+    _histograms.clear()
+
+
+def timing_percentile(counts, p):
+    # upper bound in ms of the bucket the p-th percentile of a histogram
+    # falls in (for the last bucket only a lower bound), None if it is empty
+    total = sum(counts)
+    if not total:
+        return None
+    seen = 0
+    for i in range(TIMING_BUCKETS):
+        seen += counts[i]
+        if seen * 100 >= total * p:
+            break
+    return 1 << i
+
+
+# resolved addresses by (host, port), each [getaddrinfo entry or None after a
+# failed lookup, _ticks_ms when it expires, last entry that resolved]. the
+# TTLs are in seconds
+DNS_TTL = 300
+DNS_NEGATIVE_TTL = 15
+
+_dns = {}
+# file with the last address each host resolved to, used when the resolver
+# fails (often right after joining the AP), None to keep nothing on flash
+_dns_file = None
+_dns_saved = None
+
+
+def set_dns_cache_file(path):
+    global _dns_file, _dns_saved
+    _dns_file = path
+    _dns_saved = None
+
+
+def _load_dns_file():
+    global _dns_saved
+    if _dns_saved is None:
+        _dns_saved = {}
+        try:
+            import json
+
+            with open(_dns_file) as f:
+                _dns_saved = json.load(f)
+        except (OSError, ValueError):
+            pass
+    return _dns_saved
+
+
+def _save_dns_address(name, ip):
+    saved = _load_dns_file()
+    if saved.get(name) == ip:
+        return
+    saved[name] = ip
+    try:
+        import json
+
+        with open(_dns_file, "w") as f:
+            json.dump(saved, f)
+    except OSError:
+        pass
+
+
+def _saved_address(key):
+    if _dns_file is None:
+        return None
+    ip = _load_dns_file().get("%s:%d" % key)
+    if ip is None:
+        return None
+    # a numeric address does not go to the resolver
+    return socket.getaddrinfo(ip, key[1], 0, socket.SOCK_STREAM)[0]
+
+
+def _resolve(host, port):
+    # getaddrinfo entry of host, from the cache while it is fresh. a failed
+    # lookup is not tried again for DNS_NEGATIVE_TTL, the last address that
+    # resolved (from memory or flash) is used in the meantime if there is one
+    key = (host, port)
+    entry = _dns.get(key)
+    now = _ticks_ms()
+    if entry is None or _ticks_diff(now, entry[1]) >= 0:
+        last_good = entry[2] if entry is not None else None
+        try:
+            ai = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0]
+        except OSError:
+            entry = [None, _ticks_add(now, DNS_NEGATIVE_TTL * 1000), last_good]
+            _dns[key] = entry
+        else:
+            _dns[key] = [ai, _ticks_add(now, DNS_TTL * 1000), ai]
+            if _dns_file is not None:
+                _save_dns_address("%s:%d" % key, ai[-1][0])
+            return ai
+
+    if entry[0] is not None:
+        return entry[0]
+    if entry[2] is None:
+        entry[2] = _saved_address(key)
+    if entry[2] is None:
+        raise OSError("cannot resolve " + host)
+    return entry[2]
+
+
+def clear_dns_cache():
+    _dns.clear()
+
+
+# opt-in cache of the responses to the GET requests made with cache=True, by
+# url. a response with an ETag or a Last-Modified has its body kept on flash
+# and the next request for the url is conditional, a 304 is answered from
+# flash. without validators only a hash of the body is kept, so a body that
+# has not changed is still told apart (Response.unchanged) and the caller can
+# skip parsing it again
+RESPONSE_CACHE_MAX_ENTRIES = 16
+# a bigger body is only hashed, never kept
+RESPONSE_CACHE_MAX_BODY = 64 * 1024
+RESPONSE_CACHE_INDEX = "index.json"
+
+# directory of the cache, None to cache nothing
+_cache_dir = None
+# url to [etag, last modified, body hash, whether the body is on flash, time
+# it was stored], loaded from the index file on first use
+_cache_index = None
+
+
+def set_response_cache_dir(path):
+    global _cache_dir, _cache_index
+    if path is not None:
+        try:
+            os.mkdir(path)
+        except OSError:
+            pass
+    _cache_dir = path
+    _cache_index = None
+
+
+def _load_cache_index():
+    global _cache_index
+    if _cache_index is None:
+        _cache_index = {}
+        try:
+            import json
+
+            with open(_cache_dir + "/" + RESPONSE_CACHE_INDEX) as f:
+                _cache_index = json.load(f)
+        except (OSError, ValueError):
+            pass
+    return _cache_index
+
+
+def _save_cache_index():
+    try:
+        import json
+
+        with open(_cache_dir + "/" + RESPONSE_CACHE_INDEX, "w") as f:
+            json.dump(_cache_index, f)
+    except OSError:
+        pass
+
+
+def _hex_digest(h):
+    import binascii
+
+    return str(binascii.hexlify(h.digest()[:8]), "ascii")
+
+
+def _cache_path(url):
+    import hashlib
+
+    return _cache_dir + "/" + _hex_digest(hashlib.sha256(url.encode()))
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _cache_lookup(url, headers):
+    # return the cache entry of url or None, if its body is on flash the
+    # request is made conditional
+    entry = _load_cache_index().get(url)
+    if entry is None:
+        return None
+    etag, modified, _, stored, _ = entry
+    if stored:
+        if etag is not None and "If-None-Match" not in headers:
+            headers["If-None-Match"] = etag
+        if modified is not None and "If-Modified-Since" not in headers:
+            headers["If-Modified-Since"] = modified
+    return entry
+
+
+def _cached_body(url):
+    # open the body kept for url, to answer a 304
+    try:
+        return open(_cache_path(url), "rb")
+    except OSError:
+        # gone from flash, the next request is not conditional anymore
+        _load_cache_index().pop(url, None)
+        _save_cache_index()
+        raise OSError("cached body of %s is gone" % url)
+
+
+def clear_response_cache():
+    if _cache_dir is None:
+        return
+    for url in _load_cache_index():
+        _remove_file(_cache_path(url))
+    _cache_index.clear()
+    _save_cache_index()
+
+
+class _CacheWriter:
+    # hashes a response body as it is read, and writes it to flash too if
+    # the server gave validators for it. once the whole body went through
+    # finish() updates the cache entry, a body that is not read to the end
+    # is not cached
+    def __init__(self, url, entry, etag, modified):
+        import hashlib
+
+        self.url = url
+        self.entry = entry
+        self.etag = etag
+        self.modified = modified
+        self.h = hashlib.sha256()
+        self.path = _cache_path(url)
+        self.size = 0
+        self.f = None
+        self.done = False
+        if etag is not None or modified is not None:
+            try:
+                self.f = open(self.path + ".tmp", "wb")
+            except OSError:
+                pass
+
+    def _drop_body(self):
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+            _remove_file(self.path + ".tmp")
+
+    def feed(self, data):
+        self.h.update(data)
+        if self.f is None:
+            return
+        self.size += len(data)
+        if self.size > RESPONSE_CACHE_MAX_BODY:
+            self._drop_body()
+        else:
+            self.f.write(data)
+
+    def abort(self):
+        self.done = True
+        self._drop_body()
+
+    def finish(self):
+        # return True if the body is the same as the cached one
+        self.done = True
+        body_hash = _hex_digest(self.h)
+        entry = self.entry
+        unchanged = entry is not None and entry[2] == body_hash
+        stored = self.f is not None
+        if stored:
+            self.f.close()
+            self.f = None
+            if unchanged and entry[3]:
+                # the same body is on flash already
+                _remove_file(self.path + ".tmp")
+            else:
+                _remove_file(self.path)
+                os.rename(self.path + ".tmp", self.path)
+        elif entry is not None and entry[3]:
+            _remove_file(self.path)
+
+        if unchanged and entry[:4] == [self.etag, self.modified, body_hash, stored]:
+            # nothing to write
+            return True
+
+        index = _load_cache_index()
+        index[self.url] = [self.etag, self.modified, body_hash, stored, time.time()]
+        while len(index) > RESPONSE_CACHE_MAX_ENTRIES:
+            oldest = min(index, key=lambda k: index[k][4])
+            if index[oldest][3]:
+                _remove_file(_cache_path(oldest))
+            del index[oldest]
+        _save_cache_index()
+        return unchanged
+
+
+class _CacheTee:
+    # file-like view of a response body that goes through a _CacheWriter on
+    # its way to the caller, resp.unchanged is set once the end is reached
+    # f is what the caller reads (body, or the inflater over it) and body
+    # the _Body that tells if the end is the one the server announced
+    def __init__(self, f, body, writer, resp):
+        self.f = f
+        self.body = body
+        self.writer = writer
+        self.resp = resp
+
+    def _end(self):
+        if self.writer.done:
+            return
+        # past the end of a compressed stream the body may still have its
+        # last chunk to read, anything else there is not a body to keep
+        if not self.body.read(1) and self.body.state.complete():
+            self.resp.unchanged = self.writer.finish()
+        else:
+            self.writer.abort()
+
+    def read(self, n=-1):
+        data = self.f.read(n)
+        if data:
+            self.writer.feed(data)
+        if n < 0 or (n > 0 and not data):
+            self._end()
+        return data
+
+    def readinto(self, buf):
+        n = self.f.readinto(buf)
+        if n:
+            self.writer.feed(memoryview(buf)[:n])
+        elif len(buf):
+            self._end()
+        return n
+
+    def readline(self):
+        l = self.f.readline()
+        if l:
+            self.writer.feed(l)
+        else:
+            self._end()
+        return l
+
+    def close(self):
+        if not self.writer.done:
+            self.writer.abort()
+        self.f.close()
+
+
+# size of the reads content makes when the body has to be counted
+CONTENT_CHUNK_SIZE = 1024
+
+
+def _too_big(max_bytes):
+    return ValueError("response bigger than %d bytes" % max_bytes)
 
 
 class Response:
-    def __init__(self, f):
+    def __init__(self, f, max_bytes=None):
         self.raw = f
         self.encoding = "utf-8"
         self._cached = None
+        # reading more than max_bytes of the body closes the response and
+        # raises ValueError, None for no limit
+        self.max_bytes = max_bytes
+        self._received = 0
+        # how long each phase of the request took, in microseconds, see
+        # TIMING_PHASES. the body is timed from _body_start until the
+        # response is released
+        self.timings = {}
+        self._host = None
+        self._body_start = None
+        # socket writes made to send the request, and the TLS records they
+        # made up
+        self.writes = 0
+        self.tls_records = 0
+        # True if the body is the same as the last time the url was
+        # requested with cache=True, known once it has been read to the end
+        # (right away for a 304 answered from flash)
+        self.unchanged = False
 
-    def close(self):
+    def _release(self):
         if self.raw:
             self.raw.close()
             self.raw = None
+            if self._body_start is not None:
+                _record_timing(self.timings, self._host, "body", self._body_start)
+
+    def close(self):
+        self._release()
         self._cached = None
 
+    def _count(self, n):
+        self._received += n
+        if self.max_bytes is not None and self._received > self.max_bytes:
+            self.close()
+            raise _too_big(self.max_bytes)
+
     @property
     def content(self):
         if self._cached is None:
+            if self.max_bytes is not None:
+                self._cached = b"".join(self.iter_content(CONTENT_CHUNK_SIZE))
+                return self._cached
             try:
                 self._cached = self.raw.read()
             finally:
-                self.raw.close()
-                self.raw = None
+                self._release()
         return self._cached
 
     @property
@@ -57,36 +575,44 @@ class Response:
 
         return json.loads(self.content)
 
+    def iter_content(self, chunk_size=1024):
+        # yield the body chunk_size bytes at most at a time, the response is
+        # closed at the end
+        try:
+            while True:
+                data = self.raw.read(chunk_size)
+                if not data:
+                    break
+                self._count(len(data))
+                yield data
+        finally:
+            self.close()
 
-def request(
-    method,
-    url,
-    data=None,
-    json=None,
-    headers=None,
-    stream=None,
-    auth=None,
-    timeout=None,
-    parse_headers=True,
-):
-    if headers is None:
-        headers = {}
-    else:
-        headers = headers.copy()
-
-    redirect = None  # redirection url, None means no redirection
-    chunked_data = data and getattr(data, "__next__", None) and not getattr(data, "__len__", None)
+    def readinto(self, buf):
+        # read the next part of the body into buf, return how many bytes were
+        # read, 0 at the end
+        n = self.raw.readinto(buf)
+        if not n:
+            return 0
+        self._count(n)
+        return n
 
-    if auth is not None:
-        import binascii
+    def iter_lines(self):
+        # yield the lines of the body without their line ending
+        try:
+            while True:
+                l = self.raw.readline()
+                if not l:
+                    break
+                self._count(len(l))
+                if l[-1:] == b"\n":
+                    l = l[:-2] if l[-2:] == b"\r\n" else l[:-1]
+                yield l
+        finally:
+            self.close()
 
-        username, password = auth
-        formated = b"{}:{}".format(username, password)
-        formated = str(binascii.b2a_base64(formated)[:-1], "ascii")
-        headers["Authorization"] = "Basic {}".format(formated)
-
-    print("requesting", url)
 
+def _parse_url(url):
     try:
         proto, dummy, host, path = url.split("/", 3)
     except ValueError:
@@ -95,8 +621,6 @@ def request(
     if proto == "http:":
         port = 80
     elif proto == "https:":
-        import tls
-
         port = 443
     else:
         raise ValueError("Unsupported protocol: " + proto)
@@ -105,12 +629,503 @@ def request(
         host, port = host.split(":", 1)
         port = int(port)
 
-    ai = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
-    ai = ai[0]
+    return proto, host, port, path
+
+
+def _tls_context():
+    try:
+        import tls
+    except ImportError:
+        # CPython, only used by the asyncio client
+        import ssl as tls
+
+    context = tls.SSLContext(tls.PROTOCOL_TLS_CLIENT)
+    if hasattr(context, "check_hostname"):
+        context.check_hostname = False
+    context.verify_mode = tls.CERT_NONE
+    return context
+
+
+def _prepare_body(headers, host, data, json, chunked_data):
+    # fill in the headers that depend on the body, return the body to send
+    if "Host" not in headers:
+        headers["Host"] = host
+
+    if json is not None:
+        assert data is None
+        from json import dumps
+
+        data = dumps(json)
+
+        if "Content-Type" not in headers:
+            headers["Content-Type"] = "application/json"
+
+    if data:
+        if chunked_data:
+            if "Transfer-Encoding" not in headers and "Content-Length" not in headers:
+                headers["Transfer-Encoding"] = "chunked"
+        elif "Content-Length" not in headers:
+            headers["Content-Length"] = str(len(data))
+
+    if "Connection" not in headers:
+        headers["Connection"] = "close"
+
+    return data
+
+
+def _parse_status_line(l):
+    l = l.split(None, 2)
+    if len(l) < 2:
+        # Invalid response
+        raise ValueError("HTTP error: BadStatusLine:\n%s" % l)
+    status = int(l[1])
+    reason = ""
+    if len(l) > 2:
+        reason = l[2].rstrip()
+    return status, reason
+
+
+def _parse_header_line(l, status, resp_d, parse_headers, framing=None):
+    # return the redirection url if l is a Location header of a redirect
+    # framing, if given, gets the Content-Length and whether the server will
+    # close the connection, whatever parse_headers is
+    redirect = None
+    if framing is not None:
+        name = l[:18].lower()
+        if name.startswith(b"content-length:"):
+            framing["length"] = int(l[15:])
+        elif name.startswith(b"connection:") and b"close" in l.lower():
+            framing["close"] = True
+        elif name == b"transfer-encoding:" and b"chunked" in l.lower():
+            framing["chunked"] = True
+        elif name.startswith(b"content-encoding:"):
+            framing["encoding"] = str(l[17:].strip().lower(), "ascii")
+        elif name.startswith(b"etag:"):
+            framing["etag"] = str(l[5:].strip(), "ascii")
+        elif name.startswith(b"last-modified:"):
+            framing["modified"] = str(l[14:].strip(), "ascii")
+    if l.startswith(b"Location:") and not 200 <= status <= 299:
+        if status in [301, 302, 303, 307, 308]:
+            redirect = str(l[10:-2], "utf-8")
+        else:
+            raise NotImplementedError("Redirect %d not yet supported" % status)
+    if parse_headers is False:
+        pass
+    elif parse_headers is True:
+        l = str(l, "utf-8")
+        k, v = l.split(":", 1)
+        resp_d[k] = v.strip()
+    else:
+        parse_headers(l, resp_d)
+    return redirect
+
+
+def _resolve_redirect(redirect, url):
+    # a relative Location is taken from the origin of the request url
+    if redirect[0] == '/':
+        proto, dummy, host = url.split("/", 3)[:3]
+        redirect = proto + "//" + host + redirect
+    return redirect
+
+
+def _new_framing(method, keep_alive):
+    # framing of a response to method, the body of a response to HEAD is
+    # always empty
+    return {
+        "length": 0 if method == "HEAD" else None,
+        "chunked": False,
+        "close": not keep_alive,
+        "encoding": None,
+        "etag": None,
+        "modified": None,
+    }
+
+
+def _body_mode(framing, status, key):
+    # how to read the body: (length, chunked, key), a length of None (and
+    # not chunked) is read until the connection closes, key is None if the
+    # connection can not go back to the pool
+    if framing["close"]:
+        key = None
+    if status == 204 or status == 304 or 100 <= status < 200:
+        return 0, False, key
+    if framing["chunked"]:
+        return None, True, key
+    if framing["length"] is None:
+        return None, False, None
+    return framing["length"], False, key
+
+
+def _closed_early():
+    # a body cut off before its length or its last chunk is an error, never
+    # a short body
+    return OSError("connection closed before the end of the body")
+
+
+def _chunk_line(l):
+    if not l:
+        raise _closed_early()
+    return l
+
+
+def _parse_chunk_size(l):
+    # the size of the chunk from its size line, extensions are ignored
+    return int(_chunk_line(l).split(b";", 1)[0].strip(), 16)
+
+
+# what _BodyState.want() asks for when the next thing to read is a line
+_LINE = None
+
+# the line a chunked body waits for
+_CHUNK_SIZE = 0
+_CHUNK_END = 1
+_TRAILER = 2
+
+
+class _BodyState:
+    # where a response body ends and how much of the connection can be read
+    # without crossing it, shared by the blocking reads (_Body) and the
+    # coroutine ones (AsyncResponse) that only differ in how they read the
+    # connection. want() tells what to read next, the caller reads it and
+    # hands it over to line() or got()
+    # a body of unknown length (and not chunked) ends when the connection
+    # closes, a chunked one holds only the size line of the chunk being read
+    def __init__(self, length, chunked):
+        self.chunked = chunked
+        self.until_close = length is None and not chunked
+        # left in the body (or in the current chunk), None until the
+        # connection closes, -1 once it broke
+        self.remaining = 0 if chunked else length
+        self.line_state = _CHUNK_SIZE
+        # the end of the body has been read
+        self.done = length == 0 and not chunked
+
+    def want(self, n):
+        # _LINE, or how many bytes to read at most: n, everything that can be
+        # read if n < 0 (-1 until the connection closes), 0 at the end
+        r = self.remaining
+        if self.done or (r is not None and r < 0):
+            return 0
+        if r is None:
+            return n
+        if r > 0:
+            return r if n < 0 else min(n, r)
+        return _LINE
+
+    def line(self, l):
+        _chunk_line(l)
+        if self.line_state == _CHUNK_SIZE:
+            size = _parse_chunk_size(l)
+            if size:
+                self.remaining = size
+                # the CRLF after the data
+                self.line_state = _CHUNK_END
+            else:
+                self.line_state = _TRAILER
+        elif self.line_state == _CHUNK_END:
+            self.line_state = _CHUNK_SIZE
+        elif l == b"\r\n":
+            # the end of the trailers
+            self.done = True
+
+    def got(self, n):
+        # n bytes of the body were read, 0 when the connection closed
+        if not n:
+            if self.until_close:
+                self.done = True
+                return
+            # the server hung up early, the connection is not reusable
+            self.remaining = -1
+            raise _closed_early()
+        if self.remaining is not None:
+            self.remaining -= n
+            if self.remaining == 0 and not self.chunked:
+                self.done = True
+
+    def complete(self):
+        # whether the body was read up to the end the server announced, its
+        # length or its last chunk. a body that ends when the connection
+        # closes can not tell an early hangup from its end
+        return self.done and not self.until_close
+
+    def drainable(self):
+        # whether the rest can be read and thrown away to keep the connection
+        return self.remaining is not None and 0 <= self.remaining <= POOL_DRAIN_MAX
+
+
+# size of the reads readline() makes to find the end of a line
+READLINE_SIZE = 256
 
-    resp_d = None
-    if parse_headers is not False:
-        resp_d = {}
+
+class _Body:
+    # file-like view of a response body, the connection goes back to the
+    # pool (if key is not None) once the body has been read
+    def __init__(self, s, length, chunked, key):
+        self.s = s
+        self.state = _BodyState(length, chunked)
+        self.key = key
+        # read past the end of a line by readline()
+        self._pending = b""
+
+    def _want(self, n):
+        state = self.state
+        while True:
+            k = state.want(n)
+            if k is not _LINE:
+                return k
+            state.line(self.s.readline())
+
+    def read(self, n=-1):
+        if n < 0:
+            # the whole rest, in as many reads as it takes
+            parts = []
+            if self._pending:
+                parts.append(self._pending)
+                self._pending = b""
+            while True:
+                k = self._want(-1)
+                if k == 0:
+                    break
+                data = self.s.read(k) if k > 0 else self.s.read()
+                self.state.got(len(data))
+                if not data:
+                    break
+                parts.append(data)
+            return b"".join(parts)
+
+        if self._pending:
+            data = self._pending[:n]
+            self._pending = self._pending[n:]
+            return data
+
+        k = self._want(n)
+        if k == 0:
+            return b""
+        data = self.s.read(k)
+        self.state.got(len(data))
+        return data
+
+    def readinto(self, buf):
+        if self._pending:
+            n = min(len(buf), len(self._pending))
+            buf[:n] = self._pending[:n]
+            self._pending = self._pending[n:]
+            return n
+
+        k = self._want(len(buf))
+        if k == 0:
+            return 0
+        got = self.s.readinto(memoryview(buf)[:k])
+        self.state.got(got)
+        return got
+
+    def readline(self):
+        # only what is past the newline is kept back, never the whole body
+        line = self._pending
+        self._pending = b""
+        while True:
+            i = line.find(b"\n")
+            if i >= 0:
+                self._pending = line[i + 1:]
+                return line[:i + 1]
+            data = self.read(READLINE_SIZE)
+            if not data:
+                return line
+            line += data
+
+    def close(self):
+        if self.s is None:
+            return
+        state = self.state
+        if self.key is not None and state.drainable():
+            try:
+                left = POOL_DRAIN_MAX
+                while left > 0 and not state.done:
+                    data = self.read(left)
+                    if not data:
+                        break
+                    left -= len(data)
+            except (OSError, ValueError):
+                state.remaining = -1
+
+        s = self.s
+        self.s = None
+        self._pending = b""
+        if self.key is not None and state.done:
+            _pool_put(_pool, self.key, s, _close_socket)
+        else:
+            _close_socket(s)
+
+
+# the Content-Encodings that can be decompressed
+INFLATE_ENCODINGS = ("gzip", "deflate")
+# size of the reads of compressed data made by _Inflate
+INFLATE_READ_SIZE = 512
+
+_can_inflate = None
+
+
+def can_inflate():
+    global _can_inflate
+    if _can_inflate is None:
+        try:
+            import deflate
+        except ImportError:
+            try:
+                import zlib
+            except ImportError:
+                zlib = None
+            deflate = zlib
+        _can_inflate = deflate is not None
+    return _can_inflate
+
+
+def _decompressobj():
+    # incremental inflater of a gzip or zlib stream, None where there is none
+    # (MicroPython only has deflate.DeflateIO, that pulls from a stream)
+    try:
+        import zlib
+
+        # 32 + 15: gzip or zlib header, 32 KiB window
+        return zlib.decompressobj(47)
+    except (ImportError, AttributeError):
+        return None
+
+
+_can_ainflate = None
+
+
+def can_ainflate():
+    # whether arequest can inflate a body as it arrives, which takes
+    # zlib.decompressobj. deflate.DeflateIO pulls its input from a blocking
+    # stream and cannot be handed the pieces a coroutine reads, so where it
+    # is all there is (MicroPython) arequest does not ask for compression
+    global _can_ainflate
+    if _can_ainflate is None:
+        _can_ainflate = _decompressobj() is not None
+    return _can_ainflate
+
+
+def _inflate(d, data, n):
+    # inflate at most n bytes out of data, the compressed bytes just read
+    # (or d.unconsumed_tail)
+    if not data:
+        # the body ended before the compressed stream did
+        raise _closed_early()
+    return d.decompress(data, n)
+
+
+def _inflater(f):
+    # decompressing view of f, a gzip or zlib stream. the window is the one
+    # the stream was compressed with (32 KiB at most), nothing else grows
+    # with the size of the body
+    try:
+        import deflate
+    except ImportError:
+        return _Inflate(f)
+    return deflate.DeflateIO(_InflateSource(f), deflate.AUTO, 0, True)
+
+
+# MP_STREAM_CLOSE, the ioctl a native stream is closed with
+_STREAM_CLOSE = 4
+
+
+class _InflateSource(io.IOBase):
+    # native stream over f for deflate.DeflateIO, that reads its source
+    # through the stream protocol (a plain object has none) a byte at a
+    # time. those reads are served from a buffer refilled INFLATE_READ_SIZE
+    # bytes at a time
+    def __init__(self, f):
+        super().__init__()
+        self.f = f
+        self.buf = bytearray(INFLATE_READ_SIZE)
+        self.pos = 0
+        self.end = 0
+
+    def readinto(self, buf):
+        if self.pos == self.end:
+            self.pos = 0
+            self.end = self.f.readinto(self.buf)
+            if not self.end:
+                return 0
+        n = min(len(buf), self.end - self.pos)
+        buf[:n] = memoryview(self.buf)[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def ioctl(self, req, arg):
+        if req == _STREAM_CLOSE:
+            self.close()
+        return 0
+
+    def close(self):
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+
+
+class _Inflate(_Body):
+    # stand-in for deflate.DeflateIO on CPython, f is closed with it
+    def __init__(self, f):
+        super().__init__(f, None, False, None)
+        self._d = _decompressobj()
+
+    def read(self, n=-1):
+        if n < 0:
+            parts = [self._pending]
+            self._pending = b""
+            while True:
+                data = self.read(INFLATE_READ_SIZE * 4)
+                if not data:
+                    break
+                parts.append(data)
+            return b"".join(parts)
+
+        if self._pending:
+            data = self._pending[:n]
+            self._pending = self._pending[n:]
+            return data
+
+        while n > 0 and not self._d.eof:
+            data = _inflate(self._d, self._d.unconsumed_tail or self.s.read(INFLATE_READ_SIZE), n)
+            if data:
+                return data
+        return b""
+
+    def readinto(self, buf):
+        data = self.read(len(buf))
+        buf[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if self.s is not None:
+            self.s.close()
+            self.s = None
+        self._pending = b""
+
+
+def _over_limit(framing, max_bytes):
+    # whether the Content-Length alone is over max_bytes, the length of a
+    # compressed body says nothing about the size it inflates to
+    if max_bytes is None or framing["encoding"] in INFLATE_ENCODINGS:
+        return False
+    return framing["length"] is not None and framing["length"] > max_bytes
+
+
+def _open_body(s, framing, status, key):
+    # wrap s so only the body of the response can be read from it, return
+    # that _Body and the view of it to read from, decompressed if needed
+    length, chunked, key = _body_mode(framing, status, key)
+    body = _Body(s, length, chunked, key)
+    if framing["encoding"] in INFLATE_ENCODINGS and length != 0:
+        return body, _inflater(body)
+    return body, body
+
+
+def _connect(proto, host, port, timeout, timings):
+    start = _ticks_us()
+    ai = _resolve(host, port)
+    _record_timing(timings, host, "dns", start)
 
     s = socket.socket(ai[0], socket.SOCK_STREAM, ai[2])
 
@@ -120,101 +1135,211 @@ def request(
         s.settimeout(timeout)
 
     try:
+        start = _ticks_us()
         s.connect(ai[-1])
+        _record_timing(timings, host, "connect", start)
         if proto == "https:":
-            context = tls.SSLContext(tls.PROTOCOL_TLS_CLIENT)
-            context.verify_mode = tls.CERT_NONE
-            s = context.wrap_socket(s, server_hostname=host)
-        s.write(b"%s /%s HTTP/1.0\r\n" % (method, path))
-
-        if "Host" not in headers:
-            headers["Host"] = host
+            start = _ticks_us()
+            s = _tls_context().wrap_socket(s, server_hostname=host)
+            _record_timing(timings, host, "tls", start)
+    except OSError:
+        s.close()
+        raise
+    return s
 
-        if json is not None:
-            assert data is None
-            from json import dumps
 
-            data = dumps(json)
+# the body is sent in writes of at least this size (unless it is smaller),
+# on TLS every write is a record of its own, and a packet or more
+WRITE_SIZE = 1024
+TLS_RECORD_MAX = 16384
 
-            if "Content-Type" not in headers:
-                headers["Content-Type"] = "application/json"
 
-        if data:
-            if chunked_data:
-                if "Transfer-Encoding" not in headers and "Content-Length" not in headers:
-                    headers["Transfer-Encoding"] = "chunked"
-            elif "Content-Length" not in headers:
-                headers["Content-Length"] = str(len(data))
+class _RequestWriter:
+    # serializes a request into one preallocated buffer that is written out
+    # whenever it is full, so the request line and the headers go out in a
+    # single write and the body in WRITE_SIZE ones. counts the writes made
+    def __init__(self, write, tls, method, path, version, headers):
+        self._write = write
+        self.tls = tls
+        self.writes = 0
+        self.tls_records = 0
 
-        if "Connection" not in headers:
-            headers["Connection"] = "close"
+        line = "%s /%s HTTP/%s\r\n" % (method, path, version)
+        size = len(line) + 2
+        for k in headers:
+            size += len(k) + len(headers[k]) + 4
+        self.buf = bytearray(max(size, WRITE_SIZE))
+        self.n = 0
 
+        self.add(line)
         # Iterate over keys to avoid tuple alloc
         for k in headers:
-            s.write(k)
-            s.write(b": ")
-            s.write(headers[k])
-            s.write(b"\r\n")
+            self.add(k)
+            self.add(b": ")
+            self.add(headers[k])
+            self.add(b"\r\n")
+        self.add(b"\r\n")
 
-        s.write(b"\r\n")
+    def _out(self, data):
+        self._write(data)
+        self.writes += 1
+        if self.tls:
+            self.tls_records += (len(data) + TLS_RECORD_MAX - 1) // TLS_RECORD_MAX
 
-        if data:
-            if chunked_data:
-                if headers.get("Transfer-Encoding", None) == "chunked":
-                    for chunk in data:
-                        s.write(b"%x\r\n" % len(chunk))
-                        s.write(chunk)
-                        s.write(b"\r\n")
-                    s.write("0\r\n\r\n")
-                else:
-                    for chunk in data:
-                        s.write(chunk)
-            else:
-                s.write(data)
-
-        # this line causes stuck when this is a redirect url
-        l = s.readline()
-
-        # print(l)
-        l = l.split(None, 2)
-        if len(l) < 2:
-            # Invalid response
-            raise ValueError("HTTP error: BadStatusLine:\n%s" % l)
-        status = int(l[1])
-        reason = ""
-        if len(l) > 2:
-            reason = l[2].rstrip()
-        while True:
+    def add(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        size = len(self.buf)
+        if self.n == 0 and len(data) >= size:
+            # nothing to coalesce with, no need for the copy
+            self._out(data)
+            return
+        data = memoryview(data)
+        i = 0
+        while i < len(data):
+            take = min(len(data) - i, size - self.n)
+            self.buf[self.n:self.n + take] = data[i:i + take]
+            self.n += take
+            i += take
+            if self.n == size:
+                self.flush()
+
+    def add_chunk(self, chunk, chunked):
+        if chunked:
+            self.add(b"%x\r\n" % len(chunk))
+        self.add(chunk)
+        if chunked:
+            self.add(b"\r\n")
+
+    def flush(self):
+        if self.n:
+            self._out(memoryview(self.buf)[:self.n])
+            self.n = 0
+
+
+def _send_request(s, tls, method, path, version, headers, data, chunked_data):
+    w = _RequestWriter(s.write, tls, method, path, version, headers)
+
+    if data:
+        if chunked_data:
+            chunked = headers.get("Transfer-Encoding", None) == "chunked"
+            for chunk in data:
+                w.add_chunk(chunk, chunked)
+            if chunked:
+                w.add(b"0\r\n\r\n")
+        else:
+            w.add(data)
+    w.flush()
+    return w
+
+
+def request(
+    method,
+    url,
+    data=None,
+    json=None,
+    headers=None,
+    stream=None,
+    auth=None,
+    timeout=None,
+    parse_headers=True,
+    keep_alive=False,
+    compressed=False,
+    max_bytes=None,
+    cache=False,
+):
+    # with keep_alive the request is made over HTTP/1.1 on a pooled
+    # connection to the same host if there is one, and the connection is put
+    # back in the pool once the body has been read (or the response closed)
+    # with compressed gzip and deflate are accepted and the body is
+    # decompressed as it is read
+    # max_bytes limits the (decompressed) body read through the Response,
+    # a bigger Content-Length is refused right away
+    # with cache a GET goes through the response cache, see
+    # set_response_cache_dir()
+    if headers is None:
+        headers = {}
+    else:
+        headers = headers.copy()
+
+    chunked_data = data and getattr(data, "__next__", None) and not getattr(data, "__len__", None)
+
+    if auth is not None:
+        import binascii
+
+        username, password = auth
+        formated = b"{}:{}".format(username, password)
+        formated = str(binascii.b2a_base64(formated)[:-1], "ascii")
+        headers["Authorization"] = "Basic {}".format(formated)
+
+    print("requesting", url)
+
+    proto, host, port, path = _parse_url(url)
+
+    if keep_alive and "Connection" not in headers:
+        headers["Connection"] = "keep-alive"
+    if compressed and "Accept-Encoding" not in headers and can_inflate():
+        headers["Accept-Encoding"] = "gzip, deflate"
+    data = _prepare_body(headers, host, data, json, chunked_data)
+    version = "1.1" if keep_alive else "1.0"
+
+    cache = cache and method == "GET" and _cache_dir is not None
+    entry = _cache_lookup(url, headers) if cache else None
+
+    key = (proto, host, port)
+    timings = {}
+    s = None
+    # an iterator body can not be sent twice, so it never goes on a pooled
+    # connection that may turn out to be closed
+    if keep_alive and not chunked_data:
+        s = _pool_get(_pool, key, _close_socket)
+        if s is not None and timeout is not None:
+            s.settimeout(timeout)
+    reused = s is not None
+
+    while True:
+        if s is None:
+            s = _connect(proto, host, port, timeout, timings)
+
+        redirect = None  # redirection url, None means no redirection
+        resp_d = None
+        if parse_headers is not False:
+            resp_d = {}
+        framing = _new_framing(method, keep_alive)
+
+        try:
+            start = _ticks_us()
+            w = _send_request(s, proto == "https:", method, path, version, headers, data, chunked_data)
+
+            # this line causes stuck when this is a redirect url
             l = s.readline()
-            if not l or l == b"\r\n":
-                break
+
             # print(l)
-            if l.startswith(b"Transfer-Encoding:"):
-                if b"chunked" in l:
-                    raise ValueError("Unsupported " + str(l, "utf-8"))
-            elif l.startswith(b"Location:") and not 200 <= status <= 299:
-                if status in [301, 302, 303, 307, 308]:
-                    redirect = str(l[10:-2], "utf-8")
-                else:
-                    raise NotImplementedError("Redirect %d not yet supported" % status)
-            if parse_headers is False:
-                pass
-            elif parse_headers is True:
-                l = str(l, "utf-8")
-                k, v = l.split(":", 1)
-                resp_d[k] = v.strip()
-            else:
-                parse_headers(l, resp_d)
-    except OSError:
-        s.close()
-        raise
+            status, reason = _parse_status_line(l)
+            while True:
+                l = s.readline()
+                if not l or l == b"\r\n":
+                    break
+                # print(l)
+                location = _parse_header_line(l, status, resp_d, parse_headers, framing)
+                if location:
+                    redirect = location
+            _record_timing(timings, host, "ttfb", start)
+        except (OSError, ValueError):
+            s.close()
+            if not reused:
+                raise
+            # the server closed the pooled connection, try a new one
+            s = None
+            reused = False
+            continue
+        break
 
-    if redirect:
-        if redirect[0] == '/':
-            # temporal fix
-            redirect = "https://sv.dut.udn.vn" + redirect
+    # only what the url itself answered is cached
+    cache = cache and not redirect
 
-        url = redirect
+    if redirect:
+        url = _resolve_redirect(redirect, url)
 
         # disable redirect because it does not work properly
         redirect = None
@@ -230,7 +1355,26 @@ def request(
         else:
             return request(method, redirect, data, json, headers, stream)
     else:
-        resp = Response(s)
+        if cache and status == 304 and entry is not None and entry[3]:
+            # answered from flash, the empty body puts the connection back
+            # in the pool
+            _open_body(s, framing, status, key)[0].close()
+            resp = Response(_cached_body(url), max_bytes)
+            resp.unchanged = True
+            status = 200
+        else:
+            body, f = _open_body(s, framing, status, key)
+            resp = Response(f, max_bytes)
+            if _over_limit(framing, max_bytes):
+                resp.close()
+                raise _too_big(max_bytes)
+            if cache and status == 200:
+                resp.raw = _CacheTee(f, body, _CacheWriter(url, entry, framing["etag"], framing["modified"]), resp)
+            resp._host = host
+            resp._body_start = _ticks_us()
+        resp.timings = timings
+        resp.writes = w.writes
+        resp.tls_records = w.tls_records
         resp.status_code = status
         resp.reason = reason
         resp.url = url
@@ -239,6 +1383,333 @@ def request(
         return resp
 
 
+class AsyncResponse:
+    # response of arequest, the body is read with coroutines and every read
+    # is bound by the read timeout of the request
+    # where the body ends is worked out by the same _BodyState as _Body
+    # uses, and the connection goes back to the pool (if key is not None)
+    # once it has been read
+    def __init__(self, reader, writer, timeout, length=None, key=None, chunked=False):
+        self.raw = reader
+        self._writer = writer
+        self.timeout = timeout
+        self.state = _BodyState(length, chunked)
+        self.key = key
+        # a compressed body is inflated as it arrives by _d
+        self.compressed = False
+        self._d = None
+        self.encoding = "utf-8"
+        self._cached = None
+        self.max_bytes = None
+        self._received = 0
+        self.timings = {}
+        self._host = None
+        self._body_start = None
+        self.writes = 0
+        self.tls_records = 0
+        # see Response.unchanged, _cache is the _CacheWriter the body goes
+        # through and _local the file a 304 is answered from
+        self.unchanged = False
+        self._cache = None
+        self._local = None
+
+    async def _want(self, n):
+        state = self.state
+        while True:
+            k = state.want(n)
+            if k is not _LINE:
+                return k
+            state.line(await _wait_for(self.raw.readline(), self.timeout))
+
+    async def _close_stream(self):
+        if self._body_start is not None:
+            _record_timing(self.timings, self._host, "body", self._body_start)
+            self._body_start = None
+        if self._cache is not None and not self._cache.done:
+            self._cache.abort()
+        if self._local is not None:
+            self._local.close()
+            self._local = None
+        if not self.raw:
+            return
+        state = self.state
+        if self.key is not None and state.drainable():
+            try:
+                left = POOL_DRAIN_MAX
+                while left > 0 and not state.done:
+                    data = await self._read(left)
+                    if not data:
+                        break
+                    left -= len(data)
+            except Exception:
+                state.remaining = -1
+            if state.done:
+                _pool_put(_apool, self.key, (self.raw, self._writer), _close_stream)
+                self.raw = None
+                return
+
+        self.raw = None
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+
+    async def aclose(self):
+        await self._close_stream()
+        self._cached = None
+
+    async def read(self, n=-1):
+        if n < 0 and (self.max_bytes is not None or self.compressed):
+            # in pieces, so reading stops as soon as the limit is crossed
+            # and a compressed body is inflated a bit at a time
+            parts = []
+            while True:
+                data = await self.read(CONTENT_CHUNK_SIZE)
+                if not data:
+                    break
+                parts.append(data)
+            return b"".join(parts)
+
+        if self._local is not None:
+            data = self._local.read(n)
+        elif self.compressed:
+            data = await self._read_inflated(n)
+        else:
+            data = await self._read(n)
+
+        if self._cache is not None and not self._cache.done:
+            if data:
+                self._cache.feed(data)
+            if n < 0 or (n > 0 and not data):
+                # same as _CacheTee._end
+                if not await self._read(1) and self.state.complete():
+                    self.unchanged = self._cache.finish()
+                else:
+                    self._cache.abort()
+
+        self._received += len(data)
+        if self.max_bytes is not None and self._received > self.max_bytes:
+            await self.aclose()
+            raise _too_big(self.max_bytes)
+        return data
+
+    async def _read_inflated(self, n):
+        if self._d is None:
+            self._d = _decompressobj()
+        d = self._d
+        while not d.eof:
+            data = _inflate(d, d.unconsumed_tail or await self._read(INFLATE_READ_SIZE), n)
+            if data:
+                return data
+        return b""
+
+    async def _read(self, n):
+        if n < 0:
+            parts = []
+            while True:
+                k = await self._want(-1)
+                if k == 0:
+                    break
+                data = await _wait_for(self.raw.read(k), self.timeout)
+                self.state.got(len(data))
+                if not data:
+                    break
+                parts.append(data)
+            return b"".join(parts)
+
+        k = await self._want(n)
+        if k == 0:
+            return b""
+        data = await _wait_for(self.raw.read(k), self.timeout)
+        self.state.got(len(data))
+        return data
+
+    async def content(self):
+        if self._cached is None:
+            try:
+                self._cached = await self.read()
+            finally:
+                await self._close_stream()
+        return self._cached
+
+    async def text(self):
+        return str(await self.content(), self.encoding)
+
+
+async def _wait_for(coro, timeout):
+    if timeout is None:
+        return await coro
+    import asyncio
+
+    return await asyncio.wait_for(coro, timeout)
+
+
+async def _read_head(reader, resp_d, parse_headers, framing):
+    l = await reader.readline()
+    status, reason = _parse_status_line(l)
+    redirect = None
+    while True:
+        l = await reader.readline()
+        if not l or l == b"\r\n":
+            break
+        location = _parse_header_line(l, status, resp_d, parse_headers, framing)
+        if location:
+            redirect = location
+    return status, reason, redirect
+
+
+async def arequest(
+    method,
+    url,
+    data=None,
+    json=None,
+    headers=None,
+    timeout=None,
+    connect_timeout=None,
+    parse_headers=True,
+    keep_alive=False,
+    compressed=False,
+    max_bytes=None,
+    cache=False,
+):
+    # asyncio version of request() built on asyncio.open_connection
+    # with compressed a compressed body is only asked for if can_ainflate()
+    # connect_timeout bounds the connection and TLS handshake, timeout bounds
+    # sending the request, receiving the response head and each body read
+    import asyncio
+
+    if headers is None:
+        headers = {}
+    else:
+        headers = headers.copy()
+
+    chunked_data = data and getattr(data, "__next__", None) and not getattr(data, "__len__", None)
+
+    print("requesting", url)
+
+    proto, host, port, path = _parse_url(url)
+    if connect_timeout is None:
+        connect_timeout = timeout
+
+    if keep_alive and "Connection" not in headers:
+        headers["Connection"] = "keep-alive"
+    if compressed and "Accept-Encoding" not in headers and can_ainflate():
+        headers["Accept-Encoding"] = "gzip, deflate"
+    data = _prepare_body(headers, host, data, json, chunked_data)
+    version = "1.1" if keep_alive else "1.0"
+
+    cache = cache and method == "GET" and _cache_dir is not None
+    entry = _cache_lookup(url, headers) if cache else None
+
+    key = (proto, host, port)
+    timings = {}
+    conn = None
+    if keep_alive and not chunked_data:
+        conn = _pool_get(_apool, key, _close_stream)
+    reused = conn is not None
+
+    while True:
+        if conn is None:
+            # connect to the cached address, so open_connection does not go
+            # to the resolver itself
+            start = _ticks_us()
+            ip = _resolve(host, port)[-1][0]
+            _record_timing(timings, host, "dns", start)
+            # the TLS handshake is part of open_connection, it is timed with
+            # the connection
+            start = _ticks_us()
+            if proto == "https:":
+                connect = asyncio.open_connection(ip, port, ssl=_tls_context(), server_hostname=host)
+            else:
+                connect = asyncio.open_connection(ip, port)
+            conn = await _wait_for(connect, connect_timeout)
+            _record_timing(timings, host, "connect", start)
+        reader, writer = conn
+
+        resp_d = None
+        if parse_headers is not False:
+            resp_d = {}
+        framing = _new_framing(method, keep_alive)
+
+        try:
+            start = _ticks_us()
+            w = _RequestWriter(writer.write, proto == "https:", method, path, version, headers)
+            if data:
+                if chunked_data:
+                    chunked = headers.get("Transfer-Encoding", None) == "chunked"
+                    for chunk in data:
+                        writes = w.writes
+                        w.add_chunk(chunk, chunked)
+                        if w.writes != writes:
+                            await _wait_for(writer.drain(), timeout)
+                    if chunked:
+                        w.add(b"0\r\n\r\n")
+                else:
+                    w.add(data)
+            w.flush()
+            await _wait_for(writer.drain(), timeout)
+
+            status, reason, redirect = await _wait_for(_read_head(reader, resp_d, parse_headers, framing), timeout)
+            _record_timing(timings, host, "ttfb", start)
+        except (OSError, ValueError):
+            writer.close()
+            if not reused:
+                raise
+            # the server closed the pooled connection, try a new one
+            conn = None
+            reused = False
+            continue
+        except BaseException:
+            # also on a timeout or when the task is cancelled
+            writer.close()
+            raise
+        break
+
+    cache = cache and not redirect
+
+    # redirects are not followed, same as request()
+    if redirect:
+        url = _resolve_redirect(redirect, url)
+        if status in [301, 302, 303]:
+            status = 200
+
+    length, chunked, key = _body_mode(framing, status, key)
+    resp = AsyncResponse(reader, writer, timeout, length, key, chunked)
+    resp.max_bytes = max_bytes
+    resp.timings = timings
+    resp.writes = w.writes
+    resp.tls_records = w.tls_records
+    if framing["encoding"] in INFLATE_ENCODINGS and length != 0:
+        if not can_ainflate():
+            # only when asked for anyway through headers, it would have to be
+            # read whole before inflating
+            await resp.aclose()
+            raise ValueError("cannot inflate a %s body as it arrives" % framing["encoding"])
+        resp.compressed = True
+    if _over_limit(framing, max_bytes):
+        await resp.aclose()
+        raise _too_big(max_bytes)
+    if cache and status == 304 and entry is not None and entry[3]:
+        # answered from flash, the empty body puts the connection back in
+        # the pool
+        await resp.aclose()
+        resp._local = _cached_body(url)
+        resp.unchanged = True
+        status = 200
+    else:
+        if cache and status == 200:
+            resp._cache = _CacheWriter(url, entry, framing["etag"], framing["modified"])
+        resp._host = host
+        resp._body_start = _ticks_us()
+    resp.status_code = status
+    resp.reason = reason
+    resp.url = url
+    if resp_d is not None:
+        resp.headers = resp_d
+    return resp
+
+
 def head(url, **kw):
     return request("HEAD", url, **kw)
 
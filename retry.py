@@ -0,0 +1,163 @@
+import time
+import random
+import asyncio
+
+# defaults of the policy used for the portal, in seconds
+ATTEMPTS = 3
+BASE_DELAY = 2
+MAX_DELAY = 30
+# time a whole refresh cycle may spend on the portal, retries included
+CYCLE_BUDGET = 120
+# consecutive failed calls that open the circuit, and how long it stays open
+FAILURE_THRESHOLD = 3
+COOL_DOWN = 30 * 60
+
+# NTP moves the wall clock, so the budget and the cool down are measured in
+# ticks
+if hasattr(time, "ticks_ms"):
+    _ticks_ms = time.ticks_ms
+    _ticks_add = time.ticks_add
+    _ticks_diff = time.ticks_diff
+else:
+    def _ticks_ms():
+        return time.perf_counter_ns() // 1000000
+
+    def _ticks_add(a, b):
+        return a + b
+
+    def _ticks_diff(a, b):
+        return a - b
+
+
+class TransientError(Exception):
+    # a failure that may go away on its own, e.g. the portal answering 5xx
+    pass
+
+
+def transient(e):
+    # only these are retried and count toward opening the circuit, the others
+    # (a wrong password, a page that does not parse) would fail the same way
+    # again and are raised right away
+    return isinstance(e, (OSError, asyncio.TimeoutError, TransientError))
+
+
+class RetryPolicy:
+    # retries a call with exponential backoff and jitter, within the time
+    # budget of the current cycle. after FAILURE_THRESHOLD failed calls in a
+    # row the circuit opens and every call fails right away until the cool
+    # down is over, so an outage costs a bounded amount of radio on-time
+    def __init__(
+        self,
+        attempts=ATTEMPTS,
+        base_delay=BASE_DELAY,
+        max_delay=MAX_DELAY,
+        budget=CYCLE_BUDGET,
+        failure_threshold=FAILURE_THRESHOLD,
+        cool_down=COOL_DOWN,
+    ):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+
+        self.failures = 0
+        # _ticks_ms when the circuit closes again, and when the cycle budget
+        # is used up
+        self.open_until = None
+        self.deadline = None
+
+        self.stats = {
+            "calls": 0,
+            "retries": 0,
+            "failures": 0,
+            "circuit_opened": 0,
+            "rejected": 0,
+        }
+
+    def start_cycle(self):
+        # start the time budget of a refresh cycle
+        self.deadline = _ticks_add(_ticks_ms(), self.budget * 1000)
+
+    def end_cycle(self):
+        self.deadline = None
+
+    def allow(self):
+        # False while the circuit is open
+        if self.open_until is not None and _ticks_diff(_ticks_ms(), self.open_until) >= 0:
+            # forget it, an old ticks value would look recent again once the
+            # ticks wrap around
+            self.open_until = None
+        return self.open_until is None
+
+    def remaining(self):
+        if self.deadline is None:
+            return self.budget
+        return _ticks_diff(self.deadline, _ticks_ms()) / 1000
+
+    def delay(self, attempt):
+        # exponential backoff, the upper half of it is random so devices
+        # that failed together do not retry together
+        d = min(self.max_delay, self.base_delay * (1 << attempt))
+        return d / 2 + d / 2 * random.getrandbits(8) / 256
+
+    def _before(self):
+        if not self.allow():
+            self.stats["rejected"] += 1
+            left = _ticks_diff(self.open_until, _ticks_ms()) // 1000
+            raise Exception("portal circuit open for another {}s".format(left))
+        if self.remaining() <= 0:
+            self.stats["rejected"] += 1
+            raise Exception("refresh time budget used up")
+        self.stats["calls"] += 1
+
+    def _succeeded(self):
+        self.failures = 0
+
+    def _failed(self, attempt, e):
+        # return how long to wait before the next attempt, or raise e if there
+        # is no next attempt
+        if not transient(e):
+            raise e
+        if attempt + 1 < self.attempts:
+            d = self.delay(attempt)
+            if d < self.remaining():
+                self.stats["retries"] += 1
+                print("portal call failed: {}, retrying in {}s".format(e, d))
+                return d
+
+        self.stats["failures"] += 1
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.failures = 0
+            self.open_until = _ticks_add(_ticks_ms(), self.cool_down * 1000)
+            self.stats["circuit_opened"] += 1
+            print("portal circuit opened for {}s".format(self.cool_down))
+        raise e
+
+    def call(self, fn, *args):
+        self._before()
+        attempt = 0
+        while True:
+            try:
+                result = fn(*args)
+            except Exception as e:
+                time.sleep(self._failed(attempt, e))
+                attempt += 1
+                continue
+            self._succeeded()
+            return result
+
+    async def acall(self, fn, *args):
+        self._before()
+        attempt = 0
+        while True:
+            try:
+                result = await fn(*args)
+            except Exception as e:
+                await asyncio.sleep(self._failed(attempt, e))
+                attempt += 1
+                continue
+            self._succeeded()
+            return result
@@ -1,5 +1,5 @@
 #!/bin/sh
 
-mpremote cp -r config.json main.py dut_clock.py requests.py helper.py scraper.py ST7735.py sysfont.py iconfont.py vietnamese.py aioble :
+mpremote cp -r config.json main.py dut_clock.py requests.py helper.py htmlentities.py cache.py retry.py scraper.py ST7735.py sysfont.py iconfont.py vietnamese.py aioble :
 mpremote reset
 mpremote repl
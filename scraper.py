@@ -1,13 +1,98 @@
 import requests
+import asyncio
 import re
+import binascii
+import cache
+import retry
+from collections import namedtuple
 from helper import *
 
-LOGIN_URL = "https://sv.dut.udn.vn/PageDangNhap.aspx"
-HOME_URL = "https://sv.dut.udn.vn/PageCaNhan.aspx"
-SCHEDULE_URL = "https://sv.dut.udn.vn/PageLichTH.aspx"
-
-TODAY_SCHEDULE_GET = "https://sv.dut.udn.vn/WebAjax/evLopHP_Load.aspx?E=LHTNLOAD&NF={date}"
-NOTICE_GET = "https://sv.dut.udn.vn/WebAjax/evLopHP_Load.aspx?E={e}&PAGETB=1&COL=TieuDe&NAME={query}&TAB={tab}"
+# the portal, another base url can be given to Scraper (bench/fake_portal.py)
+BASE_URL = "https://sv.dut.udn.vn"
+
+LOGIN_PATH = "/PageDangNhap.aspx"
+HOME_PATH = "/PageCaNhan.aspx"
+SCHEDULE_PATH = "/PageLichTH.aspx"
+
+TODAY_SCHEDULE_GET = "/WebAjax/evLopHP_Load.aspx?E=LHTNLOAD&NF={date}"
+NOTICE_GET = "/WebAjax/evLopHP_Load.aspx?E={e}&PAGETB=1&COL=TieuDe&NAME={query}&TAB={tab}"
+
+# columns of the schedule tables that are actually read
+SCHEDULE_COLUMNS = (1, 2, 6, 7, 8)
+DAILY_SCHEDULE_COLUMNS = (1, 2, 3, 4, 7)
+
+# only the login page has the account field
+LOGIN_FORM_MARKER = b"DN_txtAcc"
+
+# timeouts of the portal requests in seconds, the coroutine versions bound
+# connecting (DNS, TCP and TLS) separately from each read
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 20
+
+# a saved session older than this is not even probed, in seconds
+SESSION_MAX_AGE = 24 * 3600
+
+# a portal page bigger than this is refused instead of filling the heap, the
+# biggest (the notice lists) are around 60 KiB
+MAX_PAGE_SIZE = 256 * 1024
+
+# size of the reads used when scanning a page for a table
+TABLE_CHUNK_SIZE = 1024
+# size of the chunks the login form body is sent in
+FORM_CHUNK_SIZE = 512
+
+
+# weekday names as the portal writes them, indexed like time.localtime()[6]
+WEEKDAY = (
+    "Thứ 2",
+    "Thứ 3",
+    "Thứ 4",
+    "Thứ 5",
+    "Thứ 6",
+    "Thứ 7",
+    "Chủ Nhật",
+)
+
+# fixed layout records for the scraped data, a tuple per entry instead of a
+# dict repeating the same keys
+# weekday is a WEEKDAY index, periods are ints, week_mask has bit n set if the
+# class runs on week n and dates are yyyymmdd ints
+Subject = namedtuple("Subject", (
+    "class_code",
+    "class_name",
+    "lecturer",
+    "weekday",
+    "start_period",
+    "end_period",
+    "room",
+    "week_mask",
+))
+DailyClass = namedtuple("DailyClass", (
+    "class_code",
+    "class_name",
+    "lecturer",
+    "start_period",
+    "end_period",
+    "room",
+    "note",
+))
+CancelledClass = namedtuple("CancelledClass", (
+    "date_of_notice",
+    "lecturer",
+    "class_name",
+    "start_period",
+    "end_period",
+    "cancelled_date",
+))
+MakeUpClass = namedtuple("MakeUpClass", (
+    "date_of_notice",
+    "lecturer",
+    "class_name",
+    "make_up_date",
+    "start_period",
+    "end_period",
+    "room",
+))
 
 
 class Tab:
@@ -18,26 +103,210 @@ class Tab:
     HOC_PHI = 4
 
 
+def iter_notice_blocks(html):
+    # yield the raw (caption, content) html of each notice of a notice list
+    pos = 0
+    while True:
+        start_caption = html.find(b"<div class='tbBoxCaption'>", pos)
+        if start_caption == -1:
+            break
+        start_caption += len("<div class='tbBoxCaption'>")
+        end_caption = html.find(b"</div>", start_caption)
+
+        start_content = html.find(b"<div class='tbBoxContent'>", end_caption)
+        if start_content == -1:
+            break
+        start_content += len("<div class='tbBoxContent'>")
+        end_content = html.find(b"</div>", start_content)
+
+        yield html[start_caption:end_caption], html[start_content:end_content]
+
+        pos = end_content
+
+
+def parse_notice(caption, content):
+    # turn the raw html of a notice into its date, caption and content text
+    caption = html_unescape(strip_tags(caption))
+    content = html_unescape(strip_tags(content))
+    return caption[0:10], caption[16:], content
+
+
+def notice_key(caption, content):
+    # hash() is port dependent on MicroPython and not meant to tell contents
+    # apart, the crc32 of the whole html is. a separator goes between the two
+    # so moving text from one to the other changes the key
+    return binascii.crc32(content, binascii.crc32(b"\0", binascii.crc32(caption)))
+
+
+class NoticeFeed:
+    # keeps the notices of one notice list between refreshes
+    # the portal lists the newest notice first, so ingesting a fresh list
+    # stops at the first notice that has been seen before and only the ones
+    # above it are parsed
+    def __init__(self, max_notices=64):
+        self.max_notices = max_notices
+        # crc32 of the raw html of the notices below, in the same order
+        self.keys = []
+        self.seen = set()
+
+        self.dates = []
+        self.captions = []
+        self.contents = []
+
+    def ingest(self, html):
+        # return the (dates, captions, contents) of the new notices, or None
+        # if there are none
+        keys = []
+        dates = []
+        captions = []
+        contents = []
+
+        for caption, content in iter_notice_blocks(html):
+            key = notice_key(caption, content)
+            if key in self.seen:
+                break
+            date, caption, content = parse_notice(caption, content)
+            keys.append(key)
+            dates.append(date)
+            captions.append(caption)
+            contents.append(content)
+
+        if not keys:
+            return None
+
+        n = self.max_notices
+        self.keys = (keys + self.keys)[:n]
+        self.seen = set(self.keys)
+        self.dates = (dates + self.dates)[:n]
+        self.captions = (captions + self.captions)[:n]
+        self.contents = (contents + self.contents)[:n]
+
+        return (
+            dates,
+            captions,
+            contents
+        )
+
+
+def _status_error(message, status_code):
+    # a 5xx answer is worth retrying, the other ones would come back the same
+    if status_code >= 500:
+        return retry.TransientError(message)
+    return Exception(message)
+
+
 class Scraper:
-    def __init__(self, user, password):
+    def __init__(self, user, password, session_file=None, policy=None, base_url=BASE_URL):
         self.user = user
         self.password = password
+        self.session_file = session_file
 
-        # get login html to get session id and some hidden ASP fields
-        resp = requests.get(LOGIN_URL)
-        login_html = resp.text
+        self.base_url = base_url
+        self.login_url = base_url + LOGIN_PATH
+        self.home_url = base_url + HOME_PATH
+        self.schedule_url = base_url + SCHEDULE_PATH
+        # every public portal call goes through the retry policy, it can be
+        # shared so the circuit outlives the scraper
+        self.policy = policy if policy is not None else retry.RetryPolicy()
 
         self.headers = {
             "User-Agent": "Mozilla/5.0",
             "Content-Type": "application/x-www-form-urlencoded",
-            "Cookie": resp.headers["Set-Cookie"]
+        }
+        self.__VIEWSTATE = None
+        self.__VIEWSTATEGENERATOR = None
+        self.session_time = 0
+        # bumped on every login, so concurrent coroutines that all ran into
+        # the same expired session log in again only once
+        self.login_count = 0
+        self.login_lock = asyncio.Lock()
+
+        # counters that can be dumped to see how the scraper is doing
+        self.stats = {
+            "relogins": 0,
         }
 
+        # reuse the session of the last boot if there is one, login() checks
+        # that it is still alive before trusting it
+        if session_file is not None:
+            session = cache.load_session(session_file)
+            if session is not None:
+                self.headers["Cookie"] = session["cookie"]
+                self.__VIEWSTATE = session["viewstate"]
+                self.__VIEWSTATEGENERATOR = session["viewstate_generator"]
+                self.session_time = session["time"]
+
+    # each portal call is split into the steps around the request, so the
+    # blocking methods (on requests.request) and their coroutine versions
+    # prefixed with "a" (on requests.arequest) share everything but the I/O
+    # every request asks for a keep-alive connection, so the requests of one
+    # refresh reuse the pooled TLS connections instead of a handshake each,
+    # and for a compressed body, the pages are mostly repetitive markup
+
+    def _set_login_form(self, resp, login_html):
+        self._check_status(resp)
+        if "Set-Cookie" not in resp.headers:
+            raise Exception("the login page did not set a session cookie")
+        self.headers["Cookie"] = resp.headers["Set-Cookie"]
+
         self.__VIEWSTATE = get_hidden_field(login_html, "__VIEWSTATE")
 
         self.__VIEWSTATEGENERATOR = get_hidden_field(login_html, "__VIEWSTATEGENERATOR")
 
-    def login(self):
+    def fetch_login_form(self):
+        # get login html to get session id and some hidden ASP fields
+        resp = requests.get(self.login_url, keep_alive=True, compressed=True)
+        try:
+            self._set_login_form(resp, resp.content)
+        finally:
+            resp.close()
+
+    async def afetch_login_form(self):
+        resp = await requests.arequest("GET", self.login_url, timeout=READ_TIMEOUT, connect_timeout=CONNECT_TIMEOUT, keep_alive=True, compressed=True)
+        self._set_login_form(resp, await resp.content())
+
+    def _should_probe_session(self):
+        if "Cookie" not in self.headers:
+            return False
+        return get_time() - self.session_time <= SESSION_MAX_AGE
+
+    def session_valid(self):
+        # probe the personal page with the current cookie, it redirects to the
+        # login page once the session is gone. the body is never read
+        if not self._should_probe_session():
+            return False
+
+        resp = requests.get(
+            self.home_url,
+            timeout=READ_TIMEOUT,
+            headers=self.headers,
+            keep_alive=True,
+            compressed=True,
+        )
+        resp.close()
+        return resp.status_code == 200 and resp.url == self.home_url
+
+    async def asession_valid(self):
+        if not self._should_probe_session():
+            return False
+
+        resp = await requests.arequest("GET", self.home_url, headers=self.headers, timeout=READ_TIMEOUT, connect_timeout=CONNECT_TIMEOUT, keep_alive=True, compressed=True)
+        await resp.aclose()
+        return resp.status_code == 200 and resp.url == self.home_url
+
+    def save_session(self):
+        self.session_time = get_time()
+        if self.session_file is None:
+            return
+        cache.save_session(self.session_file, {
+            "cookie": self.headers["Cookie"],
+            "viewstate": self.__VIEWSTATE,
+            "viewstate_generator": self.__VIEWSTATEGENERATOR,
+            "time": self.session_time,
+        })
+
+    def _login_request(self):
+        # return the headers and the streamed body of the login POST
         request_data = {
             "_ctl0:MainContent:DN_txtPass": self.password,
             "_ctl0:MainContent:DN_txtAcc": self.user,
@@ -45,234 +314,420 @@ class Scraper:
             "__VIEWSTATEGENERATOR": self.__VIEWSTATEGENERATOR,
             "__VIEWSTATE": self.__VIEWSTATE,
         }
-        encoded_data = '&'.join(f"{quote_plus(k)}={quote_plus(v)}" for k, v in request_data.items())
-        resp = requests.post(
-            LOGIN_URL,
-            data=encoded_data,
-            headers=self.headers,
-        )
+        fields = request_data.items()
 
+        # the body is streamed in chunks, Content-Length is worked out ahead
+        # so the request does not need chunked encoding
+        headers = self.headers.copy()
+        headers["Content-Length"] = str(urlencoded_len(fields))
+        return headers, iter_urlencoded(fields, FORM_CHUNK_SIZE)
+
+    def _check_login(self, resp):
         if resp.status_code != 200:
-            raise Exception("got status code " + str(resp.status_code))
+            raise _status_error("got status code " + str(resp.status_code), resp.status_code)
 
-        if resp.url == LOGIN_URL:
+        if resp.url == self.login_url:
             raise Exception("wrong username/password, got redirected to " + resp.url)
 
-        if resp.url != HOME_URL:
+        if resp.url != self.home_url:
             raise Exception("unknown error, got redirected to " + resp.url)
 
-    def get_schedule(self):
-        resp = requests.get(
-            SCHEDULE_URL,
-            timeout=20,
-            headers=self.headers
-        )
-        schedule_html = resp.text
+        self.login_count += 1
+        self.save_session()
+
+    def login(self, force=False):
+        return self.policy.call(self._login, force)
 
-        if resp.status_code != 200 or resp.url != SCHEDULE_URL:
-            raise Exception("failed to reach to schedule page, got status code " + str(resp.status_code) + "and redirected to page " + resp.url)
+    def _login(self, force=False):
+        # force skips the session probe, for when the session is known to be
+        # dead already
+        if not force and self.session_valid():
+            print("reusing saved session")
+            return
 
-        table = extract_table_html(schedule_html, "TTKB_GridInfo")
+        self.fetch_login_form()
+
+        headers, body = self._login_request()
+        resp = requests.post(
+            self.login_url,
+            data=body,
+            headers=headers,
+            keep_alive=True,
+            compressed=True,
+        )
+        resp.close()
+        self._check_login(resp)
+
+    async def alogin(self, force=False):
+        return await self.policy.acall(self._alogin, force)
+
+    async def _alogin(self, force=False):
+        if not force and await self.asession_valid():
+            print("reusing saved session")
+            return
+
+        await self.afetch_login_form()
+
+        headers, body = self._login_request()
+        resp = await requests.arequest("POST", self.login_url, data=body, headers=headers, timeout=READ_TIMEOUT, connect_timeout=CONNECT_TIMEOUT, keep_alive=True, compressed=True)
+        await resp.aclose()
+        self._check_login(resp)
+
+    def session_expired(self, resp, body=None):
+        # an expired session is redirected to the login page, some of the
+        # ajax endpoints answer with the login form instead
+        if resp.url.startswith(self.login_url):
+            return True
+        return body is not None and LOGIN_FORM_MARKER in body
+
+    def _on_session_expired(self, attempt):
+        if attempt:
+            raise Exception("still got the login page after logging in again")
+        print("session expired, logging in again")
+
+    def fetch(self, url, read=True, cache=False):
+        # GET url with the session cookie, if the session turns out to have
+        # expired log in again once and replay the request
+        # with read the body is read (and cached in resp.content) so it can be
+        # checked for the login form too
+        # with cache the request goes through the response cache of requests,
+        # resp.unchanged tells if the page is the same as last time
+        for attempt in range(2):
+            resp = requests.get(
+                url,
+                timeout=READ_TIMEOUT,
+                headers=self.headers,
+                keep_alive=True,
+                compressed=True,
+                max_bytes=MAX_PAGE_SIZE,
+                cache=cache,
+            )
+            body = None
+            if read and resp.status_code == 200:
+                body = resp.content
+
+            if not self.session_expired(resp, body):
+                return resp
+
+            resp.close()
+            self._on_session_expired(attempt)
+            self.stats["relogins"] += 1
+            self._login(force=True)
+
+    async def arelogin(self, login_count):
+        # log in again unless another coroutine already did since login_count
+        # was read
+        async with self.login_lock:
+            if self.login_count == login_count:
+                self.stats["relogins"] += 1
+                await self._alogin(force=True)
+
+    async def afetch(self, url, read=True, cache=False):
+        for attempt in range(2):
+            login_count = self.login_count
+            resp = await requests.arequest("GET", url, headers=self.headers, timeout=READ_TIMEOUT, connect_timeout=CONNECT_TIMEOUT, keep_alive=True, compressed=True, max_bytes=MAX_PAGE_SIZE, cache=cache)
+            body = None
+            if read and resp.status_code == 200:
+                body = await resp.content()
+
+            if not self.session_expired(resp, body):
+                return resp
+
+            await resp.aclose()
+            self._on_session_expired(attempt)
+            await self.arelogin(login_count)
+
+    def _check_schedule_response(self, resp):
+        if resp.status_code != 200 or resp.url != self.schedule_url:
+            raise _status_error("failed to reach to schedule page, got status code " + str(resp.status_code) + "and redirected to page " + resp.url, resp.status_code)
+
+    def get_schedule(self):
+        return self.policy.call(self._get_schedule)
+
+    def _get_schedule(self):
+        resp = self.fetch(self.schedule_url, read=False)
+
+        # read the page straight from the socket, everything before the table
+        # is dropped and the connection is closed right after </table>
+        try:
+            self._check_schedule_response(resp)
+            scanner = TableScanner("TTKB_GridInfo")
+            for chunk in resp.iter_content(TABLE_CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+            table = scanner.table
+        finally:
+            resp.close()
         if not table:
             raise Exception("no table found on the schedule page")
 
-        table_rows = parse_table_rows(table)
-        # remove headers row
-        table_rows.pop(0)
-        table_rows.pop(0)
-        # remove total row
-        table_rows.pop(-1)
+        return Scraper.parse_schedule(table)
 
-        schedule = []
+    async def aget_schedule(self):
+        return await self.policy.acall(self._aget_schedule)
 
-        for row in table_rows:
-            dates = []
-            for d in row[7].split("; "):
-                date = d.split(",")
-                period = date[1].split("-")
-                start_period = int(period[0])
-                end_period = int(period[1])
-                dates.append({
-                    "weekday": date[0],
-                    "start_period": start_period,
-                    "end_period": end_period,
-                    "room": date[2],
-                })
-
-            weeks = []
-            for dur in row[8].split(";"):
-                lst = dur.split("-")
-                weeks.append([int(lst[0]), int(lst[1])])
-
-            for date in dates:
-                dat = {
-                    "class_code": row[1],
-                    "class_name": row[2],
-                    "lecturer": row[6],
-                    "weekday": date["weekday"],
-                    "start_period": date["start_period"],
-                    "end_period": date["end_period"],
-                    "room": date["room"],
-                    "weeks": weeks,
-                }
-                schedule.append(dat)
+    async def _aget_schedule(self):
+        resp = await self.afetch(self.schedule_url, read=False)
 
-        return schedule
+        try:
+            self._check_schedule_response(resp)
+            scanner = TableScanner("TTKB_GridInfo")
+            while True:
+                chunk = await resp.read(TABLE_CHUNK_SIZE)
+                if not chunk or scanner.feed(chunk):
+                    break
+            table = scanner.table
+        finally:
+            await resp.aclose()
+        if not table:
+            raise Exception("no table found on the schedule page")
 
-    def get_schedule_of_date(self, date):
-        resp = requests.get(
-            TODAY_SCHEDULE_GET.format(date=date),
-            timeout=20,
-            headers=self.headers,
-        )
+        return Scraper.parse_schedule(table)
 
+    def _check_status(self, resp):
         if resp.status_code != 200:
-            raise Exception("cannot reach sv.dut.udn.vn. got status code " + str(resp.status_code))
+            raise _status_error("cannot reach sv.dut.udn.vn. got status code " + str(resp.status_code), resp.status_code)
 
-        table = extract_table_html(resp.text, "LHTN_Grid")
+    def _parse_schedule_of_date_page(self, html):
+        table = extract_table_html(html, "LHTN_Grid")
         if not table:
             raise Exception("no table found on the schedule page")
 
-        table_rows = parse_table_rows(table)
-        table_rows.pop(0)
+        return Scraper.parse_schedule_of_date(table)
 
-        dat = []
-        for row in table_rows:
-            d = row[4].split(',')
-            room = d[2]
-            period = d[1].split('-')
-            dat.append({
-                "class_code": row[1],
-                "class_name": row[2],
-                "lecturer": row[3],
-                "period": period,
-                "room": room,
-                "note": row[7],
-            })
+    def get_schedule_of_date(self, date, known=False):
+        return self.policy.call(self._get_schedule_of_date, date, known)
 
-        return dat
+    def _get_schedule_of_date(self, date, known=False):
+        # known tells that the caller still has the classes of the last
+        # fetch of date, None is returned if the page has not changed since
+        resp = self.fetch(self.base_url + TODAY_SCHEDULE_GET.format(date=date), cache=True)
+        html = resp.content
+        resp.close()
+        self._check_status(resp)
+        if known and resp.unchanged:
+            return None
+
+        return self._parse_schedule_of_date_page(html)
+
+    async def aget_schedule_of_date(self, date, known=False):
+        return await self.policy.acall(self._aget_schedule_of_date, date, known)
+
+    async def _aget_schedule_of_date(self, date, known=False):
+        resp = await self.afetch(self.base_url + TODAY_SCHEDULE_GET.format(date=date), cache=True)
+        html = await resp.content()
+        self._check_status(resp)
+        if known and resp.unchanged:
+            return None
 
-    def get_notices(self, query, tab):
+        return self._parse_schedule_of_date_page(html)
+
+    def notices_url(self, query, tab):
         # idk why, but this web is literaly shit
         e = "CTRTBSV"
         if tab == Tab.LOP_HOC_PHAN:
             e = "CTRTBGV"
 
-        resp = requests.get(
-            NOTICE_GET.format(e=e, query=query, tab=tab),
-            timeout=20,
-            headers=self.headers,
-        )
+        return self.base_url + NOTICE_GET.format(e=e, query=query, tab=tab)
 
-        if resp.status_code != 200:
-            raise Exception("cannot reach sv.dut.udn.vn. got status code " + str(resp.status_code))
+    def _parse_notices_page(self, resp, html, feed):
+        if feed is not None:
+            # the feed has seen every notice of an unchanged page already
+            if resp.unchanged and feed.keys:
+                return None
+            return feed.ingest(html)
+        return Scraper.parse_notices(html)
+
+    def get_notices(self, query, tab, feed=None):
+        return self.policy.call(self._get_notices, query, tab, feed)
+
+    def _get_notices(self, query, tab, feed=None):
+        # with a NoticeFeed only the notices it has not seen yet are parsed,
+        # and None is returned if there are none
+        resp = self.fetch(self.notices_url(query, tab), cache=True)
+        html = resp.content
+        resp.close()
+        self._check_status(resp)
 
-        html = resp.text
+        return self._parse_notices_page(resp, html, feed)
+
+    async def aget_notices(self, query, tab, feed=None):
+        return await self.policy.acall(self._aget_notices, query, tab, feed)
+
+    async def _aget_notices(self, query, tab, feed=None):
+        resp = await self.afetch(self.notices_url(query, tab), cache=True)
+        html = await resp.content()
+        self._check_status(resp)
+
+        return self._parse_notices_page(resp, html, feed)
+
+    def parse_schedule(table):
+        table_rows = iter_table_rows(table, SCHEDULE_COLUMNS)
+        # skip headers row
+        next(table_rows, None)
+        next(table_rows, None)
+
+        schedule = []
+        # the same room, lecturer and class name strings are shared by every
+        # entry that uses them
+        pool = {}
+
+        # the last row is the total row, so each row is only handled once
+        # the next one has been read
+        row = next(table_rows, None)
+        for next_row in table_rows:
+            class_code = pool.setdefault(row[1], row[1])
+            class_name = pool.setdefault(row[2], row[2])
+            lecturer = pool.setdefault(row[6], row[6])
+
+            week_mask = 0
+            for dur in row[8].split(";"):
+                lst = dur.split("-")
+                week_mask |= (1 << (int(lst[1]) + 1)) - (1 << int(lst[0]))
+
+            for d in row[7].split("; "):
+                date = d.split(",")
+                if date[0] not in WEEKDAY:
+                    # one odd slot must not cost the whole schedule
+                    print("skipping schedule entry with unknown weekday:", class_name, d)
+                    continue
+                period = date[1].split("-")
+                schedule.append(Subject(
+                    class_code,
+                    class_name,
+                    lecturer,
+                    WEEKDAY.index(date[0]),
+                    int(period[0]),
+                    int(period[1]),
+                    pool.setdefault(date[2], date[2]),
+                    week_mask,
+                ))
+
+            row = next_row
+
+        return schedule
 
+    def parse_schedule_of_date(table):
+        table_rows = iter_table_rows(table, DAILY_SCHEDULE_COLUMNS)
+        # skip headers row
+        next(table_rows, None)
+
+        dat = []
+        for row in table_rows:
+            d = row[4].split(',')
+            room = d[2]
+            period = d[1].split('-')
+            dat.append(DailyClass(
+                row[1],
+                row[2],
+                row[3],
+                int(period[0]),
+                int(period[1]),
+                room,
+                row[7],
+            ))
+
+        return dat
+
+    def parse_notices(html):
         dates = []
         captions = []
         contents = []
 
-        pos = 0
-        while True:
-            start_caption = html.find("<div class='tbBoxCaption'>", pos)
-            if start_caption == -1:
-                break
-            start_caption += len("<div class='tbBoxCaption'>")
-            end_caption = html.find("</div>", start_caption)
-            caption = html_unescape(strip_tags(html[start_caption:end_caption].strip()))
-            dates.append(caption[0:10])
-            captions.append(caption[16:])
-
-            start_content = html.find("<div class='tbBoxContent'>", end_caption)
-            if start_content == -1:
-                break
-            start_content += len("<div class='tbBoxContent'>")
-            end_content = html.find("</div>", start_content)
-            content = html_unescape(strip_tags(html[start_content:end_content].strip()))
+        for caption, content in iter_notice_blocks(html):
+            date, caption, content = parse_notice(caption, content)
+            dates.append(date)
+            captions.append(caption)
             contents.append(content)
 
-            pos = end_content
-
         return (
             dates,
             captions,
             contents
         )
 
+    def parse_class_notice(cap, cont, date, pool):
+        # return the (CancelledClass or None, MakeUpClass or None) of one
+        # class notice, raise ValueError or IndexError if it does not parse
+        cancelled = None
+        make_up = None
+
+        title_start = -1
+        if "Thầy " in cap:
+            title_start = cap.find("Thầy ") + len("Thầy ")
+        elif "Cô " in cap:
+            title_start = cap.find("Cô ") + len("Cô ")
+
+        class_start = cap.find("lớp: ") + len("lớp: ")
+        class_end = cap.find("[") - 1
+        class_name = cap[class_start:class_end]
+        class_name = pool.setdefault(class_name, class_name)
+
+        lecturer_end = cap.find(" thông", title_start)
+        lecturer = cap[title_start:lecturer_end].strip()
+        lecturer = pool.setdefault(lecturer, lecturer)
+
+        date_of_notice = date_to_int(date)
+
+        if "NGHỈ HỌC" in cont:
+            details_part = cont.split("Tiết:")[1]
+
+            periods_str, date_str = details_part.split(") ngày:")
+
+            start_period, end_period = periods_str.split('-')
+
+            cancelled = CancelledClass(
+                date_of_notice,
+                lecturer,
+                class_name,
+                int(start_period),
+                int(end_period),
+                date_to_int(date_str.strip()),
+            )
+
+        if "HỌC BÙ" in cont:
+            details_part = cont.split("ngày: ")[1]
+
+            date_str, periods_str, room_str = details_part.split(',', 2)
+
+            periods = periods_str.split(':')[1].strip()
+            start_period, end_period = periods.split('-')
+
+            room = room_str.split(':')[1].strip()
+
+            make_up = MakeUpClass(
+                date_of_notice,
+                lecturer,
+                class_name,
+                date_to_int(date_str.strip()),
+                int(start_period),
+                int(end_period),
+                pool.setdefault(room, room),
+            )
+
+        return cancelled, make_up
+
     def parse_class_notices(captions, contents, dates):
         cancelled_classes = []
         make_up_classes = []
+        # lecturer and class names repeat a lot between notices
+        pool = {}
 
         for cap, cont, date in zip(captions, contents, dates):
-            if "NGHỈ HỌC" in cont:
-                lecturer = ""
-                title_start = -1
-                if "Thầy " in cap:
-                    title_start = cap.find("Thầy ") + len("Thầy ")
-                elif "Cô " in cap:
-                    title_start = cap.find("Cô ") + len("Cô ")
-
-                class_name = ""
-                class_start = cap.find("lớp: ") + len("lớp: ")
-                class_end = cap.find("[") - 1
-                class_name = cap[class_start:class_end]
-
-                lecturer_end = cap.find(" thông", title_start)
-                lecturer = cap[title_start:lecturer_end].strip()
-
-                details_part = cont.split("Tiết:")[1]
-
-                periods_str, date_str = details_part.split(") ngày:")
-
-                start_period, end_period = periods_str.split('-')
-                cancelled_date = date_str.strip()
-
-                cancelled_classes.append({
-                    "date_of_notice": date,
-                    "lecturer": lecturer,
-                    "class_name": class_name,
-                    "start_period": start_period.strip(),
-                    "end_period": end_period.strip(),
-                    "cancelled_date": reverse_date(cancelled_date),
-                })
-
-            if "HỌC BÙ" in cont:
-                lecturer = ""
-                title_start = -1
-                if "Thầy " in cap:
-                    title_start = cap.find("Thầy ") + len("Thầy ")
-                elif "Cô " in cap:
-                    title_start = cap.find("Cô ") + len("Cô ")
-
-                class_name = ""
-                class_start = cap.find("lớp: ") + len("lớp: ")
-                class_end = cap.find("[") - 1
-                class_name = cap[class_start:class_end]
-
-                lecturer_end = cap.find(" thông", title_start)
-                lecturer = cap[title_start:lecturer_end].strip()
-
-                details_part = cont.split("ngày: ")[1]
-
-                date_str, periods_str, room_str = details_part.split(',', 2)
-
-                make_up_date = date_str.strip()
-
-                periods = periods_str.split(':')[1].strip()
-                start_period, end_period = periods.split('-')
-
-                room = room_str.split(':')[1].strip()
-
-                make_up_classes.append({
-                    "date_of_notice": date,
-                    "lecturer": lecturer,
-                    "class_name": class_name,
-                    "make_up_date": reverse_date(make_up_date),
-                    "start_period": start_period.strip(),
-                    "end_period": end_period.strip(),
-                    "room": room,
-                })
+            if "NGHỈ HỌC" not in cont and "HỌC BÙ" not in cont:
+                continue
+
+            # a notice that does not follow the usual wording is skipped, it
+            # must not cost the others
+            try:
+                cancelled, make_up = Scraper.parse_class_notice(cap, cont, date, pool)
+            except (ValueError, IndexError) as e:
+                print("skipping malformed class notice:", cap, e)
+                continue
+            if cancelled is not None:
+                cancelled_classes.append(cancelled)
+            if make_up is not None:
+                make_up_classes.append(make_up)
 
         return (
             cancelled_classes,